@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 #
 # AUTEUR :  Rymentz (https://github.com/Macmachi/gptfoot)
-# VERSION : v2.8.2
+# VERSION : v2.9.0
 # LICENCE : Attribution-NonCommercial 4.0 International
 #
 import asyncio
@@ -18,6 +18,11 @@ import aiohttp
 import pytz
 import httpx
 import configparser
+import contextlib
+import contextvars
+import hashlib
+import heapq
+import inspect
 import time
 import atexit
 import signal
@@ -54,13 +59,19 @@ def validate_api_keys():
         if not TOKEN_DISCORD or len(TOKEN_DISCORD) < 20:
             errors.append("DISCORD_BOT_TOKEN n'est pas configuré correctement")
     
-    # Vérifier TEAM_ID
-    try:
-        team_id_int = int(TEAM_ID)
-        if team_id_int <= 0:
-            errors.append("TEAM_ID doit être un nombre positif")
-    except (ValueError, TypeError):
-        errors.append("TEAM_ID doit être un nombre valide")
+    # Vérifier TEAM_ID (ou chaque ID de TEAM_IDS)
+    team_key = "TEAM_IDS" if TEAM_IDS_STR else "TEAM_ID"
+    for team_id, team_name in FOLLOWED_TEAMS:
+        try:
+            team_id_int = int(team_id)
+            if team_id_int <= 0:
+                errors.append(f"{team_key} doit contenir des nombres positifs ({team_id})")
+        except (ValueError, TypeError):
+            errors.append(f"{team_key} doit contenir des nombres valides ({team_id})")
+        if team_name == team_id:
+            warnings.append(f"Pas de nom dans TEAM_NAMES pour l'équipe {team_id}, son ID sera affiché")
+    if len({team_id for team_id, _ in FOLLOWED_TEAMS}) != len(FOLLOWED_TEAMS):
+        warnings.append("TEAM_IDS contient des doublons")
 
     # Vérifier LEAGUE_IDS
     if not LEAGUE_IDS_STR:
@@ -100,6 +111,15 @@ def validate_api_keys():
     print("✅ Validation des clés API réussie\n")
     return True
 
+# Équipes suivies : [(id, nom)], depuis TEAM_IDS / TEAM_NAMES ou, à défaut, TEAM_ID / TEAM_NAME.
+# Un nom manquant est remplacé par l'ID (un avertissement est affiché à la validation).
+def parse_followed_teams(team_ids_str, team_names_str, team_id, team_name):
+    team_ids = [x.strip() for x in team_ids_str.split(',') if x.strip()]
+    if not team_ids:
+        return [(team_id, team_name)]
+    team_names = [x.strip() for x in team_names_str.split(',')] if team_names_str else []
+    return [(tid, team_names[i] if i < len(team_names) and team_names[i] else tid) for i, tid in enumerate(team_ids)]
+
 config = configparser.ConfigParser()
 
 try:
@@ -117,6 +137,13 @@ try:
     TOKEN_TELEGRAM = config['KEYS'].get('TELEGRAM_BOT_TOKEN', '').strip()
     TEAM_ID = config['KEYS'].get('TEAM_ID', '').strip()
     TEAM_NAME = config['KEYS'].get('TEAM_NAME', '').strip()
+    # Plusieurs clubs suivis par le même process (IDs et noms dans le même ordre, séparés par
+    # des virgules) ; vide = la seule équipe de TEAM_ID / TEAM_NAME
+    TEAM_IDS_STR = config['KEYS'].get('TEAM_IDS', '').strip()
+    TEAM_NAMES_STR = config['KEYS'].get('TEAM_NAMES', '').strip()
+    FOLLOWED_TEAMS = parse_followed_teams(TEAM_IDS_STR, TEAM_NAMES_STR, TEAM_ID, TEAM_NAME)
+    # Première équipe suivie : équipe par défaut (entrées d'historique sans team_id, appels hors suivi d'un match)
+    TEAM_ID, TEAM_NAME = FOLLOWED_TEAMS[0]
     LEAGUE_IDS_STR = config['KEYS'].get('LEAGUE_IDS', '').strip()
     SEASON_ID = config['KEYS'].get('SEASON_ID', '').strip()
     API_FOOTBALL_KEY = config['KEYS'].get('API_FOOTBALL_KEY', '').strip()
@@ -127,6 +154,22 @@ try:
     USE_DISCORD = config['OPTIONS'].getboolean('USE_DISCORD', fallback=True)
     IS_PAID_API = config['OPTIONS'].getboolean('IS_PAID_API', fallback=False)
     ENABLE_COST_TRACKING = config['OPTIONS'].getboolean('ENABLE_COST_TRACKING', fallback=True)
+    # API gratuite : intervalle de polling planifié selon le quota restant et la phase du match
+    ADAPTIVE_POLLING = config['OPTIONS'].getboolean('ADAPTIVE_POLLING', fallback=True)
+    # Pendant le jeu, sonde légère du match (/fixtures/events) au lieu du payload complet
+    # /fixtures?ids= (voir LIVE_SLIM_WINDOWS). Désactivé par défaut : chaque but coûte un appel de plus.
+    LIVE_SLIM_MODE = config['OPTIONS'].getboolean('LIVE_SLIM_MODE', fallback=False)
+    # Alerte "BUT" immédiate dès que le score bouge, avant que l'API publie le buteur
+    INSTANT_GOAL_ALERTS = config['OPTIONS'].getboolean('INSTANT_GOAL_ALERTS', fallback=True)
+    # Réutilise la réponse IA d'un prompt identique (voir LLMResponseCache)
+    LLM_CACHE = config['OPTIONS'].getboolean('LLM_CACHE', fallback=True)
+    # Budget (tokens estimés) du résumé de chaque match passé dans les prompts ; 0 = analyses complètes
+    HISTORY_DIGEST_TOKENS = config['OPTIONS'].getint('HISTORY_DIGEST_TOKENS', fallback=150)
+    # Ordonnanceur des appels IA : appels simultanés maximum et rythme en tokens/minute par modèle (0 = illimité)
+    LLM_MAX_CONCURRENCY = config['OPTIONS'].getint('LLM_MAX_CONCURRENCY', fallback=4)
+    LLM_TOKENS_PER_MINUTE = config['OPTIONS'].getint('LLM_TOKENS_PER_MINUTE', fallback=0)
+    # Rédige directement dans LANGUAGE (textes fixes du catalogue, prompts IA) au lieu de traduire depuis le français
+    NATIVE_LANGUAGE_GENERATION = config['OPTIONS'].getboolean('NATIVE_LANGUAGE_GENERATION', fallback=True)
     
     # Récupérer le fuseau horaire du serveur à partir de la section SERVER
     SERVER_TIMEZONE_STR = config['SERVER'].get('TIMEZONE', 'Europe/Paris')
@@ -137,6 +180,8 @@ try:
     # Récupérer les modèles API à partir de la section API_MODELS
     GPT_MODEL_NAME = config['API_MODELS'].get('MAIN_MODEL', 'minimax/minimax-m3')
     GPT_MODEL_NAME_TRANSLATION = config['API_MODELS'].get('TRANSLATION_MODEL', 'minimax/minimax-m3')
+    # Modèle de secours interrogé en parallèle quand le modèle principal tarde (vide = désactivé)
+    GPT_MODEL_NAME_HEDGE = config['API_MODELS'].get('HEDGE_MODEL', '').strip()
     
     # Récupérer la tarification à partir de la section API_PRICING
     INPUT_COST_PER_1M_TOKENS = float(config['API_PRICING'].get('INPUT_COST_PER_1M_TOKENS', '0.30'))
@@ -170,9 +215,6 @@ if not validate_api_keys():
     print("Appuyez sur Ctrl+C pour arrêter et corriger la configuration\n")
     time.sleep(5)
 
-# Variable pour suivre si le message a été envoyé pendant les tirs au but
-penalty_message_sent = False
-interruption_message_sent = False
 # Convertir la chaîne du fuseau horaire en objet pytz
 server_timezone = pytz.timezone(SERVER_TIMEZONE_STR)
 # Convertir la chaîne de LEAGUE_IDS en une liste d'entiers
@@ -183,21 +225,16 @@ except ValueError:
     LEAGUE_IDS = []
 # Empêche notre variable 'main' de se terminer après avoir créé la tâche pour lancer notre bot Discord.
 is_running = True
-# Défini notre variable pour stocker les événements envoyé pendant le match
-sent_events = set()
-# Stockage détaillé des événements pour détecter les corrections de timing
-sent_events_details = {}
-# Cache mémoire des statistiques de saison de notre équipe pour la ligue du match courant.
-# Récupéré 1 seule fois par match (juste avant la compo) puis réutilisé pour le prompt
-# d'analyse de début, de fin, ainsi que pour le bloc d'affichage en fin de match.
-# Réinitialisé à chaque nouveau match.
-current_season_stats = None
-# Variables pour le suivi des coûts API
+# Variables pour le suivi des coûts API (cumul sur toute la durée de vie du process ;
+# le détail par match est tenu dans chaque MatchTracker)
 api_call_count = 0
 total_input_tokens = 0
 total_output_tokens = 0
+total_cached_tokens = 0
 total_cost_usd = 0.0
-match_tracking_start_time = None
+# Réponses IA servies par le cache (aucun appel réseau) et coût estimé évité
+llm_cache_hits = 0
+llm_cache_saved_usd = 0.0
 # Chemin du fichier de stockage des analyses de matchs
 match_analyses_path = os.path.join(script_dir, 'match_analyses.json')
 
@@ -205,6 +242,10 @@ match_analyses_path = os.path.join(script_dir, 'match_analyses.json')
 class RateLimitExceededError(Exception):
     pass
 
+# Appel api-football refusé en amont par le registre de quota (quota réservé au suivi live)
+class QuotaReservedError(Exception):
+    pass
+
 # Configuration du système de logging professionnel
 def setup_logging():
     """Configure le système de logging avec rotation des fichiers"""
@@ -264,39 +305,97 @@ def log_message(message: str, level: str = "INFO"):
         logger.info(message)
 
 # Fonction pour tracker les coûts API
-def track_api_cost(input_tokens: int, output_tokens: int, function_name: str = ""):
-    """Track API costs based on token usage"""
-    global api_call_count, total_input_tokens, total_output_tokens, total_cost_usd
+def track_api_cost(input_tokens: int, output_tokens: int, function_name: str = "", cached_tokens: int = 0):
+    """Track API costs based on token usage (cached_tokens : part de l'entrée servie par le cache de prompt du fournisseur)"""
+    global api_call_count, total_input_tokens, total_output_tokens, total_cached_tokens, total_cost_usd
     
     if not ENABLE_COST_TRACKING:
         return
     
+    cached_tokens = min(cached_tokens or 0, input_tokens)
     api_call_count += 1
     total_input_tokens += input_tokens
     total_output_tokens += output_tokens
-    
-    # Calculer le coût en USD
-    input_cost = (input_tokens / 1_000_000) * INPUT_COST_PER_1M_TOKENS
+    total_cached_tokens += cached_tokens
+
+    # Calculer le coût en USD (tokens en cache facturés avec la remise CACHE_DISCOUNT_PERCENTAGE)
+    input_cost = (((input_tokens - cached_tokens) / 1_000_000) * INPUT_COST_PER_1M_TOKENS
+                  + (cached_tokens / 1_000_000) * INPUT_COST_PER_1M_TOKENS * (1 - CACHE_DISCOUNT_PERCENTAGE / 100))
     output_cost = (output_tokens / 1_000_000) * OUTPUT_COST_PER_1M_TOKENS
     call_cost = input_cost + output_cost
     total_cost_usd += call_cost
-    
-    log_message(f"[API_COST] {function_name} - Input: {input_tokens} tokens (${input_cost:.6f}), Output: {output_tokens} tokens (${output_cost:.6f}), Total call: ${call_cost:.6f}, Cumulative: ${total_cost_usd:.6f}")
+
+    # Imputer aussi le coût au match en cours de suivi dans cette tâche (s'il y en a un)
+    tracker = get_current_tracker()
+    if tracker is not None:
+        tracker.api_call_count += 1
+        tracker.total_input_tokens += input_tokens
+        tracker.total_output_tokens += output_tokens
+        tracker.total_cached_tokens += cached_tokens
+        tracker.total_cost_usd += call_cost
+        match_label = f" [match {tracker.fixture_id}]"
+    else:
+        match_label = ""
+
+    log_message(f"[API_COST]{match_label} {function_name} - Input: {input_tokens} tokens dont {cached_tokens} en cache (${input_cost:.6f}), Output: {output_tokens} tokens (${output_cost:.6f}), Total call: ${call_cost:.6f}, Cumulative: ${total_cost_usd:.6f}")
+
+# Tokens d'entrée servis par le cache de prompt du fournisseur (bloc usage OpenRouter)
+def usage_cached_tokens(usage):
+    return ((usage or {}).get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+
+# Fonction pour tracker les réponses IA servies par le cache (coût évité estimé avec les tokens de l'appel d'origine)
+def track_llm_cache_hit(entry, function_name: str = ""):
+    global llm_cache_hits, llm_cache_saved_usd
+
+    saved_cost = ((entry.get("input_tokens", 0) / 1_000_000) * INPUT_COST_PER_1M_TOKENS
+                  + (entry.get("output_tokens", 0) / 1_000_000) * OUTPUT_COST_PER_1M_TOKENS)
+    llm_cache_hits += 1
+    llm_cache_saved_usd += saved_cost
+
+    tracker = get_current_tracker()
+    if tracker is not None:
+        tracker.llm_cache_hits += 1
+        tracker.llm_cache_saved_usd += saved_cost
+        match_label = f" [match {tracker.fixture_id}]"
+    else:
+        match_label = ""
+
+    log_message(f"[LLM_CACHE]{match_label} {function_name} - réponse servie par le cache, coût évité : ${saved_cost:.6f}")
 
 # Fonction pour afficher le résumé des coûts
-def log_cost_summary():
-    """Log a summary of API costs at the end of the match"""
+def log_cost_summary(tracker=None):
+    """Log a summary of API costs at the end of the match (ou du process si tracker est None)"""
     if not ENABLE_COST_TRACKING:
         return
-    
+
+    if tracker is not None:
+        call_count = tracker.api_call_count
+        input_tokens = tracker.total_input_tokens
+        output_tokens = tracker.total_output_tokens
+        cached_tokens = tracker.total_cached_tokens
+        cost_usd = tracker.total_cost_usd
+        cache_hits = tracker.llm_cache_hits
+        cache_saved_usd = tracker.llm_cache_saved_usd
+        title = f"RÉSUMÉ DES COÛTS API (match {tracker.fixture_id})"
+    else:
+        call_count = api_call_count
+        input_tokens = total_input_tokens
+        output_tokens = total_output_tokens
+        cached_tokens = total_cached_tokens
+        cost_usd = total_cost_usd
+        cache_hits = llm_cache_hits
+        cache_saved_usd = llm_cache_saved_usd
+        title = "RÉSUMÉ DES COÛTS API"
+
     log_message("=" * 80)
-    log_message("[COST_SUMMARY] ===== RÉSUMÉ DES COÛTS API =====")
-    log_message(f"[COST_SUMMARY] Nombre d'appels API : {api_call_count}")
-    log_message(f"[COST_SUMMARY] Total tokens entrée : {total_input_tokens}")
-    log_message(f"[COST_SUMMARY] Total tokens sortie : {total_output_tokens}")
-    log_message(f"[COST_SUMMARY] Total tokens : {total_input_tokens + total_output_tokens}")
-    log_message(f"[COST_SUMMARY] Coût total USD : ${total_cost_usd:.6f}")
-    log_message(f"[COST_SUMMARY] Coût moyen par appel : ${total_cost_usd / api_call_count:.6f}" if api_call_count > 0 else "[COST_SUMMARY] Aucun appel API")
+    log_message(f"[COST_SUMMARY] ===== {title} =====")
+    log_message(f"[COST_SUMMARY] Nombre d'appels API : {call_count}")
+    log_message(f"[COST_SUMMARY] Total tokens entrée : {input_tokens} (dont {cached_tokens} en cache fournisseur)")
+    log_message(f"[COST_SUMMARY] Total tokens sortie : {output_tokens}")
+    log_message(f"[COST_SUMMARY] Total tokens : {input_tokens + output_tokens}")
+    log_message(f"[COST_SUMMARY] Coût total USD : ${cost_usd:.6f}")
+    log_message(f"[COST_SUMMARY] Coût moyen par appel : ${cost_usd / call_count:.6f}" if call_count > 0 else "[COST_SUMMARY] Aucun appel API")
+    log_message(f"[COST_SUMMARY] Réponses servies par le cache IA : {cache_hits} (coût évité : ${cache_saved_usd:.6f})")
     log_message("=" * 80)
 
 # Fonction qui nous permet de vider le fichier log lorsqu'un nouveau match est détecté optimise la place sur le serveur et laisse quelques jours pour vérifier les logs du match précédent entre chaque match
@@ -348,6 +447,431 @@ async def close_http_clients():
 
 ### FIN DE GESTION DES CLIENTS HTTP PARTAGES
 
+### DEBUT DE GESTION DU SUIVI MULTI-MATCHS
+
+# Tout l'état d'un match suivi en direct (événements déjà envoyés, stats de saison,
+# flags de messages, coûts IA) vit dans un MatchTracker : un seul process peut ainsi
+# suivre plusieurs matchs en parallèle dans la même boucle asyncio, en partageant les
+# clients HTTP et les connexions Telegram/Discord.
+class MatchTracker:
+    """État de suivi d'un match (un objet par fixture api-football)"""
+
+    def __init__(self, fixture_id, league_id=None, teams=None, league=None, round_info=None,
+                 venue=None, city=None, match_start_time=None, team_id=None, team_name=None, kickoff=None):
+        self.fixture_id = fixture_id
+        self.league_id = league_id
+        self.team_id = team_id if team_id is not None else TEAM_ID
+        self.team_name = team_name if team_name is not None else TEAM_NAME
+        self.teams = teams
+        self.league = league
+        self.round_info = round_info
+        self.venue = venue
+        self.city = city
+        self.match_start_time = match_start_time
+        # Coup d'envoi "aware" (fuseau configuré) : à défaut, l'heure de début aujourd'hui
+        if kickoff is None and match_start_time is not None:
+            kickoff = datetime.datetime.now(server_timezone).replace(hour=match_start_time.hour, minute=match_start_time.minute, second=0, microsecond=0)
+        self.kickoff = kickoff
+        # Signalé quand le coup d'envoi est déplacé : les attentes en cours se réarment
+        self.rescheduled = asyncio.Event()
+        # Vue indexée des événements du match : chaque poll produit des deltas typés
+        # (ajouté / modifié / retiré) au lieu d'un re-parcours complet de la liste
+        self.event_diff = EventDiffEngine()
+        # Événements déjà annoncés (identifiant stable du moteur de diff -> détails),
+        # utilisés pour détecter les corrections de timing des buts
+        self.announced_events = {}
+        # Stats de saison de l'équipe pour la ligue du match : récupérées 1 seule fois
+        # (juste avant la compo) puis réutilisées pour les prompts de début et de fin
+        # de match ainsi que pour le bloc d'affichage en fin de match.
+        self.season_stats = None
+        # Flags pour ne pas répéter les messages de tirs au but / d'interruption
+        self.penalty_message_sent = False
+        self.interruption_message_sent = False
+        # Minute du dernier but détecté (fenêtre de polling dense juste après un but)
+        self.last_goal_minute = None
+        # Passe à True au début du polling live (réserve de quota réduite ensuite)
+        self.live_started = False
+        # Court-circuit des réponses inchangées : dernière révision traitée et compteurs
+        self.last_snapshot_revision = None
+        self.polls_total = 0
+        self.polls_unchanged = 0
+        # Buts vus dans le score mais pas encore annoncés avec leur buteur (instant de détection par côté)
+        self.pending_goal_alerts = {'home': [], 'away': []}
+        # Alertes immédiates (SentMessage) par côté, pas encore complétées par le buteur
+        self.instant_goal_alerts = {'home': [], 'away': []}
+        # Latences de notification des buts (secondes depuis la détection du score)
+        self.goal_latencies = {'instant': [], 'enriched': []}
+        # Coûts IA imputés à ce match (voir track_api_cost)
+        self.api_call_count = 0
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
+        self.total_cached_tokens = 0
+        self.total_cost_usd = 0.0
+        self.llm_cache_hits = 0
+        self.llm_cache_saved_usd = 0.0
+        # Durées des appels IA par type et dépassements de délai (voir LLM_DEADLINES)
+        self.llm_latencies = {}
+        self.llm_deadline_misses = {}
+        self.tracking_start_time = time.time()
+
+    def reschedule(self, kickoff):
+        """Nouveau coup d'envoi : réarme les attentes en cours (voir wait_for_milestone)."""
+        self.kickoff = kickoff
+        self.match_start_time = kickoff.time()
+        self.rescheduled.set()
+
+    def __repr__(self):
+        return f"MatchTracker(fixture_id={self.fixture_id}, league_id={self.league_id}, teams={self.teams})"
+
+# Matchs actuellement suivis, indexés par fixture_id (évite de suivre deux fois le même
+# match si le check au démarrage et le check quotidien le détectent tous les deux).
+active_trackers = {}
+# Matchs dont le message "match aujourd'hui" est déjà parti : un tracker relancé par le
+# planificateur après un échec avant le coup d'envoi ne le renvoie pas
+announced_fixtures = set()
+
+# Tracker du match traité par la tâche asyncio courante. Chaque tâche de suivi a sa
+# propre copie du contexte : les fonctions profondes (ex: track_api_cost) retrouvent
+# ainsi leur match sans que le tracker soit passé à travers toute la chaîne d'appels.
+_current_tracker = contextvars.ContextVar("gptfoot_current_tracker", default=None)
+
+def get_current_tracker():
+    """Renvoie le MatchTracker de la tâche courante, ou None hors suivi de match."""
+    return _current_tracker.get()
+
+### FIN DE GESTION DU SUIVI MULTI-MATCHS
+
+### DEBUT DE GESTION DU QUOTA API FOOTBALL
+
+# Chemin du fichier de persistance du registre de quota (survit aux redémarrages)
+api_quota_path = os.path.join(script_dir, 'api_quota.json')
+# En dessous de ce quota restant, le suivi live s'arrête (appels indispensables)
+QUOTA_HARD_FLOOR = 3
+# Appels réservés au polling live d'un match suivi qui n'a pas encore commencé
+# (tier gratuit : le planning adaptatif s'accommode d'un budget réduit)
+LIVE_RESERVE_PER_MATCH = 460 if IS_PAID_API else 60
+# Appels indispensables au suivi : jamais refusés tant que le quota n'est pas épuisé.
+# Les autres (prédictions, stats de saison) ne passent que s'ils ne menacent pas la réserve live.
+CRITICAL_API_PURPOSES = ('live', 'status', 'schedule')
+
+class ApiQuotaLedger:
+    """
+    Registre unique du quota journalier api-football. Chaque appel y est enregistré
+    (coût, quota restant lu dans les en-têtes) et l'état est persisté sur disque pour
+    qu'un redémarrage le jour d'un match ne reparte pas à l'aveugle.
+    Le quota api-football est remis à zéro chaque jour à 00:00 UTC.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.day = None
+        self.remaining = None
+        self.limit = None
+        self.calls_by_purpose = {}
+        self.exhaustion_notified = False
+        self.load()
+
+    @staticmethod
+    def _today():
+        return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+    def load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                self.day = data.get("day")
+                self.remaining = data.get("remaining")
+                self.limit = data.get("limit")
+                self.calls_by_purpose = data.get("calls_by_purpose", {})
+                self.exhaustion_notified = data.get("exhaustion_notified", False)
+        except (json.JSONDecodeError, OSError) as e:
+            log_message(f"Registre de quota illisible ({e}), réinitialisation.", "WARNING")
+        self._roll_day()
+
+    def save(self):
+        try:
+            write_json_atomic(self.path, {
+                "day": self.day,
+                "remaining": self.remaining,
+                "limit": self.limit,
+                "calls_by_purpose": self.calls_by_purpose,
+                "exhaustion_notified": self.exhaustion_notified
+            })
+        except Exception as e:
+            log_message(f"Erreur lors de la sauvegarde du registre de quota : {e}", "ERROR")
+
+    def _roll_day(self):
+        """Nouveau jour UTC : le quota repart de la limite journalière connue."""
+        today = self._today()
+        if self.day != today:
+            self.day = today
+            self.remaining = self.limit
+            self.calls_by_purpose = {}
+            self.exhaustion_notified = False
+
+    def record(self, purpose, headers):
+        """Enregistre un appel effectué et le quota restant renvoyé par l'API."""
+        self._roll_day()
+        self.calls_by_purpose[purpose] = self.calls_by_purpose.get(purpose, 0) + 1
+        try:
+            self.remaining = int(headers.get('x-ratelimit-requests-remaining'))
+        except (TypeError, ValueError):
+            # En-tête absent : on décompte l'appel nous-mêmes
+            if self.remaining is not None:
+                self.remaining = max(0, self.remaining - 1)
+        try:
+            self.limit = int(headers.get('x-ratelimit-requests-limit'))
+        except (TypeError, ValueError):
+            pass
+        self.save()
+        log_message(f"[API_QUOTA] {purpose} - appels restants : {self.remaining}, marge prévue en fin de journée : {self.forecast_headroom()}")
+
+    def remaining_today(self):
+        self._roll_day()
+        return self.remaining
+
+    def reserved_live_calls(self):
+        """Appels à garder pour le polling live des matchs suivis aujourd'hui."""
+        reserved = 0
+        for tracker in active_trackers.values():
+            reserved += POLL_QUOTA_RESERVE if tracker.live_started else LIVE_RESERVE_PER_MATCH
+        return reserved
+
+    def forecast_headroom(self):
+        """Quota prévu en fin de journée une fois la réserve live servie (None si inconnu)."""
+        remaining = self.remaining_today()
+        if remaining is None:
+            return None
+        return remaining - self.reserved_live_calls()
+
+    def may_spend(self, purpose, cost=1):
+        """Indique si un appel de ce type peut consommer du quota maintenant."""
+        remaining = self.remaining_today()
+        if remaining is None:
+            return True
+        if purpose in CRITICAL_API_PURPOSES:
+            return remaining >= cost
+        headroom = self.forecast_headroom()
+        if headroom < cost:
+            log_message(f"[API_QUOTA] Appel '{purpose}' refusé : marge prévue {headroom} insuffisante (réserve live {self.reserved_live_calls()})", "WARNING")
+            return False
+        return True
+
+    def is_exhausted(self):
+        remaining = self.remaining_today()
+        return remaining is not None and remaining < QUOTA_HARD_FLOOR
+
+    def log_summary(self):
+        log_message(f"[API_QUOTA] Jour {self.day} : appels par type {self.calls_by_purpose}, restants {self.remaining}/{self.limit}")
+
+api_quota_ledger = ApiQuotaLedger(api_quota_path)
+
+# Point de passage unique de tous les appels à api-football : contrôle préalable du
+# registre, enregistrement du quota restant puis arrêt du suivi si le quota est épuisé
+# (pour les appels indispensables). Usage : async with api_football_request(url, 'live') as resp:
+@contextlib.asynccontextmanager
+async def api_football_request(url, purpose, extra_headers=None):
+    # Le suivi d'un match en cours s'arrête dès que le quota passe sous le plancher
+    stops_tracking = purpose in CRITICAL_API_PURPOSES and purpose != 'schedule'
+    if stops_tracking and api_quota_ledger.is_exhausted():
+        await _stop_for_exhausted_quota()
+    if not api_quota_ledger.may_spend(purpose):
+        raise QuotaReservedError(f"Quota réservé au suivi live, appel '{purpose}' non effectué.")
+
+    headers = {
+        "x-apisports-key": API_FOOTBALL_KEY
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+    session = await get_http_session()
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+        api_quota_ledger.record(purpose, resp.headers)
+        if stops_tracking and api_quota_ledger.is_exhausted():
+            await _stop_for_exhausted_quota()
+        yield resp
+
+async def _stop_for_exhausted_quota():
+    log_message(f"#####\nLe nombre d'appels à l'API est dépassé. Le suivi du match est stoppé.\n#####", "WARNING")
+    # Un seul message aux utilisateurs par jour, même si plusieurs matchs sont suivis
+    if not api_quota_ledger.exhaustion_notified:
+        api_quota_ledger.exhaustion_notified = True
+        api_quota_ledger.save()
+        await notify_users_max_api_requests_reached()
+    raise RateLimitExceededError("Le nombre d'appels maximum à l'API est dépassé.")
+
+### FIN DE GESTION DU QUOTA API FOOTBALL
+
+### DEBUT DE GESTION DU CALENDRIER DE LA SAISON
+
+# Calendrier complet des équipes suivies pour la saison (un appel /fixtures?team=&season= par équipe),
+# persisté sur disque : la vérification quotidienne ne coûte plus aucun appel API et
+# tous les matchs à venir sont connus à l'avance (y compris deux matchs le même jour).
+fixture_schedule_path = os.path.join(script_dir, 'fixture_schedule.json')
+# Le calendrier est rechargé chaque semaine, ou dès qu'un horaire de match a changé
+SCHEDULE_REFRESH_DAYS = 7
+# Statuts d'un match pas encore joué
+UPCOMING_STATUSES = ('TBD', 'NS')
+
+class FixtureSchedule:
+    """
+    Calendrier de la saison des équipes suivies (FOLLOWED_TEAMS), limité aux ligues de LEAGUE_IDS.
+    Chaque match porte l'équipe pour laquelle il est suivi (team_id, team_name).
+    Rechargé tous les SCHEDULE_REFRESH_DAYS jours, ou au prochain contrôle si un
+    appel de statut révèle qu'un match a été déplacé ou reporté.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.team_ids = None
+        self.season = None
+        self.fetched_at = None
+        self.stale = False
+        self.fixtures = {}
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                # Ancien format : une seule équipe ("team_id")
+                self.team_ids = data.get("team_ids") or ([str(data["team_id"])] if data.get("team_id") else None)
+                self.season = data.get("season")
+                self.fetched_at = data.get("fetched_at")
+                self.stale = data.get("stale", False)
+                self.fixtures = data.get("fixtures", {})
+        except (json.JSONDecodeError, OSError) as e:
+            log_message(f"Calendrier de la saison illisible ({e}), il sera rechargé.", "WARNING")
+            self.fixtures = {}
+            self.fetched_at = None
+
+    def save(self):
+        try:
+            write_json_atomic(self.path, {
+                "team_ids": self.team_ids,
+                "season": self.season,
+                "fetched_at": self.fetched_at,
+                "stale": self.stale,
+                "fixtures": self.fixtures
+            })
+        except Exception as e:
+            log_message(f"Erreur lors de la sauvegarde du calendrier de la saison : {e}", "ERROR")
+
+    @staticmethod
+    def _entry_from_api(item, team_id, team_name):
+        fixture_data = item['fixture']
+        venue_data = fixture_data.get('venue') or {}
+        return {
+            "fixture_id": fixture_data['id'],
+            "team_id": team_id,
+            "team_name": team_name,
+            "league_id": item['league']['id'],
+            "date": fixture_data['date'],
+            "status": fixture_data['status']['short'],
+            "teams": {
+                "home": item['teams']['home']['name'],
+                "away": item['teams']['away']['name']
+            },
+            "league": item['league']['name'],
+            "round": item['league'].get('round'),
+            "venue": venue_data.get('name'),
+            "city": venue_data.get('city')
+        }
+
+    @staticmethod
+    def kickoff(entry):
+        """Coup d'envoi "aware" dans le fuseau configuré."""
+        return datetime.datetime.strptime(entry["date"], '%Y-%m-%dT%H:%M:%S%z').astimezone(server_timezone)
+
+    @staticmethod
+    def followed_team_ids():
+        return [str(team_id) for team_id, _ in FOLLOWED_TEAMS]
+
+    def matches_config(self):
+        """Le calendrier chargé correspond-il aux équipes et à la saison configurées ?"""
+        return self.team_ids == self.followed_team_ids() and str(self.season) == str(SEASON_ID)
+
+    def needs_refresh(self):
+        if self.stale or not self.fetched_at:
+            return True
+        if not self.matches_config():
+            return True
+        fetched_at = datetime.datetime.fromisoformat(self.fetched_at)
+        return datetime.datetime.now(datetime.timezone.utc) - fetched_at > datetime.timedelta(days=SCHEDULE_REFRESH_DAYS)
+
+    @staticmethod
+    async def _fetch_team_season(team_id):
+        url = f"https://v3.football.api-sports.io/fixtures?team={team_id}&season={SEASON_ID}"
+        async with api_football_request(url, 'schedule') as resp:
+            resp.raise_for_status()
+            data = await resp.json()
+        return data.get('response') or []
+
+    async def refresh(self):
+        # Un appel par équipe, en parallèle ; un échec laisse le calendrier précédent en place
+        responses = await asyncio.gather(*(self._fetch_team_season(team_id) for team_id, _ in FOLLOWED_TEAMS))
+
+        fixtures = {}
+        for (team_id, team_name), items in zip(FOLLOWED_TEAMS, responses):
+            for item in items:
+                # Deux équipes suivies qui s'affrontent : un seul suivi, pour la première équipe de TEAM_IDS
+                if item['league']['id'] in LEAGUE_IDS and str(item['fixture']['id']) not in fixtures:
+                    entry = self._entry_from_api(item, team_id, team_name)
+                    fixtures[str(entry["fixture_id"])] = entry
+        self.fixtures = fixtures
+        self.team_ids = self.followed_team_ids()
+        self.season = SEASON_ID
+        self.fetched_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.stale = False
+        self.save()
+        schedule_changed.set()
+        log_message(f"Calendrier de la saison rechargé : {len(fixtures)} match(s) dans les ligues {LEAGUE_IDS}, dont {len(self.upcoming())} à venir")
+
+    async def ensure_fresh(self):
+        """Recharge le calendrier si besoin ; renvoie False s'il est inutilisable."""
+        if self.needs_refresh():
+            try:
+                await self.refresh()
+            except (aiohttp.ClientError, asyncio.TimeoutError, QuotaReservedError, KeyError, ValueError) as e:
+                log_message(f"Impossible de recharger le calendrier de la saison : {e}", "WARNING")
+                # Un calendrier déjà chargé pour les mêmes équipes et la même saison reste exploitable
+                return bool(self.fixtures) and self.matches_config()
+        return True
+
+    def upcoming(self, now=None):
+        """Matchs pas encore joués dont le coup d'envoi est à venir, triés par heure."""
+        now = now or datetime.datetime.now(server_timezone)
+        entries = [entry for entry in self.fixtures.values()
+                   if entry["status"] in UPCOMING_STATUSES and self.kickoff(entry) > now]
+        return sorted(entries, key=self.kickoff)
+
+    def fixtures_on(self, day, now=None):
+        """Matchs à venir dont le coup d'envoi tombe le jour donné (fuseau configuré)."""
+        return [entry for entry in self.upcoming(now) if self.kickoff(entry).date() == day]
+
+    def note_kickoff(self, fixture_id, match_date, match_status):
+        """
+        Compare l'horaire et le statut renvoyés par un appel de statut au calendrier :
+        un match déplacé ou reporté force le rechargement au prochain contrôle.
+        """
+        entry = self.fixtures.get(str(fixture_id))
+        if entry is None:
+            return
+        if self.kickoff(entry) != match_date or match_status in ('PST', 'CANC'):
+            log_message(f"Horaire ou statut du match {fixture_id} modifié ({entry['date']} -> {match_date.isoformat()}, {match_status}), le calendrier sera rechargé")
+            entry["date"] = match_date.isoformat(timespec='seconds')
+            entry["status"] = match_status
+            self.stale = True
+            self.save()
+            schedule_changed.set()
+
+fixture_schedule = FixtureSchedule(fixture_schedule_path)
+# Signalé quand le calendrier change : le planificateur recalcule son prochain réveil
+schedule_changed = asyncio.Event()
+
+### FIN DE GESTION DU CALENDRIER DE LA SAISON
+
 ### DEBUT DE GESTION DU STOCKAGE DES ANALYSES DE MATCHS
 
 # Écriture JSON atomique : on écrit dans un fichier temporaire puis on remplace la cible,
@@ -402,6 +926,7 @@ def save_match_analysis(fixture_id, match_info, pre_match_analysis, post_match_a
             "score": match_info.get("score", {}),
             "venue": match_info.get("venue", "Unknown"),
             "city": match_info.get("city", "Unknown"),
+            "team_id": match_info.get("team_id", TEAM_ID),
             "pre_match_analysis": pre_match_analysis,
             "post_match_analysis": post_match_analysis
         }
@@ -422,33 +947,97 @@ def save_match_analysis(fixture_id, match_info, pre_match_analysis, post_match_a
             data["matches"].append(match_entry)
             log_message(f"Match {fixture_id} ajouté à l'historique")
         
-        # Garder seulement les 5 derniers matchs (utilisés pour le contexte)
-        if len(data["matches"]) > 5:
-            data["matches"] = data["matches"][-5:]
-            log_message(f"Historique limité à 5 matchs")
+        # Garder seulement les 5 derniers matchs par équipe suivie (utilisés pour le contexte)
+        team_id = str(match_entry["team_id"])
+        team_matches = [m for m in data["matches"] if str(m.get("team_id", TEAM_ID)) == team_id]
+        if len(team_matches) > 5:
+            to_drop = {id(m) for m in team_matches[:-5]}
+            data["matches"] = [m for m in data["matches"] if id(m) not in to_drop]
+            log_message(f"Historique limité à 5 matchs pour l'équipe {team_id}")
         
         save_match_history(data)
     except Exception as e:
         log_message(f"Erreur lors de la sauvegarde de l'analyse du match : {e}")
 
 # Fonction pour récupérer les N derniers matchs
-def get_last_n_matches(n=5):
-    """Récupère les N derniers matchs de l'historique"""
+def get_last_n_matches(n=5, team_id=None, exclude_fixture_id=None):
+    """Récupère les N derniers matchs de l'historique (de l'équipe team_id si fournie),
+    sans le match exclude_fixture_id (le match en cours, pour un historique identique
+    d'un appel IA à l'autre pendant tout le match)"""
     try:
         data = load_match_history()
         matches = data.get("matches", [])
+        if team_id is not None:
+            # Les entrées antérieures au suivi multi-équipes n'ont pas de team_id : elles
+            # appartiennent à l'équipe configurée dans TEAM_ID.
+            matches = [m for m in matches if str(m.get("team_id", TEAM_ID)) == str(team_id)]
+        if exclude_fixture_id is not None:
+            matches = [m for m in matches if m.get("fixture_id") != exclude_fixture_id]
         return matches[-n:]
     except Exception as e:
         log_message(f"Erreur lors de la récupération des derniers matchs : {e}")
         return []
 
+# Estimation grossière du nombre de tokens d'un texte (~4 caractères par token)
+def estimate_tokens(text):
+    return (len(text) + 3) // 4
+
+# Tronque un texte au budget de tokens, de préférence sur une fin de phrase
+# (la marque de troncature est comptée dans le budget)
+CLIP_MARKER = " […]"
+
+def clip_to_token_budget(text, budget):
+    if len(text) <= budget * 4:
+        return text
+    max_chars = max(budget * 4 - len(CLIP_MARKER), 0)
+    clipped = text[:max_chars]
+    cut = max(clipped.rfind(". "), clipped.rfind("\n"))
+    if cut > max_chars // 2:
+        clipped = clipped[:cut + 1]
+    return clipped.rstrip() + CLIP_MARKER
+
+# Résumé compact (budget fixe) de l'analyse d'un match, stocké dans l'historique juste après
+# la sauvegarde de l'analyse : les prompts suivants l'utilisent à la place de l'analyse complète
+async def store_match_digest(fixture_id, post_match_analysis):
+    digest = await call_chatgpt_api_match_digest(post_match_analysis, HISTORY_DIGEST_TOKENS)
+    if not digest:
+        # Les prompts se rabattront sur l'analyse complète tronquée au budget
+        log_message(f"Résumé de l'analyse du match {fixture_id} indisponible")
+        return
+    try:
+        data = load_match_history()
+        match_entry = next((m for m in data.get("matches", []) if m.get("fixture_id") == fixture_id), None)
+        if match_entry is None:
+            return
+        match_entry["post_match_digest"] = clip_to_token_budget(digest, HISTORY_DIGEST_TOKENS)
+        save_match_history(data)
+        log_message(f"Résumé de l'analyse du match {fixture_id} sauvegardé : ~{estimate_tokens(match_entry['post_match_digest'])} tokens "
+                    f"au lieu de ~{estimate_tokens(post_match_analysis)}")
+    except Exception as e:
+        log_message(f"Erreur lors de la sauvegarde du résumé du match {fixture_id} : {e}")
+
+# Analyse d'un match passé telle qu'elle figure dans les prompts : son résumé si disponible,
+# sinon l'analyse complète tronquée au budget (ou complète si HISTORY_DIGEST_TOKENS = 0)
+def match_history_analysis(match):
+    analysis = match.get("post_match_analysis") or "Pas d'analyse disponible"
+    if HISTORY_DIGEST_TOKENS <= 0:
+        return analysis
+    return clip_to_token_budget(match.get("post_match_digest") or analysis, HISTORY_DIGEST_TOKENS)
+
+# Entrée de l'historique d'un match donné (None si absente)
+def get_match_entry(fixture_id):
+    return next((m for m in load_match_history().get("matches", []) if m.get("fixture_id") == fixture_id), None)
+
 # Fonction pour formater l'historique des matchs pour le contexte IA
 def format_match_history_for_context(matches):
-    """Formate l'historique des matchs pour l'inclusion dans le contexte IA avec analyses complètes"""
+    """Formate l'historique des matchs pour l'inclusion dans le contexte IA (résumés ou analyses complètes)"""
     if not matches:
         return "Aucun match précédent disponible."
     
-    formatted = "📊 HISTORIQUE DES 5 DERNIERS MATCHS (ANALYSES COMPLÈTES):\n"
+    if HISTORY_DIGEST_TOKENS > 0:
+        formatted = "📊 HISTORIQUE DES 5 DERNIERS MATCHS (RÉSUMÉS):\n"
+    else:
+        formatted = "📊 HISTORIQUE DES 5 DERNIERS MATCHS (ANALYSES COMPLÈTES):\n"
     for i, match in enumerate(matches, 1):
         date = match.get("date", "Unknown")
         league = match.get("league", "Unknown")
@@ -457,13 +1046,15 @@ def format_match_history_for_context(matches):
         score = match.get("score", {})
         home_score = score.get("home", "?")
         away_score = score.get("away", "?")
-        analysis = match.get("post_match_analysis", "Pas d'analyse disponible")
         
-        # Inclure l'analyse COMPLÈTE sans troncature pour ne pas perdre d'informations importantes
         formatted += f"\n{i}. {date} - {league}\n"
         formatted += f"   {home} {home_score} - {away_score} {away}\n"
-        formatted += f"   Analyse complète:\n{analysis}\n"
+        if HISTORY_DIGEST_TOKENS > 0:
+            formatted += f"   Résumé:\n{match_history_analysis(match)}\n"
+        else:
+            formatted += f"   Analyse complète:\n{match_history_analysis(match)}\n"
     
+    log_message(f"Contexte historique : {len(matches)} match(s), ~{estimate_tokens(formatted)} tokens")
     return formatted
 
 ### FIN DE GESTION DU STOCKAGE DES ANALYSES DE MATCHS
@@ -502,6 +1093,67 @@ for _signame in ("SIGINT", "SIGTERM", "SIGQUIT"):
         signal.signal(_sig, handle_termination_signal)
 
 ### FIN DE GESTION DE LA FERMETURE DU SCRIPT
+### DEBUT DE GESTION DU REGISTRE DES ABONNES
+
+# Registres des abonnés (telegram_chat_ids.json, discord_channels.json) : liste d'IDs de chats.
+# Un chat qui a choisi sa langue y figure sous la forme {"id": ..., "language": ...} ; les IDs seuls
+# (format historique) suivent LANGUAGE. Un seul processus sert ainsi toutes les langues.
+def load_subscribers(path):
+    """Renvoie {id: langue choisie ou None} ; lève FileNotFoundError / json.JSONDecodeError comme json.load."""
+    with open(path, "r") as file:
+        entries = json.load(file)
+    subscribers = {}
+    for entry in entries:
+        if isinstance(entry, dict):
+            subscribers[entry["id"]] = (entry.get("language") or "").lower() or None
+        else:
+            subscribers[entry] = None
+    return subscribers
+
+def save_subscribers(path, subscribers):
+    write_json_atomic(path, [chat_id if language is None else {"id": chat_id, "language": language}
+                             for chat_id, language in subscribers.items()])
+
+def subscriber_language(language):
+    """Langue effective d'un abonné (LANGUAGE s'il n'en a pas choisi)."""
+    return (language or LANGUAGE).lower()
+
+# Langues acceptées en plus de celles du catalogue (et de LANGUAGE) : chaque message envoyé dans
+# ces langues coûte une traduction IA, la liste est donc fermée (en anglais, en minuscules)
+TRANSLATED_LANGUAGES = (
+    "arabic", "catalan", "chinese", "croatian", "czech", "danish", "dutch", "finnish", "greek",
+    "hebrew", "hindi", "hungarian", "indonesian", "japanese", "korean", "norwegian", "polish",
+    "romanian", "russian", "serbian", "swedish", "turkish", "ukrainian", "vietnamese",
+)
+
+def supported_languages():
+    """Langues qu'un chat peut choisir : catalogue, TRANSLATED_LANGUAGES et LANGUAGE."""
+    return sorted(set(MESSAGE_CATALOGUE["match_start"]) | set(TRANSLATED_LANGUAGES) | {LANGUAGE.lower()})
+
+def parse_language_argument(text):
+    """
+    Langue passée en argument d'une commande (/start german, !register german) : (langue, refusée).
+    Sans argument : (None, False). Langue hors de supported_languages() : (None, True).
+    """
+    language = " ".join((text or "").split()).lower()
+    if not language:
+        return None, False
+    if language in supported_languages():
+        return language, False
+    return None, True
+
+# Enregistre un chat (ou met à jour sa langue) et renvoie la clé du texte de réponse du catalogue
+def register_subscriber(subscribers, chat_id, language):
+    if chat_id not in subscribers:
+        subscribers[chat_id] = language
+        return "chat_registered"
+    if language and subscribers[chat_id] != language:
+        subscribers[chat_id] = language
+        return "chat_language_updated"
+    return "chat_already_registered"
+
+### FIN DE GESTION DU REGISTRE DES ABONNES
+
 ### DEBUT DE GESTION DU BOT DISCORD
 
 # Utilisez script_dir pour définir le chemin du fichier discord_channels.json
@@ -512,28 +1164,34 @@ intents.messages = True
 intents.message_content = True  # Activez l'intent message_content
 bot_discord = commands.Bot(command_prefix="!", intents=intents)
 
+# !register [langue] : enregistre le channel, avec sa langue si elle est précisée (ex: !register german)
 @bot_discord.command()
-async def register(ctx):
+async def register(ctx, *, language: str = None):
     try:
         log_message("Commande !register reçue")
         if not os.path.exists(discord_channels_path):
             write_json_atomic(discord_channels_path, [])
 
         try:
-            with open(discord_channels_path, "r") as file:
-                channels = json.load(file)
+            channels = load_subscribers(discord_channels_path)
         except json.JSONDecodeError:
             log_message("discord_channels.json corrompu, réinitialisation.", "WARNING")
-            channels = []
-
-        if ctx.channel.id not in channels:
-            channels.append(ctx.channel.id)
-            write_json_atomic(discord_channels_path, channels)
-            await ctx.send("Ce channel a été enregistré.")
-            log_message(f"Channel {ctx.channel.id} a été enregistré.")
-        else:
-            await ctx.send("Ce channel est déjà enregistré.")
-            log_message(f"Channel {ctx.channel.id} est déjà enregistré.")
+            channels = {}
+
+        requested_language = language
+        language, rejected = parse_language_argument(requested_language)
+        if rejected:
+            # Rien n'est enregistré : une langue inconnue ferait traduire chaque message pour ce channel
+            reply_language = subscriber_language(channels.get(ctx.channel.id))
+            await ctx.send(t("language_rejected", reply_language, languages=", ".join(supported_languages())))
+            log_message(f"Channel {ctx.channel.id} : langue refusée ({requested_language!r} non prise en charge).")
+            return
+        reply_key = register_subscriber(channels, ctx.channel.id, language)
+        if reply_key != "chat_already_registered":
+            save_subscribers(discord_channels_path, channels)
+        effective_language = subscriber_language(channels[ctx.channel.id])
+        await ctx.send(t(reply_key, effective_language, language=effective_language))
+        log_message(f"Channel {ctx.channel.id} : {reply_key} (langue : {effective_language}).")
     except FileNotFoundError:
         log_message("Erreur: Le fichier discord_channels.json n'a pas été trouvé ou n'a pas pu être créé.")
     except Exception as e:
@@ -576,6 +1234,7 @@ def initialize_chat_ids_file():
             log_message(f"Erreur lors de la création du fichier telegram_chat_ids.json : {e}")
 
 # Fonction déclenchée lorsqu'un utilisateur envoie la commande /start au bot.
+# /start [langue] : la langue optionnelle (ex: /start german) est enregistrée pour ce chat.
 async def on_start(message: types.Message):
     log_message("on_start(message: types.Message) appelée.")  
     chat_id = message.chat.id
@@ -583,65 +1242,154 @@ async def on_start(message: types.Message):
 
     # Récupérez les ID de chat existants à partir du fichier JSON
     try:
-        with open("telegram_chat_ids.json", "r") as file:
-            chat_ids = json.load(file)
+        chat_ids = load_subscribers("telegram_chat_ids.json")
     except (FileNotFoundError, json.JSONDecodeError):
         log_message("telegram_chat_ids.json manquant ou corrompu, réinitialisation.", "WARNING")
-        chat_ids = []
-
-    # Ajoutez l'ID de chat au fichier JSON s'il n'est pas déjà présent
-    if chat_id not in chat_ids:
-        chat_ids.append(chat_id)
-
-        write_json_atomic("telegram_chat_ids.json", chat_ids)
+        chat_ids = {}
+
+    # Ajoutez l'ID de chat au fichier JSON s'il n'est pas déjà présent (ou mettez à jour sa langue)
+    command_parts = (message.text or "").split(maxsplit=1)
+    language, rejected = parse_language_argument(command_parts[1] if len(command_parts) > 1 else None)
+    if rejected:
+        # Rien n'est enregistré : une langue inconnue ferait traduire chaque message pour ce chat
+        reply_language = subscriber_language(chat_ids.get(chat_id))
+        await message.reply(t("language_rejected", reply_language, languages=", ".join(supported_languages())))
+        log_message(f"Chat {chat_id} : langue refusée ({command_parts[1]!r} non prise en charge).")
+        return
+    reply_key = register_subscriber(chat_ids, chat_id, language)
+    if reply_key != "chat_already_registered":
+        save_subscribers("telegram_chat_ids.json", chat_ids)
 
-        await message.reply("Le bot a été démarré et l'ID du chat a été enregistré.")
-        log_message(f"Le bot a été démarré et l'ID du chat {chat_id} a été enregistré.")
-    else:
-        await message.reply("Le bot a déjà été démarré dans ce chat.")
-        log_message(f"Le bot a déjà été démarré dans ce chat {chat_id}.")    
+    effective_language = subscriber_language(chat_ids[chat_id])
+    await message.reply(t(reply_key, effective_language, language=effective_language))
+    log_message(f"Chat {chat_id} : {reply_key} (langue : {effective_language}).")
 
 ### FIN DE GESTION DU BOT TELEGRAM          
         
-# Vérifie périodiquement si un match est prévu et, si c'est le cas, récupère les informations pertinentes et effectue des actions appropriées.
-async def check_match_periodically():
-
+### DEBUT DE GESTION DE LA PLANIFICATION DES MATCHS
+
+# Le planificateur garde tous les matchs connus du calendrier, triés par coup d'envoi, et
+# se réveille exactement à l'heure d'annonce du prochain match (au lieu d'un réveil fixe
+# à 09:00 qui ratait les matchs joués avant 09:00 ou juste après minuit). Chaque tracker
+# attend ensuite ses propres jalons (compo, coup d'envoi) avec wait_for_milestone.
+# Heure d'annonce habituelle le jour du match
+MATCH_ANNOUNCE_HOUR = 9
+# Délai minimal entre l'annonce et le coup d'envoi (matchs avant 10:00 : annonce la veille au soir si besoin)
+MATCH_ANNOUNCE_MIN_LEAD = datetime.timedelta(hours=1)
+# Compo envoyée 15 minutes avant le coup d'envoi (API payante)
+LINEUP_LEAD = datetime.timedelta(minutes=15)
+# Réveil maximal du planificateur, même sans match proche (rechargement hebdomadaire du calendrier)
+SCHEDULER_MAX_SLEEP = datetime.timedelta(hours=6)
+
+def announce_time(kickoff):
+    """Heure d'annonce d'un match : 09:00 le jour même, ou au plus tard 1h avant le coup d'envoi."""
+    usual = kickoff.replace(hour=MATCH_ANNOUNCE_HOUR, minute=0, second=0, microsecond=0)
+    return min(usual, kickoff - MATCH_ANNOUNCE_MIN_LEAD)
+
+def milestone_time(tracker, milestone):
+    """Heure d'un jalon du tracker : 'lineup' (compo) ou 'kickoff'."""
+    if milestone == 'lineup' and IS_PAID_API:
+        return tracker.kickoff - LINEUP_LEAD
+    # API gratuite : la compo est envoyée au coup d'envoi pour limiter les appels
+    return tracker.kickoff
+
+async def wait_for_milestone(tracker, milestone):
+    """Attend un jalon du match ; l'attente se réarme si le coup d'envoi est déplacé."""
     while True:
-        # Heure "aware" dans le fuseau configuré (et non celui de l'OS)
-        now = datetime.datetime.now(server_timezone)
-        target_time = now.replace(hour=9, minute=0, second=0, microsecond=0)
-
+        delay = (milestone_time(tracker, milestone) - datetime.datetime.now(server_timezone)).total_seconds()
+        if delay <= 0:
+            return
+        log_message(f"Match {tracker.fixture_id} : attente de {delay:.0f} secondes jusqu'au jalon '{milestone}'")
+        tracker.rescheduled.clear()
+        try:
+            await asyncio.wait_for(tracker.rescheduled.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return
+        log_message(f"Match {tracker.fixture_id} : coup d'envoi déplacé à {tracker.kickoff}, attente réarmée")
+
+def _next_scheduler_wakeup(now, schedule_available):
+    """Prochain réveil : annonce du prochain match non suivi, sinon réveil de sécurité."""
+    if not schedule_available:
+        # Sans calendrier, recherche par ligue (coûteuse en appels) une seule fois par jour, à 09:00
+        target_time = now.replace(hour=MATCH_ANNOUNCE_HOUR, minute=0, second=0, microsecond=0)
         if now >= target_time:
             target_time += datetime.timedelta(days=1)
+        return target_time
+    wakeup = now + SCHEDULER_MAX_SLEEP
+    for entry in fixture_schedule.upcoming(now):
+        if entry["fixture_id"] not in active_trackers:
+            wakeup = min(wakeup, max(now, announce_time(FixtureSchedule.kickoff(entry))))
+    return wakeup
+
+# Boucle du planificateur : lance le suivi des matchs dont l'heure d'annonce est passée,
+# puis dort jusqu'au prochain jalon (ou jusqu'à un changement de calendrier).
+async def check_match_periodically():
 
-        seconds_until_target_time = (target_time - now).total_seconds()
-        log_message(f"Attente de {seconds_until_target_time} secondes jusqu'à la prochaine vérification des matchs (09:00).")
-        await asyncio.sleep(seconds_until_target_time)
-
+    while True:
         # Vérifiez les matchs. Toute exception est capturée ici : sans ça, une erreur
-        # (ex: RateLimitExceededError propagée par check_events) tuerait cette tâche
-        # et le bot ne vérifierait plus jamais les matchs jusqu'au redémarrage.
-        log_message("Vérification du match en cours...")
+        # tuerait cette tâche et le bot ne vérifierait plus jamais les matchs jusqu'au
+        # redémarrage. Le suivi de chaque match tourne ensuite dans sa propre tâche
+        # (run_match_tracker) qui gère elle-même ses erreurs.
+        schedule_available = True
         try:
-            await check_matches()
+            schedule_available = await check_matches()
         except RateLimitExceededError as e:
-            log_message(f"Suivi du match arrêté (quota API atteint) : {e}. Reprise à la prochaine vérification quotidienne.", "WARNING")
+            log_message(f"Suivi du match arrêté (quota API atteint) : {e}. Reprise au prochain réveil du planificateur.", "WARNING")
         except Exception as e:
-            log_message(f"Erreur inattendue dans check_matches : {e}. Reprise à la prochaine vérification quotidienne.", "ERROR")
-    
-# Vérifie si un match est prévu aujourd'hui et effectue les actions appropriées, comme envoyer des messages de début et de fin de match, et vérifier les événements pendant le match.
+            log_message(f"Erreur inattendue dans check_matches : {e}. Reprise au prochain réveil du planificateur.", "ERROR")
+
+        # Heure "aware" dans le fuseau configuré (et non celui de l'OS)
+        now = datetime.datetime.now(server_timezone)
+        wakeup = _next_scheduler_wakeup(now, schedule_available)
+        seconds_until_wakeup = max(1.0, (wakeup - now).total_seconds())
+        log_message(f"Attente de {seconds_until_wakeup:.0f} secondes jusqu'à la prochaine vérification des matchs ({wakeup}).")
+        schedule_changed.clear()
+        try:
+            await asyncio.wait_for(schedule_changed.wait(), timeout=seconds_until_wakeup)
+            log_message("Calendrier modifié, réveil du planificateur.")
+        except asyncio.TimeoutError:
+            pass
+
+# Lance le suivi (un MatchTracker par match) des matchs dont l'heure d'annonce est passée.
+# Renvoie False si le calendrier de la saison est inutilisable (recherche par ligue utilisée).
 async def check_matches():
-    global sent_events
-    log_message("get_team_match_info() appelée.")
-    #On ignore la dernière value (current_league_id) qui n'est pas importante ici et déjà déclaré comme une variable globale !
-    match_today, match_start_time, fixture_id, current_league_id, teams, league, round_info, venue, city = await is_match_today()
+    log_message("check_matches() appelée.")
+    # Un calendrier sans aucun match à venir (SEASON_ID pas encore mis à jour, intersaison...)
+    # ne permet pas de conclure : on repasse alors par la recherche par ligue (next=1)
+    if await fixture_schedule.ensure_fresh() and fixture_schedule.upcoming():
+        now = datetime.datetime.now(server_timezone)
+        for entry in fixture_schedule.upcoming(now):
+            kickoff = FixtureSchedule.kickoff(entry)
+            tracker = active_trackers.get(entry["fixture_id"])
+            if tracker is not None:
+                # Match déjà suivi : réarmer ses attentes si le coup d'envoi a bougé
+                if tracker.kickoff != kickoff:
+                    tracker.reschedule(kickoff)
+                continue
+            if announce_time(kickoff) <= now:
+                start_match_tracker(kickoff.time(), entry["fixture_id"], entry["league_id"], entry["teams"],
+                                    entry["league"], entry["round"], entry["venue"], entry["city"], kickoff,
+                                    entry.get("team_id", TEAM_ID), entry.get("team_name", TEAM_NAME))
+        return True
+
+    log_message("Calendrier de la saison indisponible ou vide, recherche du prochain match par ligue.")
+    matches_today = await is_match_today()
+    if not matches_today:
+        log_message(f"Aucun match prévu aujourd'hui")
+        return False
+    for match_start_time, fixture_id, league_id, teams, league, round_info, venue, city, team_id, team_name in matches_today:
+        start_match_tracker(match_start_time, fixture_id, league_id, teams, league, round_info, venue, city,
+                            team_id=team_id, team_name=team_name)
+    return False
 
+def start_match_tracker(match_start_time, fixture_id, league_id, teams, league, round_info, venue, city, kickoff=None,
+                        team_id=None, team_name=None):
     log_message(
-        f"Résultat de is_match_today() dans la fonction check_match_periodically : "
-        f"match_today = {match_today}, "
+        f"Match à suivre : "
         f"match_start_time = {match_start_time}, "
         f"fixture_id = {fixture_id}, "
-        f"current_league_id = {current_league_id}, "
+        f"team = {team_name} ({team_id}), "
+        f"league_id = {league_id}, "
         f"teams = {teams}, "
         f"league = {league}, "
         f"round_info = {round_info}, "
@@ -649,67 +1397,82 @@ async def check_matches():
         f"city = {city}"
     )
 
-    if match_today:
-        # Réinitialiser les variables de suivi des coûts pour ce match
-        global api_call_count, total_input_tokens, total_output_tokens, total_cost_usd, penalty_message_sent, interruption_message_sent
-        api_call_count = 0
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cost_usd = 0.0
-        # Réinitialiser les flags de message pour le nouveau match
-        penalty_message_sent = False
-        interruption_message_sent = False
-        
-        # Vider le fichier de logs si un match est trouvé
-        clear_log()
-        log_message(f"un match a été trouvé")
-        log_message(f"[COST_TRACKING] Début du suivi des coûts pour le match")
-        # Vérifie que match_start_time n'est pas None et qu'il a des attributs hour et minute.
-        if match_start_time and hasattr(match_start_time, 'hour') and hasattr(match_start_time, 'minute'):
-            # Heure "aware" dans le fuseau configuré, cohérente avec match_start_time
-            now = datetime.datetime.now(server_timezone)
-            match_start_datetime = now.replace(hour=match_start_time.hour, minute=match_start_time.minute, second=0, microsecond=0)
-            seconds_until_match_start = (match_start_datetime - now).total_seconds()
-            log_message(f"Il reste {seconds_until_match_start} secondes avant le début du match.")
-            # Calculer le temps pour envoyer le message 15 minutes avant le début du match
-            seconds_until_message = max(0, seconds_until_match_start - 900)  # 900 secondes = 15 minutes
-            # On envoie le message pour annoncer qu'il y a un match aujourd'hui
-            await send_match_today_message(match_start_time, fixture_id, current_league_id, teams, league, round_info, venue, city)
-
-            # Attendre jusqu'à l'heure d'envoi du message 15 minutes avant le début du match
-            await asyncio.sleep(seconds_until_message)
-            # Envoyer le message si IS_PAID_API est vrai
-            if IS_PAID_API:
-                # Attendez que le match débute réellement qui est vérifié dans wait_for_match_start
-                match_data = (await wait_for_match_start(fixture_id, teams, league, round_info, venue, city))[3]
-                log_message(f"match_data reçu de wait_for_match_start dans check_matches {match_data}\n")
-            
-            else:
-                # Attendre jusqu'au début du match pour envoyer la compo et voir le match a réellement commencé si on utilise l'api free pour limiter les calls à l'api
-                # On vérifie pas ici si le match a déjà commencé car la structure du code fait en sorte qu'on puisse pas lancer le script pendant un match qui a commencé pour récuprer ses infos il faut attendre les matchs suivants.
-                remaining_seconds = max(0, seconds_until_match_start - seconds_until_message)
-                await asyncio.sleep(remaining_seconds)
-                log_message(f"Fin de l'attente jusqu'à l'heure prévu de début de match")
-                # Attendez que le match débute réellement
-                match_data = (await wait_for_match_start(fixture_id, teams, league, round_info, venue, city))[3]
-                log_message(f"match_data reçu de wait_for_match_start dans check_matches {match_data}\n")
-        
-            # Envoyez le message de début de match et commencez à vérifier les événements
-            if match_data is not None:
-                log_message(f"Envoie du message de début de match avec send_start_message (uniquement utile pour l'api payante avec interval court)")
-                await send_start_message()
-                log_message(f"Check des événements du match avec check_events")
-                # Réinitialiser les événements envoyés au début de chaque match
-                sent_events.clear()
-                sent_events_details.clear()
-                log_message(f"sent_events et sent_events_details vidés pour le nouveau match, taille: {len(sent_events)}")
-                await check_events(fixture_id)
-            else:
-                log_message(f"Pas de match_data pour l'instant (fonction check_matches), résultat de match_data : {match_data}")
+    # Vérifie que match_start_time n'est pas None et qu'il a des attributs hour et minute.
+    if not (match_start_time and hasattr(match_start_time, 'hour') and hasattr(match_start_time, 'minute')):
+        log_message(f"Pas d'heure de début de match")
+        return
+
+    if fixture_id in active_trackers:
+        log_message(f"Le match {fixture_id} est déjà suivi, pas de nouveau suivi lancé.")
+        return
+
+    tracker = MatchTracker(fixture_id, league_id, teams, league, round_info, venue, city, match_start_time,
+                           team_id=team_id, team_name=team_name, kickoff=kickoff)
+    active_trackers[fixture_id] = tracker
+    create_background_task(run_match_tracker(tracker), f"match_{fixture_id}")
+
+### FIN DE GESTION DE LA PLANIFICATION DES MATCHS
+
+# Suit un match de bout en bout : annonce, compo, début de match puis événements en direct.
+# Tourne dans sa propre tâche asyncio : plusieurs matchs peuvent être suivis en parallèle.
+async def run_match_tracker(tracker):
+    # La tâche a sa propre copie du contexte : le tracker n'est visible que d'ici
+    _current_tracker.set(tracker)
+    fixture_id = tracker.fixture_id
+    try:
+        # Vider le fichier de logs si un match est trouvé (seulement si aucun autre
+        # match n'est en cours de suivi, pour ne pas effacer ses logs)
+        if len(active_trackers) <= 1:
+            clear_log()
+        log_message(f"un match a été trouvé : {tracker}")
+        log_message(f"[COST_TRACKING] Début du suivi des coûts pour le match {fixture_id}")
+
+        seconds_until_match_start = (tracker.kickoff - datetime.datetime.now(server_timezone)).total_seconds()
+        log_message(f"Il reste {seconds_until_match_start} secondes avant le début du match.")
+        # On envoie le message pour annoncer qu'il y a un match aujourd'hui (une seule fois par match :
+        # marqué avant l'envoi, pour qu'une erreur pendant ou après l'annonce ne la fasse pas répéter)
+        if fixture_id in announced_fixtures:
+            log_message(f"Match {fixture_id} déjà annoncé, suivi relancé sans nouvelle annonce")
         else:
-                    log_message(f"Pas d'heure de début de match")
-    else:
-        log_message(f"Aucun match prévu aujourd'hui")
+            announced_fixtures.add(fixture_id)
+            await send_match_today_message(tracker.match_start_time, fixture_id, tracker.league_id, tracker.teams, tracker.league, tracker.round_info, tracker.venue, tracker.city)
+
+        # Attendre l'heure de la compo : 15 minutes avant le début du match avec l'api payante,
+        # le début du match avec l'api free pour limiter les calls à l'api
+        # On vérifie pas ici si le match a déjà commencé car la structure du code fait en sorte qu'on puisse pas lancer le script pendant un match qui a commencé pour récuprer ses infos il faut attendre les matchs suivants.
+        await wait_for_milestone(tracker, 'lineup')
+        if not IS_PAID_API:
+            log_message(f"Fin de l'attente jusqu'à l'heure prévu de début de match")
+        # Attendez que le match débute réellement (vérifié dans wait_for_match_start)
+        match_data = (await wait_for_match_start(tracker))[3]
+        log_message(f"match_data reçu de wait_for_match_start dans run_match_tracker {match_data}\n")
+
+        # Envoyez le message de début de match et commencez à vérifier les événements
+        if match_data is not None:
+            log_message(f"Envoie du message de début de match avec send_start_message (uniquement utile pour l'api payante avec interval court)")
+            await send_start_message()
+            log_message(f"Check des événements du match avec check_events")
+            # Le match est inclus dans les appels groupés /fixtures?ids= le temps du suivi live
+            register_live_fixture(fixture_id, tracker.league_id)
+            tracker.live_started = True
+            try:
+                await check_events(tracker)
+            finally:
+                unregister_live_fixture(fixture_id)
+        else:
+            log_message(f"Pas de match_data pour l'instant (fonction run_match_tracker), résultat de match_data : {match_data}")
+    except RateLimitExceededError as e:
+        log_message(f"Suivi du match {fixture_id} arrêté (quota API atteint) : {e}", "WARNING")
+    except Exception as e:
+        log_message(f"Erreur inattendue pendant le suivi du match {fixture_id} : {e}", "ERROR")
+    finally:
+        active_trackers.pop(fixture_id, None)
+        api_quota_ledger.log_summary()
+        log_polling_stats(tracker)
+        log_goal_latency_stats(tracker)
+        log_llm_latency_stats(tracker)
+        llm_scheduler.log_stats()
+        log_message(f"Fin du suivi du match {fixture_id}, matchs encore suivis : {list(active_trackers)}")
 
 # Fonction pour récupérer les statistiques de saison de l'équipe dans la ligue courante
 async def get_team_season_statistics(league_id, team_id, season):
@@ -717,26 +1480,14 @@ async def get_team_season_statistics(league_id, team_id, season):
     Récupère les stats de saison de l'équipe pour la compétition donnée
     via l'endpoint /teams/statistics. Renvoie le dict 'response' ou None.
     Cette fonction n'appelle l'API qu'une seule fois (1 requête / match).
-    En cas de rate-limit faible (< 2), on skip silencieusement pour ne pas
-    interrompre la fin du match.
+    Si le registre de quota estime que l'appel menace la réserve du suivi live,
+    on skip silencieusement pour ne pas interrompre le match.
     """
     log_message(f"get_team_season_statistics() appelée (league={league_id}, team={team_id}, season={season}).")
     url = f"https://v3.football.api-sports.io/teams/statistics?league={league_id}&team={team_id}&season={season}"
-    headers = {
-        "x-apisports-key": API_FOOTBALL_KEY
-    }
 
     try:
-        session = await get_http_session()
-        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-            remaining_calls_per_day = int(resp.headers.get('x-ratelimit-requests-remaining', 0))
-            log_message(f"Nombre d'appels à l'api restants : {remaining_calls_per_day}")
-
-            # Tolérant : on ne raise pas, on skip si trop bas
-            if remaining_calls_per_day < 2:
-                log_message("Quota API trop bas pour récupérer les stats de saison, skip.", "WARNING")
-                return None
-
+        async with api_football_request(url, 'season_stats') as resp:
             resp.raise_for_status()
             data = await resp.json()
 
@@ -746,6 +1497,10 @@ async def get_team_season_statistics(league_id, team_id, season):
 
             return data['response']
 
+    except QuotaReservedError as e:
+        # Tolérant : on ne raise pas, on skip
+        log_message(f"Stats de saison non récupérées : {e}", "WARNING")
+        return None
     except asyncio.TimeoutError:
         log_message("Timeout lors de la récupération des stats de saison", "ERROR")
         return None
@@ -763,21 +1518,11 @@ async def get_team_season_statistics(league_id, team_id, season):
 async def get_match_predictions(fixture_id):
     log_message("get_match_predictions() appelée.")
     url = f"https://v3.football.api-sports.io/predictions?fixture={fixture_id}"
-    headers = {
-        "x-apisports-key": API_FOOTBALL_KEY
-    }
 
     try:
-        session = await get_http_session()
-        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-            remaining_calls_per_day = int(resp.headers.get('x-ratelimit-requests-remaining', 0))
-            log_message(f"Nombre d'appels à l'api restants : {remaining_calls_per_day}")
-
-            if remaining_calls_per_day < 3:
-                log_message(f"#####\nLe nombre d'appels à l'API est dépassé. Le suivi du match est stoppé.\n#####", "WARNING")
-                await notify_users_max_api_requests_reached()
-                raise RateLimitExceededError("Le nombre d'appels maximum à l'API est dépassé.")
-
+        # Les prédictions sont facultatives : le registre de quota les refuse si elles
+        # menacent la réserve du suivi live
+        async with api_football_request(url, 'predictions') as resp:
             resp.raise_for_status()
             data = await resp.json()
 
@@ -787,14 +1532,15 @@ async def get_match_predictions(fixture_id):
 
             return data['response'][0]['predictions']
 
+    except QuotaReservedError as e:
+        log_message(f"Prédictions non récupérées : {e}", "WARNING")
+        return None
     except asyncio.TimeoutError:
         log_message(f"Timeout lors de la récupération des prédictions pour fixture {fixture_id}", "ERROR")
         return None
     except aiohttp.ClientError as e:
         log_message(f"Erreur réseau dans get_match_predictions: {e}", "ERROR")
         return None
-    except RateLimitExceededError:
-        raise
     except KeyError as e:
         log_message(f"Données manquantes dans la réponse API (get_match_predictions): {e}", "ERROR")
         return None
@@ -802,38 +1548,64 @@ async def get_match_predictions(fixture_id):
         log_message(f"Erreur inattendue dans get_match_predictions: {e}", "ERROR")
         return None
 
+# Délais maximaux (secondes, depuis le lancement des appels d'avant-match) des sources
+# facultatives de l'analyse de compo. Passé ce délai, l'analyse part sans la source.
+PREMATCH_SOURCE_DEADLINES = {"predictions": 8.0, "season_stats": 10.0}
+
+# Récupération unique des stats de saison de notre équipe pour la ligue du match (1 seul appel API par match).
+# Mises en cache dans tracker.season_stats pour réutilisation par
+# call_chatgpt_api_compomatch (analyse de début), call_chatgpt_api_endmatch (analyse de fin)
+# et le bloc d'affichage en fin de match. Si l'appel arrive après le délai de la compo,
+# les stats restent disponibles pour la fin de match.
+async def load_season_stats(tracker):
+    try:
+        if tracker.league_id and tracker.team_id and SEASON_ID:
+            tracker.season_stats = await get_team_season_statistics(tracker.league_id, tracker.team_id, SEASON_ID)
+            log_message(f"Stats de saison récupérées et mises en cache : {bool(tracker.season_stats)}")
+    except Exception as e:
+        log_message(f"Erreur lors de la récupération des stats de saison : {e}", "ERROR")
+        tracker.season_stats = None
+    return tracker.season_stats
+
+# Attend une source facultative d'avant-match jusqu'à son délai ; la tâche continue en fond au-delà
+async def await_prematch_source(task, name, started_at):
+    deadline = PREMATCH_SOURCE_DEADLINES[name]
+    remaining = max(0.0, deadline - (time.monotonic() - started_at))
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout=remaining)
+    except asyncio.TimeoutError:
+        log_message(f"Source d'avant-match '{name}' hors délai ({deadline}s), analyse de compo lancée sans elle", "WARNING")
+        return None
+
 #Fonction qui permet de vérifier quand le match démarre réellement par rapport à l'heure prévu en vérifiant si le match a toujours lieu!
-async def wait_for_match_start(fixture_id, teams=None, league=None, round_info=None, venue=None, city=None):
+async def wait_for_match_start(tracker):
     log_message(f"fonction wait_for_match_start appelée")
+    fixture_id = tracker.fixture_id
 
-    # Récupérer les prédictions avant d'envoyer le message de compo (uniquement avec l'api payante car call limité avec gratuit)
-    predictions = None
-    if IS_PAID_API:
-        predictions = await get_match_predictions(fixture_id)
-        if predictions:
-            log_message(f"Prédictions obtenues : {predictions}")
+    # Les appels d'avant-match sont indépendants : ils partent en parallèle et la compo
+    # n'attend que ce dont elle a besoin (le statut/compo), les sources facultatives
+    # ayant chacune leur délai.
+    started_at = time.monotonic()
+    tracker.season_stats = None
+    season_stats_task = create_background_task(load_season_stats(tracker), f"season_stats_{fixture_id}")
+    # Prédictions uniquement avec l'api payante car call limité avec gratuit
+    predictions_task = create_background_task(get_match_predictions(fixture_id), f"predictions_{fixture_id}") if IS_PAID_API else None
 
     # Permet d'envoyer la compo à l'heure du début du match prévue avant que le match commence réellement ! Attention coûte un appel API en plus !
     match_status, match_date, elapsed_time, match_data = await get_check_match_status(fixture_id)
     # Note : On peut potentiellement vérifier ici (actuellement pas le cas) si la compo renvoyée par get_check_match_status et pas none et on pourrait retenter 5 minutes plus tard en mettant le script sur pause uniquement si paid api ?!
     log_message(f"match_status: {match_status}, match_date: {match_date}, elapsed_time: {elapsed_time} et \n [DEBUG] match data :\n {match_data}\n\n")
 
-    # Récupération unique des stats de saison de notre équipe pour la ligue du match (1 seul appel API par match).
-    # Mises en cache dans la variable globale current_season_stats pour réutilisation par
-    # call_chatgpt_api_compomatch (analyse de début), call_chatgpt_api_endmatch (analyse de fin)
-    # et le bloc d'affichage en fin de match.
-    global current_season_stats, current_league_id
-    current_season_stats = None
-    try:
-        if current_league_id and TEAM_ID and SEASON_ID:
-            current_season_stats = await get_team_season_statistics(current_league_id, TEAM_ID, SEASON_ID)
-            log_message(f"Stats de saison récupérées et mises en cache : {bool(current_season_stats)}")
-    except Exception as e:
-        log_message(f"Erreur lors de la récupération des stats de saison : {e}", "ERROR")
-        current_season_stats = None
+    predictions = None
+    if predictions_task is not None:
+        predictions = await await_prematch_source(predictions_task, "predictions", started_at)
+        if predictions:
+            log_message(f"Prédictions obtenues : {predictions}")
+    await await_prematch_source(season_stats_task, "season_stats", started_at)
+    log_message(f"Données d'avant-match prêtes en {time.monotonic() - started_at:.2f}s")
 
     log_message(f"Envoie du message de compo de match avec send_compo_message")
-    await send_compo_message(match_data, predictions, fixture_id, teams, league, round_info, venue, city)
+    await send_compo_message(match_data, predictions, tracker)
 
     while True:
         match_status, match_date, elapsed_time, match_data = await get_check_match_status(fixture_id)
@@ -852,13 +1624,11 @@ async def wait_for_match_start(fixture_id, teams=None, league=None, round_info=N
     # Retourner None si le match est reporté ou annulé
     if match_status in ('PST', 'CANC', 'ABD'):
         log_message(f"Le statut du match indique qu'il a été annulé ou reporté")  
-        message = f"🤖 : Le statut du match indique qu'il a été annulé ou reporté"
-        await send_message_to_all_chats(message)
+        await send_message_to_all_chats(lambda language: t("match_cancelled", language))
         return None, None, None, None
     elif match_status in ('AWD', 'WO'):
         log_message(f"Défaite technique ou victoire par forfait ou absence de compétiteur")
-        message = f"🤖 : Défaite technique ou victoire par forfait ou absence de compétiteur"
-        await send_message_to_all_chats(message)
+        await send_message_to_all_chats(lambda language: t("match_forfeit", language))
         return None, None, None, None
     else:
         log_message(f"match_status: {match_status}, match_date: {match_date}, elapsed_time: {elapsed_time}, match_data (pas log)\n")  
@@ -868,25 +1638,12 @@ async def wait_for_match_start(fixture_id, teams=None, league=None, round_info=N
 async def get_check_match_status(fixture_id, max_retries=3):
     log_message("get_check_match_status() appelée.")
     url = f"https://v3.football.api-sports.io/fixtures?id={fixture_id}"
-    headers = {
-        "x-apisports-key": API_FOOTBALL_KEY
-    }
 
     for attempt in range(max_retries):
         try:
-            session = await get_http_session()
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                # Vérifiez le nombre d'appels restants par jour
-                remaining_calls_per_day = int(resp.headers.get('x-ratelimit-requests-remaining', 0))
-                log_message(f"Nombre d'appels à l'api restants : {remaining_calls_per_day}")
-
-                #Permet de sortir si on reste bloqué dans cette fonction pour x raisons
-                #3 car on check 3 league à la sortie
-                if remaining_calls_per_day < 3:
-                    log_message(f"#####\nLe nombre d'appels à l'API est dépassé. Le suivi du match est stoppé.\n#####")
-                    await notify_users_max_api_requests_reached()
-                    raise RateLimitExceededError("Le nombre d'appels maximum à l'API est dépassé.")
-
+            # Le registre de quota lève RateLimitExceededError si le quota est épuisé,
+            # ce qui permet de sortir si on reste bloqué dans cette fonction pour x raisons
+            async with api_football_request(url, 'status') as resp:
                 # Vérifier le code de statut HTTP
                 if resp.status != 200:
                     log_message(f"Erreur HTTP {resp.status} de l'API football (tentative {attempt + 1}/{max_retries})")
@@ -907,6 +1664,8 @@ async def get_check_match_status(fixture_id, max_retries=3):
             match_status = fixture['fixture']['status']['short']
             match_date = datetime.datetime.strptime(fixture['fixture']['date'], '%Y-%m-%dT%H:%M:%S%z').astimezone(server_timezone)
             elapsed_time = fixture['fixture']['status']['elapsed']
+            # Un match déplacé ou reporté invalide le calendrier de la saison
+            fixture_schedule.note_kickoff(fixture_id, match_date, match_status)
             # Récupérez match_data à partir de la variable fixture
             match_data = {
                         "teams": {
@@ -978,162 +1737,704 @@ async def get_check_match_status(fixture_id, max_retries=3):
     log_message(f"Tous les {max_retries} appels à l'API football ont échoué")
     return None, None, None, None
 
-# Fonction asynchrone pour vérifier s'il y a un match aujourd'hui et retourner les informations correspondantes avec retry.
+# Prochain match d'une équipe suivie dans une ligue (next=1), avec retry et backoff propres à cette ligue.
+# Renvoie (data, api_call_succeeded) ; data vaut None si aucun match à venir ou en cas d'échec.
+async def fetch_next_league_fixture(team_id, league_id, max_retries=3):
+    url = f"https://v3.football.api-sports.io/fixtures?team={team_id}&league={league_id}&next=1"
+    for attempt in range(max_retries):
+        try:
+            async with api_football_request(url, 'schedule') as resp:
+                if resp.status == 200:
+                    # L'API a répondu correctement, qu'il y ait un match à venir ou non.
+                    data = await resp.json()
+                    if data.get('response'):
+                        return data, True
+                    # 200 OK mais response vide = pas de prochain match dans cette ligue
+                    # (typiquement : fin de saison / intersaison). Pas une erreur.
+                    log_message(f"Aucun match à venir pour la ligue {league_id} (API OK, response vide).")
+                    return None, True
+                elif resp.status >= 500 and attempt < max_retries - 1:
+                    log_message(f"Erreur serveur {resp.status} pour la ligue {league_id}, retry...")
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                elif resp.status == 429 and attempt < max_retries - 1:
+                    log_message(f"Rate limit pour la ligue {league_id}, attente...")
+                    await asyncio.sleep(5 * (2 ** attempt))
+                    continue
+                log_message(f"Erreur HTTP {resp.status} pour la ligue {league_id} (tentative {attempt + 1}/{max_retries})")
+                return None, False
+        except asyncio.TimeoutError:
+            log_message(f"Timeout pour la ligue {league_id} (tentative {attempt + 1}/{max_retries})")
+        except QuotaReservedError as e:
+            log_message(f"Ligue {league_id} non vérifiée : {e}", "WARNING")
+            return None, False
+        except aiohttp.ClientError as e:
+            log_message(f"Erreur réseau pour la ligue {league_id} (tentative {attempt + 1}/{max_retries}): {e}")
+        except Exception as e:
+            log_message(f"Erreur inattendue pour la ligue {league_id} (tentative {attempt + 1}/{max_retries}): {e}")
+        if attempt < max_retries - 1:
+            await asyncio.sleep(2 ** attempt)
+    return None, False
+
+# Fonction asynchrone pour vérifier s'il y a des matchs aujourd'hui et retourner les informations correspondantes avec retry.
+# Chaque (équipe suivie, ligue) est interrogée en parallèle : une ligue lente ou en retry ne retarde plus les autres.
+# Renvoie la liste des matchs du jour : (match_start_time, fixture_id, league_id, teams, league, round_info, venue, city, team_id, team_name).
 async def is_match_today(max_retries=3):
     log_message("is_match_today() appelée.")
-    responses = []
-    # déclaration de la variable comme globale
-    global current_league_id
-    # Variable pour stocker l'ID de la ligue en cours de traitement
-    current_league_id = None
+    queries = [(team_id, team_name, league_id) for team_id, team_name in FOLLOWED_TEAMS for league_id in LEAGUE_IDS]
+    results = await asyncio.gather(*(fetch_next_league_fixture(team_id, league_id, max_retries) for team_id, _, league_id in queries))
+    # Réponses non vides, avec l'équipe et la ligue qui les ont renvoyées (dans l'ordre de FOLLOWED_TEAMS puis LEAGUE_IDS)
+    responses = [(query, data) for query, (data, _) in zip(queries, results) if data]
     # Flag pour distinguer "API OK mais aucun match programmé" (fin de saison / intersaison)
     # de "API réellement indisponible" (5xx, timeout, réseau...). Sans ce flag, le bot
     # spammait quotidiennement les chats avec "API indisponible" pendant toute l'intersaison.
-    api_call_succeeded = False
-
-    for attempt in range(max_retries):
-        try:
-            session = await get_http_session()
-            for LEAGUE_ID in LEAGUE_IDS:
-                url = f"https://v3.football.api-sports.io/fixtures?team={TEAM_ID}&league={LEAGUE_ID}&next=1"
-                headers = {
-                    "x-apisports-key": API_FOOTBALL_KEY
-                }
-                try:
-                    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                        if resp.status == 200:
-                            # L'API a répondu correctement, qu'il y ait un match à venir ou non.
-                            api_call_succeeded = True
-                            data = await resp.json()
-                            if data.get('response'):
-                                responses.append(data)
-                                current_league_id = LEAGUE_ID
-                            else:
-                                # 200 OK mais response vide = pas de prochain match dans cette ligue
-                                # (typiquement : fin de saison / intersaison). Pas une erreur.
-                                log_message(f"Aucun match à venir pour la ligue {LEAGUE_ID} (API OK, response vide).")
-                        elif resp.status >= 500 and attempt < max_retries - 1:
-                            log_message(f"Erreur serveur {resp.status} pour la ligue {LEAGUE_ID}, retry...")
-                            await asyncio.sleep(2 ** attempt)
-                            continue
-                        elif resp.status == 429 and attempt < max_retries - 1:
-                            log_message(f"Rate limit pour la ligue {LEAGUE_ID}, attente...")
-                            await asyncio.sleep(5 * (2 ** attempt))
-                            continue
-                except asyncio.TimeoutError:
-                    log_message(f"Timeout pour la ligue {LEAGUE_ID} (tentative {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
-                except aiohttp.ClientError as e:
-                    log_message(f"Erreur réseau pour la ligue {LEAGUE_ID} (tentative {attempt + 1}/{max_retries}): {e}")
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
-
-            # Si on a au moins une réponse OU si l'API a répondu correctement (même vide),
-            # pas besoin de relancer un retry — il n'y a juste pas de match.
-            if responses or api_call_succeeded:
-                break
-        except Exception as e:
-            log_message(f"Erreur inattendue dans is_match_today (tentative {attempt + 1}/{max_retries}): {e}")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-                continue
+    api_call_succeeded = any(succeeded for _, succeeded in results)
 
     if not responses:
         if api_call_succeeded:
             # Cas normal en intersaison / fin de saison : aucune ligue surveillée n'a de match programmé.
             # On NE notifie PAS les utilisateurs (sinon spam quotidien pendant des semaines).
-            log_message("Aucun match programmé pour l'équipe dans les ligues surveillées (API OK). Probablement hors saison.")
+            log_message("Aucun match programmé pour les équipes suivies dans les ligues surveillées (API OK). Probablement hors saison.")
         else:
             log_message(f"Impossible de récupérer les matchs après {max_retries} tentatives - API réellement indisponible")
-            await send_message_to_all_chats("🤖 : Impossible de vérifier les matchs. L'API football est indisponible. Veuillez réessayer plus tard.")
-        return False, None, None, None, None, None, None, None, None
-
-    match_today = False
-    match_start_time = None
-    fixture_id = None
-
-    # Ajout de nouvelles variables pour les informations supplémentaires
-    teams = None
-    league = None
-    round_info = None
-    venue = None
-    city = None
+            await send_message_to_all_chats(lambda language: t("api_unavailable", language))
+        return []
 
-    for response in responses:
+    # Date du jour dans le fuseau configuré (et non celui de l'OS)
+    today = datetime.datetime.now(server_timezone).date()
+    matches_today = []
+    seen_fixtures = set()
+    for (team_id, team_name, league_id), response in responses:
         if response['results'] > 0:
             fixture_data = response['response'][0]['fixture']
             league_data = response['response'][0]['league']
             teams_data = response['response'][0]['teams']
             venue_data = fixture_data['venue']
 
-            match_date = datetime.datetime.strptime(fixture_data['date'], '%Y-%m-%dT%H:%M:%S%z')
-            match_date = match_date.astimezone(server_timezone)
-            match_date = match_date.date()
-            # Date du jour dans le fuseau configuré (et non celui de l'OS)
-            today = datetime.datetime.now(server_timezone).date()
-
-            if match_date == today:
-                match_today = True
-                match_start_datetime = datetime.datetime.strptime(fixture_data['date'], '%Y-%m-%dT%H:%M:%S%z')
-                match_start_datetime = match_start_datetime.astimezone(server_timezone)
-                match_start_time = match_start_datetime.time()
-                fixture_id = fixture_data['id']
+            match_start_datetime = datetime.datetime.strptime(fixture_data['date'], '%Y-%m-%dT%H:%M:%S%z')
+            match_start_datetime = match_start_datetime.astimezone(server_timezone)
 
-                # Extraction des informations supplémentaires
+            # Deux équipes suivies qui s'affrontent : un seul suivi, pour la première équipe de TEAM_IDS
+            if match_start_datetime.date() == today and fixture_data['id'] not in seen_fixtures:
+                seen_fixtures.add(fixture_data['id'])
                 teams = {
                     "home": teams_data['home']['name'],
                     "away": teams_data['away']['name']
                 }
-                league = league_data['name']
-                round_info = league_data['round']
-                venue = venue_data['name']
-                city = venue_data['city']
-                break
+                # Ligue du match trouvé (et non la dernière ligue ayant répondu)
+                matches_today.append((match_start_datetime.time(), fixture_data['id'], league_id, teams,
+                                      league_data['name'], league_data['round'], venue_data['name'], venue_data['city'],
+                                      team_id, team_name))
+
+    return matches_today
+
+### DEBUT DE GESTION DU PLANNING ADAPTATIF DU POLLING (API GRATUITE)
+
+# Avec 100 requêtes/jour, un intervalle fixe dépense autant de polls à la 20e minute
+# qu'à la 89e ou dans le temps additionnel. Ici on répartit le quota restant réel sur
+# les minutes de jeu restantes, pondérées par leur "valeur" (probabilité qu'un événement
+# important y soit annoncé en retard) : fin de chaque mi-temps, temps additionnel,
+# prolongation et minutes qui suivent un but sont interrogées plus souvent.
+POLL_MIN_INTERVAL = 20  # secondes (le tier gratuit limite aussi à 10 requêtes/minute)
+POLL_MAX_INTERVAL = 300
+# Appels gardés en réserve : reprise après la mi-temps, tirs au but, fin de match,
+# stats de saison en repli et check du lendemain.
+POLL_QUOTA_RESERVE = 8
+# La prolongation n'a lieu que dans une minorité des matchs à élimination directe :
+# tant qu'on n'y est pas, ses minutes ne comptent que pour cette fraction du budget.
+EXTRA_TIME_PROBABILITY = 0.3
+
+def _remaining_match_minutes(match_status, elapsed_time, has_extra_time):
+    """Renvoie la liste (phase, minute) des minutes de jeu restantes attendues."""
+    elapsed = elapsed_time or 0
+    timeline = []
+    if match_status in (None, 'TBD', 'NS', '1H'):
+        # 45 minutes + ~3 minutes de temps additionnel, puis la 2e mi-temps
+        timeline += [('1H', m) for m in range(max(elapsed, 0), 48)]
+        timeline += [('2H', m) for m in range(45, 95)]
+    elif match_status == 'HT':
+        timeline += [('2H', m) for m in range(45, 95)]
+    elif match_status == '2H':
+        timeline += [('2H', m) for m in range(max(elapsed, 45), 95)]
+
+    if has_extra_time:
+        if match_status in ('ET', 'BT'):
+            timeline += [('ET', m) for m in range(max(elapsed, 90), 123)]
+        elif match_status in (None, 'TBD', 'NS', '1H', 'HT', '2H'):
+            timeline += [('ET?', m) for m in range(90, 123)]
+
+    # Temps additionnel plus long que prévu : au moins la minute courante
+    if not timeline:
+        timeline.append((match_status, elapsed))
+    return timeline
+
+def _poll_window_weight(phase, minute, last_goal_minute=None):
+    """Poids relatif d'une minute de jeu dans la répartition du quota."""
+    if phase == '1H':
+        weight = 3.0 if minute >= 45 else 2.5 if minute >= 40 else 1.0
+    elif phase == '2H':
+        weight = 3.0 if minute >= 90 else 2.5 if minute >= 80 else 1.0
+    elif phase in ('ET', 'ET?'):
+        weight = 3.0 if minute >= 118 else 2.0
+    else:
+        weight = 1.0
+
+    # Juste après un but : VAR, correction du buteur ou but en rafale sont fréquents
+    if last_goal_minute is not None and 0 <= minute - last_goal_minute <= 5:
+        weight = max(weight, 2.0)
+
+    if phase == 'ET?':
+        weight *= EXTRA_TIME_PROBABILITY
+    return weight
+
+def compute_adaptive_poll_interval(match_status, elapsed_time, has_extra_time, remaining_calls, last_goal_minute=None):
+    """
+    Intervalle (secondes) avant le prochain poll live en API gratuite.
+    Le budget = quota restant - réserve est réparti sur les minutes restantes au
+    prorata de leur poids ; l'intervalle de la minute courante en découle.
+    """
+    budget = remaining_calls - POLL_QUOTA_RESERVE
+    if budget <= 0:
+        log_message(f"[POLL_PLAN] Quota restant ({remaining_calls}) sous la réserve, intervalle maximal", "WARNING")
+        return POLL_MAX_INTERVAL
+
+    timeline = _remaining_match_minutes(match_status, elapsed_time, has_extra_time)
+    total_weight = sum(_poll_window_weight(phase, minute, last_goal_minute) for phase, minute in timeline)
+    current_phase, current_minute = timeline[0]
+    current_weight = _poll_window_weight(current_phase, current_minute, last_goal_minute)
+
+    # polls par minute pondérée = budget / total_weight ; la minute courante en reçoit current_weight fois plus
+    interval = 60 * total_weight / (budget * current_weight)
+    interval = max(POLL_MIN_INTERVAL, min(POLL_MAX_INTERVAL, interval))
+    log_message(f"[POLL_PLAN] statut={match_status}, minute={elapsed_time}, quota restant={remaining_calls}, "
+                f"minutes restantes={len(timeline)}, poids courant={current_weight:.2f}, intervalle={interval:.0f}s")
+    return interval
+
+### FIN DE GESTION DU PLANNING ADAPTATIF DU POLLING (API GRATUITE)
+
+### DEBUT DE GESTION DES REPRESENTATIONS TYPEES DU DIRECT
+
+# Les réponses /fixtures sont décodées une seule fois par réponse en objets compacts
+# (__slots__) qui ne gardent que les champs utilisés par gptfoot : le dict brut (lineups,
+# logos, photos...) n'est pas conservé pendant tout le match et la boucle live accède
+# aux champs par attribut au lieu de re-parcourir des dicts imbriqués.
+class MatchEvent:
+    """Événement d'un match en direct (but, carton, remplacement, VAR...)."""
+    __slots__ = ("type", "detail", "elapsed", "extra", "team_id", "team_name",
+                 "player_id", "player_name", "assist_name", "comments")
+
+    def __init__(self, type, detail, elapsed, extra, team_id, team_name, player_id, player_name,
+                 assist_name=None, comments=None):
+        self.type = type
+        self.detail = detail
+        self.elapsed = elapsed
+        self.extra = extra
+        self.team_id = team_id
+        self.team_name = team_name
+        self.player_id = player_id
+        self.player_name = player_name
+        self.assist_name = assist_name
+        self.comments = comments
+
+    @classmethod
+    def from_api(cls, event):
+        event_time = event.get('time') or {}
+        team = event.get('team') or {}
+        player = event.get('player') or {}
+        assist = event.get('assist') or {}
+        return cls(event.get('type'), event.get('detail') or '', event_time.get('elapsed'), event_time.get('extra'),
+                   team.get('id'), team.get('name'), player.get('id'), player.get('name'),
+                   assist.get('name'), event.get('comments'))
+
+    def _fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, MatchEvent) and self._fields() == other._fields()
+
+    def describe(self):
+        """Description lisible de l'événement (logs et prompts)."""
+        minute = f"{self.elapsed}+{self.extra}" if self.extra else f"{self.elapsed}"
+        description = f"{self.type} ({self.detail}) à la {minute}e minute, {self.team_name} - {self.player_name}"
+        if self.assist_name:
+            description += f", passe décisive : {self.assist_name}"
+        if self.comments:
+            description += f", commentaire : {self.comments}"
+        return description
+
+    def __repr__(self):
+        return f"MatchEvent({self.describe()})"
+
+class MatchSnapshot:
+    """
+    Réponse /fixtures d'un match en direct. Contient aussi l'index des statistiques
+    par joueur (player_id -> statistics) et le côté de chaque équipe, construits une
+    seule fois au décodage et partagés par tous les événements du poll.
+    events vaut None si la réponse ne les contenait pas.
+    """
+    __slots__ = ("fixture_id", "status", "elapsed", "home_id", "home_name", "away_id", "away_name",
+                 "home_goals", "away_goals", "fulltime_home", "fulltime_away", "events",
+                 "statistics", "player_statistics")
+
+    def __init__(self, fixture_id, status, elapsed, home_id, home_name, away_id, away_name,
+                 home_goals, away_goals, fulltime_home=None, fulltime_away=None, events=None,
+                 statistics=(), player_statistics=None):
+        self.fixture_id = fixture_id
+        self.status = status
+        self.elapsed = elapsed
+        self.home_id = home_id
+        self.home_name = home_name
+        self.away_id = away_id
+        self.away_name = away_name
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.fulltime_home = fulltime_home
+        self.fulltime_away = fulltime_away
+        self.events = events
+        # Statistiques du match : tuple de (type, valeur domicile, valeur extérieur)
+        self.statistics = statistics
+        self.player_statistics = player_statistics if player_statistics is not None else {}
+
+    @classmethod
+    def from_api(cls, match_info):
+        fixture_data = match_info['fixture']
+        status = fixture_data.get('status') or {}
+        teams = match_info.get('teams') or {}
+        home = teams.get('home') or {}
+        away = teams.get('away') or {}
+        goals = match_info.get('goals') or {}
+        fulltime = (match_info.get('score') or {}).get('fulltime') or {}
+
+        events = None
+        if 'events' in match_info:
+            events = tuple(MatchEvent.from_api(event) for event in match_info['events'] or [])
+
+        # Absentes des réponses /fixtures?live= (présentes dans le payload complet, dont celui de fin de match)
+        statistics = ()
+        team_statistics = match_info.get('statistics') or []
+        if len(team_statistics) >= 2:
+            statistics = tuple(
+                (home_stat.get('type'), home_stat.get('value'), away_stat.get('value'))
+                for home_stat, away_stat in zip(team_statistics[0].get('statistics') or [], team_statistics[1].get('statistics') or [])
+                if 'type' in home_stat and 'value' in home_stat
+            )
+
+        player_statistics = {}
+        for team_data in match_info.get('players') or []:
+            for player_stats in team_data.get('players') or []:
+                player = player_stats.get('player') or {}
+                if player.get('id') is not None:
+                    player_statistics.setdefault(player['id'], player_stats.get('statistics'))
+
+        return cls(fixture_data['id'], status.get('short'), status.get('elapsed'),
+                   home.get('id'), home.get('name'), away.get('id'), away.get('name'),
+                   goals.get('home'), goals.get('away'), fulltime.get('home'), fulltime.get('away'),
+                   events, statistics, player_statistics)
+
+    def with_events(self, events):
+        """Copie du snapshot avec les événements récupérés à part (/fixtures/events)."""
+        snapshot = MatchSnapshot(*(getattr(self, name) for name in self.__slots__))
+        snapshot.events = tuple(events)
+        return snapshot
+
+    def _fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, MatchSnapshot) and self._fields() == other._fields()
+
+    def live_fields(self):
+        """Champs qui évoluent en direct, comparés entre sonde légère et payload complet."""
+        return (self.status, self.elapsed, self.home_goals, self.away_goals,
+                self.fulltime_home, self.fulltime_away, self.events)
+
+    def score(self):
+        return {'home': self.home_goals, 'away': self.away_goals}
+
+    def score_string(self):
+        return f"{self.home_name} {self.home_goals} - {self.away_goals} {self.away_name}"
+
+    def statistics_for(self, player_id):
+        return self.player_statistics.get(player_id)
+
+    def side_of(self, team_id):
+        if team_id is not None and team_id == self.home_id:
+            return 'home'
+        if team_id is not None and team_id == self.away_id:
+            return 'away'
+        return None
+
+    def __repr__(self):
+        return f"MatchSnapshot(fixture_id={self.fixture_id}, status={self.status}, elapsed={self.elapsed}, score={self.score_string()})"
+
+def decode_fixtures_response(response):
+    return [MatchSnapshot.from_api(match_info) for match_info in response]
+
+def decode_events_response(response):
+    return tuple(MatchEvent.from_api(event) for event in response)
+
+### FIN DE GESTION DES REPRESENTATIONS TYPEES DU DIRECT
+
+### DEBUT DE GESTION DU POLLING GROUPE DES MATCHS EN DIRECT
+
+# api-football accepte jusqu'à 20 fixtures dans un seul appel /fixtures?ids=a-b-c.
+# Quand plusieurs matchs suivis sont en direct en même temps, un seul appel rafraîchit
+# donc tous les matchs : chaque tracker reçoit sa propre tranche de la réponse.
+LIVE_BATCH_MAX_IDS = 20
+# Âge maximal (secondes) d'une tranche déjà reçue pour qu'un autre tracker la réutilise
+# sans refaire d'appel : environ la moitié de l'intervalle de polling. Un tracker ne réutilise
+# jamais la tranche de son propre appel précédent (son intervalle planifié doit être respecté).
+LIVE_SNAPSHOT_MAX_AGE = 7 if IS_PAID_API else 45
+# Statuts de fin de match : le payload complet (statistiques, joueurs) est alors nécessaire
+FINISHED_STATUSES = ('FT', 'AET', 'PEN')
+# Matchs actuellement en phase de polling live (enregistrés par run_match_tracker) : fixture_id -> league_id
+live_fixture_ids = {}
+# Dernière réponse reçue par match : fixture_id -> {"received_at", "snapshot", "revision", "full", "fetched_by"}.
+# La révision n'augmente que si le contenu du match a réellement changé ; "full" indique
+# un payload /fixtures?ids= complet (lineups, joueurs, statistiques) et non une sonde légère ;
+# "fetched_by" est le match dont le poll a déclenché l'appel.
+_live_snapshots = {}
+# Un seul appel groupé à la fois : les trackers qui arrivent pendant un appel en vol
+# attendent sa réponse au lieu de lancer le leur.
+_live_batch_lock = asyncio.Lock()
+# Empreinte de la dernière réponse par requête : la plupart des polls renvoient
+# exactement les mêmes données. Si le corps brut est identique (ou si l'API répond 304
+# grâce à ETag/Last-Modified), on saute le décodage JSON et le tracker saute le diff
+# des événements.
+_live_fingerprints = {}
+# Compteurs du polling live (process entier)
+live_poll_stats = {"requests": 0, "not_modified": 0, "unchanged_body": 0, "decoded": 0,
+                   "slim": 0, "full": 0, "bytes": 0}
+
+# Appel live générique avec empreinte de réponse. La réponse est décodée (decode) une seule
+# fois et gardée sous forme décodée tant que le corps ne change pas.
+# Renvoie (response, changed) ; changed vaut False si la réponse est identique à la précédente.
+async def _fetch_live_payload(url, cache_key, decode):
+    previous = _live_fingerprints.get(cache_key)
+    conditional_headers = {}
+    if previous is not None:
+        if previous["etag"]:
+            conditional_headers["If-None-Match"] = previous["etag"]
+        if previous["last_modified"]:
+            conditional_headers["If-Modified-Since"] = previous["last_modified"]
+
+    async with api_football_request(url, 'live', conditional_headers) as resp:
+        live_poll_stats["requests"] += 1
+        if resp.status == 304 and previous is not None:
+            live_poll_stats["not_modified"] += 1
+            return previous["response"], False
+
+        resp.raise_for_status()
+        body = await resp.read()
+        live_poll_stats["bytes"] += len(body)
+        body_hash = hashlib.blake2b(body, digest_size=16).hexdigest()
+        if previous is not None and previous["hash"] == body_hash:
+            live_poll_stats["unchanged_body"] += 1
+            return previous["response"], False
+
+        data = json.loads(body)
+        live_poll_stats["decoded"] += 1
+        response = decode(data.get('response') or [])
+        _live_fingerprints[cache_key] = {
+            "hash": body_hash,
+            "etag": resp.headers.get('ETag'),
+            "last_modified": resp.headers.get('Last-Modified'),
+            "response": response
+        }
+        return response, True
+
+# Payload complet /fixtures?ids= pour une liste d'au plus LIVE_BATCH_MAX_IDS matchs
+async def fetch_fixtures_batch(fixture_ids):
+    ids_param = "-".join(str(fixture_id) for fixture_id in fixture_ids)
+    log_message(f"Appel groupé /fixtures (payload complet) pour {len(fixture_ids)} match(s) : {ids_param}")
+    live_poll_stats["full"] += 1
+    return await _fetch_live_payload(f"https://v3.football.api-sports.io/fixtures?ids={ids_param}", f"ids:{ids_param}", decode_fixtures_response)
+
+# Sonde légère d'un match : ses événements seuls (/fixtures/events?fixture=), quelques centaines
+# d'octets contre plusieurs dizaines de Ko pour le payload complet (lineups, joueurs, statistiques)
+async def fetch_live_events_probe(fixture_id):
+    log_message(f"Sonde live légère /fixtures/events pour le match {fixture_id}")
+    live_poll_stats["slim"] += 1
+    return await _fetch_live_payload(f"https://v3.football.api-sports.io/fixtures/events?fixture={fixture_id}", f"events:{fixture_id}", decode_events_response)
+
+# Le contenu est comparé aux données décodées et non au corps de la réponse : la sonde légère et
+# le payload complet ont chacun leur empreinte, et passer de l'un à l'autre ne doit pas être vu
+# comme un changement (seuls les champs communs aux deux sont alors comparés)
+def _snapshot_changed(previous, snapshot, full):
+    if previous["full"] == full:
+        return previous["snapshot"] != snapshot
+    return previous["snapshot"].live_fields() != snapshot.live_fields()
+
+def _store_live_snapshot(fixture_id, snapshot, changed, received_at, full, fetched_by):
+    previous = _live_snapshots.get(fixture_id)
+    if previous is None:
+        revision = 1
+    elif (changed or previous["full"] != full) and _snapshot_changed(previous, snapshot, full):
+        revision = previous["revision"] + 1
+    else:
+        revision = previous["revision"]
+    # Dernier payload complet : base du statut, de la minute et du score des sondes suivantes
+    if full:
+        full_snapshot, full_received_at = snapshot, received_at
+    elif previous is not None:
+        full_snapshot, full_received_at = previous["full_snapshot"], previous["full_received_at"]
+    else:
+        full_snapshot, full_received_at = None, None
+    _live_snapshots[fixture_id] = {"received_at": received_at, "snapshot": snapshot, "revision": revision, "full": full,
+                                   "fetched_by": fetched_by, "full_snapshot": full_snapshot,
+                                   "full_received_at": full_received_at}
+
+def _goal_signature(snapshot):
+    """Buts publiés dans les événements (minute, joueur, équipe)."""
+    return tuple((event.elapsed, event.player_id, event.team_id) for event in snapshot.events or () if event.type == 'Goal')
+
+# La sonde ne donne ni statut, ni minute, ni score : elle n'est utilisée que tant que le statut
+# ne peut pas changer, c'est-à-dire avant la 45e minute en 1re mi-temps et avant la 90e en 2e.
+# Ailleurs (premier poll, approche de la pause ou de la fin, mi-temps, prolongation, tirs au but,
+# interruption) le payload complet est demandé directement. Chaque poll coûte donc un appel,
+# sauf celui où la sonde voit un but apparaître, changer ou disparaître : le payload complet
+# (score, statistiques du buteur) est alors demandé dans la foulée, soit 2 appels pour ce poll.
+LIVE_SLIM_WINDOWS = {'1H': 45, '2H': 90}
+# Resynchronisation du statut, de la minute et du score par un payload complet au moins toutes les N secondes
+LIVE_FULL_REFRESH_INTERVAL = 300
+
+def _estimated_elapsed(cached, now):
+    """Minute de jeu estimée depuis le dernier payload complet."""
+    base = cached["full_snapshot"]
+    return base.elapsed + int((now - cached["full_received_at"]) // 60)
+
+def _slim_probe_allowed(cached, now):
+    if cached is None or cached["full_snapshot"] is None:
+        return False
+    if now - cached["full_received_at"] > LIVE_FULL_REFRESH_INTERVAL:
+        return False
+    base = cached["full_snapshot"]
+    window_end = LIVE_SLIM_WINDOWS.get(base.status)
+    if window_end is None or base.elapsed is None:
+        return False
+    return _estimated_elapsed(cached, now) < window_end
+
+# Rafraîchit un match via la sonde légère ; renvoie None s'il faut passer par le payload complet
+async def _refresh_live_slim(fixture_id):
+    cached = _live_snapshots.get(fixture_id)
+    if not _slim_probe_allowed(cached, time.monotonic()):
+        return None
+
+    events, changed = await fetch_live_events_probe(fixture_id)
+    received_at = time.monotonic()
+    # Statut et score du dernier payload complet, minute estimée, événements de la sonde
+    snapshot = cached["full_snapshot"].with_events(events)
+    snapshot.elapsed = _estimated_elapsed(cached, received_at)
+    # But publié, corrigé ou retiré : le score et les statistiques du buteur sont nécessaires
+    if _goal_signature(snapshot) != _goal_signature(cached["snapshot"]):
+        return None
+    _store_live_snapshot(fixture_id, snapshot, changed or snapshot.elapsed != cached["snapshot"].elapsed,
+                         received_at, full=False, fetched_by=fixture_id)
+    return snapshot
+
+# Renvoie le MatchSnapshot d'un match en direct, en groupant les matchs suivis dans un même appel
+async def fetch_live_fixture(fixture_id, max_age=LIVE_SNAPSHOT_MAX_AGE):
+    async with _live_batch_lock:
+        # Seule une tranche rapportée par le poll d'un autre match est réutilisée
+        cached = _live_snapshots.get(fixture_id)
+        if (cached is not None and cached["fetched_by"] != fixture_id
+                and time.monotonic() - cached["received_at"] <= max_age):
+            log_message(f"Réponse du match {fixture_id} réutilisée depuis le dernier appel groupé ({time.monotonic() - cached['received_at']:.1f}s)")
+            return cached["snapshot"]
+
+        # Pendant le jeu : sonde légère du match, le payload complet n'est demandé qu'en cas de besoin
+        if LIVE_SLIM_MODE:
+            snapshot = await _refresh_live_slim(fixture_id)
+            if snapshot is not None:
+                return snapshot
+
+        # Le match demandé en premier, puis les autres matchs en direct dont la tranche
+        # est la plus ancienne (ils en profiteront à leur prochain poll)
+        others = sorted(
+            (fid for fid in live_fixture_ids if fid != fixture_id),
+            key=lambda fid: _live_snapshots.get(fid, {"received_at": 0.0})["received_at"]
+        )
+        batch = [fixture_id] + others[:LIVE_BATCH_MAX_IDS - 1]
+
+        response, changed = await fetch_fixtures_batch(batch)
+        received_at = time.monotonic()
+        for snapshot in response:
+            _store_live_snapshot(snapshot.fixture_id, snapshot, changed, received_at, full=True, fetched_by=fixture_id)
+
+        cached = _live_snapshots.get(fixture_id)
+        if cached is None or cached["received_at"] != received_at:
+            return None
+        return cached["snapshot"]
+
+# Révision courante de la réponse d'un match (None si aucune réponse reçue)
+def live_snapshot_revision(fixture_id):
+    cached = _live_snapshots.get(fixture_id)
+    return cached["revision"] if cached is not None else None
+
+# Log des statistiques de polling : part des polls sans changement (ni décodage ni diff)
+def log_polling_stats(tracker=None):
+    total = live_poll_stats["requests"]
+    skipped = live_poll_stats["not_modified"] + live_poll_stats["unchanged_body"]
+    rate = (skipped / total * 100) if total else 0.0
+    log_message(f"[POLL_STATS] Appels live : {total} (sondes légères : {live_poll_stats['slim']}, payloads complets : {live_poll_stats['full']}), "
+                f"304 : {live_poll_stats['not_modified']}, corps identique : {live_poll_stats['unchanged_body']}, "
+                f"décodés : {live_poll_stats['decoded']} (taux sans décodage : {rate:.1f}%), "
+                f"octets reçus : {live_poll_stats['bytes']}")
+    if tracker is not None and tracker.polls_total:
+        diff_rate = tracker.polls_unchanged / tracker.polls_total * 100
+        log_message(f"[POLL_STATS] Match {tracker.fixture_id} : {tracker.polls_total} polls, "
+                    f"{tracker.polls_unchanged} sans changement (diff sauté : {diff_rate:.1f}%)")
+
+# Enregistre / retire un match de la liste des matchs à inclure dans les appels groupés
+def register_live_fixture(fixture_id, league_id=None):
+    live_fixture_ids[fixture_id] = league_id
+
+def unregister_live_fixture(fixture_id):
+    live_fixture_ids.pop(fixture_id, None)
+    _live_snapshots.pop(fixture_id, None)
+    # Oublier les empreintes des requêtes qui concernaient ce match
+    fixture_key = str(fixture_id)
+    for cache_key in [key for key in _live_fingerprints
+                      if key.startswith(("ids:", "events:")) and fixture_key in key.split(":", 1)[1].split("-")]:
+        del _live_fingerprints[cache_key]
+
+### FIN DE GESTION DU POLLING GROUPE DES MATCHS EN DIRECT
+
+### DEBUT DE GESTION DU DIFF DES EVENEMENTS
+
+# api-football ne fournit pas d'identifiant d'événement : un même but peut changer de
+# minute (correction), gagner son buteur après coup ou disparaître (VAR). Le moteur garde
+# la liste précédente indexée par (type, équipe, joueur) et associe chaque nouvel
+# événement à un identifiant stable, en un seul passage sur la liste.
+EVENT_ADDED = "added"
+EVENT_MODIFIED = "modified"
+EVENT_REMOVED = "removed"
+# Écart maximal (minutes) pour qu'un événement déplacé soit une correction de minute du même
+# événement ; au-delà, c'est un événement retiré puis un nouvel événement (ex: but annulé puis
+# nouveau but du même joueur)
+EVENT_MINUTE_CORRECTION_MAX = 2
+
+class EventDelta:
+    """Changement d'un événement entre deux polls (previous vaut None pour un ajout)."""
+    __slots__ = ("kind", "event_id", "event", "previous")
+
+    def __init__(self, kind, event_id, event, previous=None):
+        self.kind = kind
+        self.event_id = event_id
+        self.event = event
+        self.previous = previous
+
+    def __repr__(self):
+        return f"EventDelta({self.kind}, #{self.event_id}, {_event_base_key(self.event)}, {_event_time(self.event)})"
+
+def _event_base_key(event):
+    return (event.type, event.team_id, event.player_id)
+
+def _event_time(event):
+    return (event.elapsed, event.extra)
+
+def _is_minute_correction(previous, event):
+    if previous.elapsed is None or event.elapsed is None:
+        return False
+    return abs(event.elapsed - previous.elapsed) <= EVENT_MINUTE_CORRECTION_MAX
+
+class EventDiffEngine:
+    """
+    Diff incrémental de la liste des événements d'un match. Pour chaque groupe
+    (type, équipe, joueur), les événements sont d'abord appariés à minute identique, puis
+    dans l'ordre pour les restants dont la minute n'a bougé que de
+    EVENT_MINUTE_CORRECTION_MAX au plus (correction de minute) ; le reste est ajouté ou
+    retiré. Un doublé reste donc deux événements distincts, et un but dont la minute
+    est corrigée garde son identifiant.
+    """
+
+    def __init__(self):
+        # (type, équipe, joueur) -> liste de (identifiant, événement) de la liste précédente
+        self._groups = {}
+        self._next_id = 1
 
-    # Inclure les nouvelles informations dans la valeur de retour
-    return match_today, match_start_time, fixture_id, current_league_id, teams, league, round_info, venue, city
+    def _new_id(self):
+        event_id = self._next_id
+        self._next_id += 1
+        return event_id
+
+    def diff(self, events):
+        """Met à jour la vue indexée et renvoie les deltas, dans l'ordre de la nouvelle liste."""
+        new_groups = {}
+        for event in events:
+            new_groups.setdefault(_event_base_key(event), []).append(event)
+
+        matched = {}
+        deltas_by_position = {}
+        removed = []
+        groups = {}
+        for base_key, group_events in new_groups.items():
+            previous_entries = self._groups.get(base_key, [])
+            # Index minute -> entrées précédentes non encore appariées
+            by_time = {}
+            for entry in previous_entries:
+                by_time.setdefault(_event_time(entry[1]), []).append(entry)
+            pending_events = []
+            used_ids = set()
+            for event in group_events:
+                candidates = by_time.get(_event_time(event))
+                if candidates:
+                    entry = candidates.pop(0)
+                    matched[id(event)] = entry
+                    used_ids.add(entry[0])
+                else:
+                    pending_events.append(event)
+            # Entrées sans correspondance exacte : appariées dans l'ordre si la minute est
+            # seulement corrigée, sinon retirées (et le nouvel événement est ajouté)
+            leftovers = [entry for entry in previous_entries if entry[0] not in used_ids]
+            for event in pending_events:
+                entry = next((entry for entry in leftovers if _is_minute_correction(entry[1], event)), None)
+                if entry is not None:
+                    leftovers.remove(entry)
+                    matched[id(event)] = entry
+            for entry in leftovers:
+                removed.append(EventDelta(EVENT_REMOVED, entry[0], entry[1], entry[1]))
+
+            group_entries = []
+            for event in group_events:
+                entry = matched.get(id(event))
+                if entry is None:
+                    event_id = self._new_id()
+                    deltas_by_position[id(event)] = EventDelta(EVENT_ADDED, event_id, event)
+                else:
+                    event_id = entry[0]
+                    if entry[1] != event:
+                        deltas_by_position[id(event)] = EventDelta(EVENT_MODIFIED, event_id, event, entry[1])
+                group_entries.append((event_id, event))
+            groups[base_key] = group_entries
+
+        # Groupes entièrement disparus
+        for base_key, previous_entries in self._groups.items():
+            if base_key not in new_groups:
+                for event_id, event in previous_entries:
+                    removed.append(EventDelta(EVENT_REMOVED, event_id, event, event))
+
+        self._groups = groups
+        deltas = [deltas_by_position[id(event)] for event in events if id(event) in deltas_by_position]
+        return deltas + removed
+
+### FIN DE GESTION DU DIFF DES EVENEMENTS
 
 # Récupère les événements en direct (buts, cartons, etc.) et le statut du match pour un match donné.
 async def get_team_live_events(fixture_id):
     log_message("get_team_live_events() appelée.")
-    events_url = f"https://v3.football.api-sports.io/fixtures?id={fixture_id}"
-    headers = {
-        "x-apisports-key": API_FOOTBALL_KEY
-    }
 
     try:
-        session = await get_http_session()
-        async with session.get(events_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as events_response:
-            # Vérifiez le nombre d'appels restants par jour
-            remaining_calls_per_day = int(events_response.headers.get('x-ratelimit-requests-remaining', 0))
-            log_message(f"Nombre d'appels à l'api restants : {remaining_calls_per_day}")
-
-            # 3 car on check 3 league à la sortie
-            if remaining_calls_per_day < 3:
-                await notify_users_max_api_requests_reached()
-                log_message(f"#####\nLe nombre d'appels à l'API est dépassé. Le suivi du match est stoppé.\n#####", "WARNING")
-                raise RateLimitExceededError("Le nombre d'appels maximum à l'API est dépassé.")
-
-            events_response.raise_for_status()
-            events_data = await events_response.json()
-
-            if not events_data.get('response'):
-                log_message("Pas de réponse de l'API pour get_team_live_events", "WARNING")
-                return None, None, None, None, None
-
-            match_info = events_data['response'][0]
-            events = match_info['events']
-            match_status = match_info['fixture']['status']['short']
-            elapsed_time = match_info['fixture']['status']['elapsed']
-            match_data = match_info
-            log_message(f"Temps écoulé du match : {elapsed_time}\n")
-            match_statistics = match_info['statistics']
-
-            return events, match_status, elapsed_time, match_data, match_statistics
-                
+        snapshot = await fetch_live_fixture(fixture_id)
+
+        if not snapshot:
+            log_message("Pas de réponse de l'API pour get_team_live_events", "WARNING")
+            return None, None, None, None, None
+
+        log_message(f"Temps écoulé du match : {snapshot.elapsed}\n")
+        # Statistiques du dernier payload complet pour la sonde légère (à jour en fin de match)
+        return snapshot.events or (), snapshot.status, snapshot.elapsed, snapshot, snapshot.statistics
+
     except asyncio.TimeoutError:
         log_message(f"Timeout lors de la récupération des événements pour fixture {fixture_id}", "ERROR")
         return None, None, None, None, None
@@ -1246,57 +2547,39 @@ async def handle_interruption(fixture_id, interruption_message_sent, IS_PAID_API
 
 # Fonction helper pour traiter un événement de but
 async def process_goal_event(event, match_data, elapsed_time, current_score, previous_score, is_first_event, IS_PAID_API, match_status):
-    """Traite un événement de but et retourne les informations nécessaires"""
-    if event['detail'] == 'Missed Penalty':
-        last_missed_penalty_time = event['time']['elapsed']
+    """Traite un événement de but (MatchEvent) et retourne les informations nécessaires"""
+    if event.detail == 'Missed Penalty':
+        last_missed_penalty_time = event.elapsed
         log_message(f"Penalty manqué détecté à {last_missed_penalty_time} minutes.")
         
         # Notifier uniquement si ce n'est PAS pendant les tirs au but
         if match_status not in ('P', 'PEN'):
-            player = event['player']
-            team = event['team']
-            if player is not None and team is not None:
-                await send_missed_penalty_message(player, team, last_missed_penalty_time)
+            if event.player_name is not None and event.team_name is not None:
+                await send_missed_penalty_message(event, last_missed_penalty_time)
         
         return None, False, is_first_event
     
     log_message(f"Not Missed Penalty")
-    player = event['player']
-    team = event['team']
     current_elapsed_time = elapsed_time
-    goal_elapsed_time = event['time']['elapsed']
+    goal_elapsed_time = event.elapsed
     allowed_difference = -10
     
     # Créer un dictionnaire avec toutes les informations du but
     goal_info = {
-        'player': player,
-        'team': team,
         'event': event,
         'elapsed_time': goal_elapsed_time,
-        'event_key': f"{event['type']}_{event['time']['elapsed']}_{player['id'] if player and player.get('id') else None}",
-        'player_statistics': None,
+        # Statistiques du joueur si disponibles (index du snapshot, O(1))
+        'player_statistics': match_data.statistics_for(event.player_id) if event.player_id else None,
         'significant_increase': False
     }
     
-    # Récupérer les statistiques du joueur si disponibles
-    if player is not None and player.get('id'):
-        player_id = player['id']
-        if 'players' in match_data:
-            for team_data in match_data['players']:
-                for player_stats in team_data['players']:
-                    if 'player' in player_stats and player_stats['player']['id'] == player_id:
-                        goal_info['player_statistics'] = player_stats['statistics']
-                        break
-                if goal_info['player_statistics']:
-                    break
-    
     # Vérifier si on a un temps de match valide avant de faire des comparaisons
     if current_elapsed_time is None:
         log_message(f"[AVERTISSEMENT] Impossible de vérifier l'horodatage du but car le temps de match écoulé est None.")
         return None, False, is_first_event
     
     # Vérifier si le but est dans l'intervalle de temps acceptable
-    if not (player is not None and player.get('id') and player.get('name') and
+    if not (event.player_id and event.player_name and
             goal_elapsed_time is not None and
             goal_elapsed_time >= current_elapsed_time + allowed_difference):
         if goal_elapsed_time is not None and goal_elapsed_time < current_elapsed_time + allowed_difference:
@@ -1305,47 +2588,60 @@ async def process_goal_event(event, match_data, elapsed_time, current_score, pre
     
     log_message(f"L'événement de goal a été détecté dans un interval de 10 minutes")
     
-    # Calculer le nouveau score depuis match_data
-    new_score = {
-        'home': match_data['goals']['home'],
-        'away': match_data['goals']['away']
-    }
+    # Calculer le nouveau score depuis le snapshot
+    new_score = match_data.score()
     
     if is_first_event or new_score != previous_score:
         # Vérifier l'augmentation significative du score (plus de 1 but marqué par une équipe)
-        significant_increase_in_score = False
-        if team['id'] == match_data['teams']['home']['id'] and new_score['home'] - current_score['home'] > 1:
-            significant_increase_in_score = True
-        elif team['id'] == match_data['teams']['away']['id'] and new_score['away'] - current_score['away'] > 1:
-            significant_increase_in_score = True
-        
-        goal_info['significant_increase'] = significant_increase_in_score
+        side = match_data.side_of(event.team_id)
+        goal_info['significant_increase'] = side is not None and new_score[side] - current_score[side] > 1
         return goal_info, True, False
     
     elif IS_PAID_API and match_status == 'P':
-        await send_shootout_goal_message(player, team,
-            goal_info['player_statistics'] if goal_info['player_statistics'] else [],
-            event)
+        await send_shootout_goal_message(event, goal_info['player_statistics'] if goal_info['player_statistics'] else [])
         return None, False, is_first_event
     else:
         # L'API publie parfois le but en deux temps : d'abord sans le nom du joueur
         # (le score est déjà incrémenté), puis avec le nom quelques minutes plus tard.
         # Le score ne bouge alors plus, mais le but n'a jamais été annoncé.
-        # On le laisse passer : sent_events (check_events) garantit déjà l'unicité.
-        if goal_info['event_key'] not in sent_events:
-            log_message(f"Score inchangé mais but jamais annoncé, rattrapage : {goal_info['event_key']}")
-            return goal_info, False, is_first_event
-        log_message(f"Le score n'a pas été modifié car l'API ne l'a pas mis à jour")
-        return None, False, is_first_event
+        # On le laisse passer : check_events ne transmet que les buts jamais annoncés.
+        log_message(f"Score inchangé mais but jamais annoncé, rattrapage : {event.player_name} à {goal_elapsed_time}'")
+        return goal_info, False, is_first_event
+
+# Enregistre un changement de score : un but détecté attend son annonce avec buteur, un but retiré est oublié
+def register_score_change(tracker, current_score, new_score, detected_at):
+    for side in ('home', 'away'):
+        difference = new_score[side] - current_score[side]
+        pending = tracker.pending_goal_alerts[side]
+        if difference > 0:
+            pending.extend([detected_at] * difference)
+        elif difference < 0:
+            del pending[difference:]
+            del tracker.instant_goal_alerts[side][difference:]
+
+# Latence de l'annonce d'un but par son événement Goal (le commentaire IA suit en édition) depuis la détection du score
+def record_enriched_goal_latency(tracker, event, match_data):
+    side = match_data.side_of(event.team_id)
+    pending = tracker.pending_goal_alerts.get(side) or tracker.pending_goal_alerts['home'] or tracker.pending_goal_alerts['away']
+    if not pending:
+        # But rattrapé sans changement de score vu pendant le suivi : pas de référence
+        return
+    latency = time.monotonic() - pending.pop(0)
+    tracker.goal_latencies['enriched'].append(latency)
+    log_message(f"[GOAL_LATENCY] Annonce du but de {event.player_name} envoyée {latency:.1f}s après la détection du score")
+
+def log_goal_latency_stats(tracker):
+    for path, latencies in tracker.goal_latencies.items():
+        if latencies:
+            log_message(f"[GOAL_LATENCY] Match {tracker.fixture_id} - {path} : {len(latencies)} but(s), "
+                        f"moyenne {sum(latencies) / len(latencies):.1f}s, max {max(latencies):.1f}s")
 
 # Fonction asynchrone pour vérifier les événements en cours pendant un match, tels que les buts et les cartons rouges.
-async def check_events(fixture_id):
-    log_message("check_events(fixture_id) appelée.")
-    global sent_events
-    global sent_events_details
-    global IS_PAID_API
-    global penalty_message_sent
-    global interruption_message_sent
+async def check_events(tracker):
+    log_message(f"check_events() appelée pour le match {tracker.fixture_id}.")
+    fixture_id = tracker.fixture_id
+    # Alias local vers l'état du match (muté en place, donc partagé avec le tracker)
+    announced_events = tracker.announced_events
     current_score = {'home': 0, 'away': 0}
     previous_score = {'home': 0, 'away': 0}
     score_updated = False
@@ -1356,15 +2652,26 @@ async def check_events(fixture_id):
     while True:
         try:
             events, match_status, elapsed_time, match_data, match_statistics = await get_team_live_events(fixture_id)
-            # S'assurer que match_data n'est pas None avant d'en extraire 'goals'.
-            if match_data and match_data.get('goals'):
-                new_score = {
-                    'home': match_data['goals']['home'],
-                    'away': match_data['goals']['away']
-                }
+            # Réponse identique à celle déjà traitée : rien à diffuser, on saute le diff des événements
+            revision = live_snapshot_revision(fixture_id)
+            tracker.polls_total += 1
+            unchanged = revision is not None and revision == tracker.last_snapshot_revision
+            tracker.last_snapshot_revision = revision
+            # S'assurer que match_data (MatchSnapshot) n'est pas None avant d'en extraire le score.
+            if match_data is not None and match_data.home_goals is not None:
+                new_score = match_data.score()
                 
                 if new_score != current_score:
                     log_message(f"Mise à jour du score après les événements VAR : {current_score} -> {new_score}")
+                    detected_at = time.monotonic()
+                    register_score_change(tracker, current_score, new_score, detected_at)
+                    if new_score['home'] > current_score['home'] or new_score['away'] > current_score['away']:
+                        # Fenêtre de polling dense juste après un but (voir compute_adaptive_poll_interval)
+                        tracker.last_goal_minute = elapsed_time
+                        # Chemin rapide : alerte immédiate, le message avec buteur suivra avec l'événement.
+                        # Pas au premier poll (score déjà acquis si le suivi démarre en cours de match).
+                        if INSTANT_GOAL_ALERTS and tracker.polls_total > 1:
+                            await send_instant_goal_alert(tracker, match_data, current_score, new_score, elapsed_time, detected_at)
                     previous_score = current_score.copy()
                     current_score = new_score.copy()
             else:
@@ -1382,12 +2689,29 @@ async def check_events(fixture_id):
                 # Durée totale en minutes : pre-match buffer + 1ère mi-temps + pause + 2ème mi-temps + marge fin.
                 # +30 min ajoutées si la compétition peut aller en prolongation (configurable via [LEAGUE_TYPES]).
                 base_duration_min = 5 + 45 + 10 + 45 + 10
-                if current_league_id in LEAGUES_WITH_EXTRA_TIME:
+                has_extra_time = tracker.league_id in LEAGUES_WITH_EXTRA_TIME
+                if has_extra_time:
                     total_duree_championnat = base_duration_min + 30
                 else:
                     total_duree_championnat = base_duration_min
                 interval = (total_duree_championnat * 60) / target_polls
 
+                # Planning adaptatif : on répartit le quota restant réel sur le temps de jeu
+                # restant, en densifiant les fenêtres à forte valeur. Le calcul est refait après
+                # chaque réponse (le quota restant est relu à chaque appel).
+                remaining_calls = api_quota_ledger.remaining_today()
+                if ADAPTIVE_POLLING and remaining_calls is not None:
+                    interval = compute_adaptive_poll_interval(
+                        match_status, elapsed_time, has_extra_time,
+                        remaining_calls, tracker.last_goal_minute
+                    )
+
+            if unchanged:
+                tracker.polls_unchanged += 1
+                log_message(f"Réponse inchangée pour le match {fixture_id} (révision {revision}), diff des événements sauté")
+                await asyncio.sleep(interval)
+                continue
+
             # Gestion de la mi-temps
             if match_status == 'HT':
                 result = await handle_halftime(fixture_id, match_status, IS_PAID_API)
@@ -1398,128 +2722,113 @@ async def check_events(fixture_id):
             # Gestion des tirs au but ('P' = séance en cours ; 'PEN' = match terminé,
             # traité par le bloc de fin de match plus bas)
             if match_status == 'P':
-                penalty_message_sent, events, match_status, elapsed_time, match_data, match_statistics = await handle_penalty_shootout(fixture_id, penalty_message_sent, IS_PAID_API)
+                tracker.penalty_message_sent, events, match_status, elapsed_time, match_data, match_statistics = await handle_penalty_shootout(fixture_id, tracker.penalty_message_sent, IS_PAID_API)
 
             # Gestion des interruptions ('INT') et suspensions ('SUSP')
             if match_status in ('INT', 'SUSP'):
-                interruption_message_sent, events, match_status, elapsed_time, match_data, match_statistics = await handle_interruption(fixture_id, interruption_message_sent, IS_PAID_API)
+                tracker.interruption_message_sent, events, match_status, elapsed_time, match_data, match_statistics = await handle_interruption(fixture_id, tracker.interruption_message_sent, IS_PAID_API)
 
             # Vérifiez que events n'est pas None avant de l'itérer
             if events is None:
                 await asyncio.sleep(interval)
                 continue
 
-            # Boucle pour vérifier les événements
-            for event in events:
+            # Boucle sur les changements depuis le poll précédent (le moteur de diff garde la vue indexée)
+            for delta in tracker.event_diff.diff(events):
                 # Vérifier si match_data n'est pas None
                 if match_data is None:
                     log_message("match_data est None, impossible de continuer le traitement des événements")
                     break
-                
-                # Vérifiez si l'attribut 'player' existe sinon on lui attribue une valeur nulle
-                player_id = event['player']['id'] if 'player' in event and event['player'] is not None else None
-                # On créé une clé uniquement pour identifier l'événement en question
-                event_key = f"{event['type']}_{event['time']['elapsed']}_{player_id}"
-                # Clé pour détecter les corrections (inclut le timing pour distinguer les doublés)
-                event_key_sub = f"{event['type']}_{player_id}_{event['time']['elapsed']}"
-
-                # ISSUE 6: Vérifier si l'événement a déjà été envoyé et si le timing a changé
-                if event_key_sub in sent_events_details:
-                    old_data = sent_events_details[event_key_sub]
+
+                event = delta.event
+
+                if delta.kind == EVENT_REMOVED:
+                    # Événement retiré par l'API (VAR, erreur de saisie...). L'annulation d'un
+                    # but est annoncée par la baisse du score, plus bas.
+                    log_message(f"Événement retiré par l'API : {delta}")
+                    announced_events.pop(delta.event_id, None)
+                    continue
+
+                if delta.kind == EVENT_MODIFIED and delta.event_id in announced_events:
+                    # ISSUE 6: événement déjà annoncé dont le timing a changé
+                    old_data = announced_events[delta.event_id]
                     old_time = old_data.get('time')
-                    new_time = event['time']['elapsed']
-                    
-                    # Vérifier si c'est une vraie correction (petite différence de timing) ou un doublon (nouveau but)
-                    # Si la différence est > 2 minutes, c'est probablement un nouveau but (doublon), pas une correction
-                    time_difference = abs(new_time - old_time) if old_time is not None else 0
-                    
-                    if old_time is not None and old_time != new_time and not old_data.get('correction_sent', False):
-                        if time_difference <= 2:
-                            # Petite différence (≤2 min) = correction de timing du même but
+                    new_time = event.elapsed
+
+                    # Petite différence (≤2 min) = correction de timing du même but. Au-delà,
+                    # c'est un réappariement (but retiré puis republié) : on se contente de logger.
+                    time_difference = abs(new_time - old_time) if old_time is not None and new_time is not None else 0
+
+                    if old_data.get('player_name') and old_time is not None and old_time != new_time and not old_data.get('correction_sent', False):
+                        if time_difference <= EVENT_MINUTE_CORRECTION_MAX:
                             player_name = old_data.get('player_name', 'Joueur inconnu')
                             team_name = old_data.get('team_name', 'Équipe inconnue')
-                            message = f"⚠️ Correction: Le but de {player_name} ({team_name}) était à {new_time}' (et non {old_time}')"
-                            await send_message_to_all_chats(message)
+                            await send_message_to_all_chats(lambda language: t("goal_correction", language, player=player_name, team=team_name, new_time=new_time, old_time=old_time))
                             log_message(f"Correction de timing envoyée: {old_time}' → {new_time}' pour {player_name}")
-                            
-                            # Mettre à jour le timing et marquer correction envoyée
-                            sent_events_details[event_key_sub]['time'] = new_time
-                            sent_events_details[event_key_sub]['correction_sent'] = True
-                            continue
+                            old_data['correction_sent'] = True
                         else:
-                            # Grande différence = nouveau but du même joueur (doublon/triplé)
-                            log_message(f"Nouveau but détecté pour le même joueur (différence de {time_difference} min): {old_time}' vs {new_time}'")
-                            # Ne pas continuer, traiter comme un nouveau but
-                    else:
-                        # Même timing ou correction déjà envoyée = ignorer
-                        continue
-                
-                if event_key in sent_events:
+                            log_message(f"Minute d'un but déjà annoncé modifiée de {time_difference} min ({old_time}' → {new_time}'), pas de correction envoyée")
+                    old_data['time'] = new_time
                     continue
 
-                if event['type'] == "Goal":
+                # Ajout, ou modification d'un événement jamais annoncé (buteur publié après
+                # coup, minute corrigée...) : traité comme un nouvel événement
+                if event.type == "Goal":
                     log_message(f"type == Goal")
                     log_message(f"Données de score récupéré dans match_data pour la variable new_score : {new_score}")
                     log_message(f"Previous score : {previous_score}")
-                    log_message(f"Contenu de l'event de type goal :\n {event}\n\n")
+                    log_message(f"Contenu de l'event de type goal : {event}\n")
 
                     # Traiter le but avec la fonction helper
                     goal_info, should_update_score, is_first_event = await process_goal_event(
                         event, match_data, elapsed_time, current_score, previous_score,
                         is_first_event, IS_PAID_API, match_status
                     )
-                    
+
                     if goal_info:
+                        goal_info['event_id'] = delta.event_id
                         goal_events.append(goal_info)
                         score_updated = score_updated or should_update_score
-                    else:
-                        # Événement déjà traité ou non valide
-                        sent_events.add(event_key)
-                        continue
+                    elif event.detail == 'Missed Penalty' or match_status == 'P':
+                        # Penalty manqué ou tir au but : déjà notifié par process_goal_event
+                        announced_events[delta.event_id] = {'time': event.elapsed}
 
                 # Gestion des buts annulés par le VAR (doit être au même niveau que Goal, pas imbriqué)
-                elif event['type'] == "Var" and "Goal Disallowed" in event['detail']:
+                elif event.type == "Var" and "Goal Disallowed" in event.detail:
                     log_message("But annulé détecté par le VAR")
-                    team = event['team']
-                    new_score_var = {
-                        'home': match_data['goals']['home'],
-                        'away': match_data['goals']['away']
-                    }
+                    new_score_var = match_data.score()
                     # Vérifier si le score a diminué
                     if new_score_var['home'] < current_score['home'] or new_score_var['away'] < current_score['away']:
                         await send_goal_cancelled_message(current_score, new_score_var)
+                        register_score_change(tracker, current_score, new_score_var, time.monotonic())
                         previous_score = current_score.copy()
                         current_score = new_score_var.copy()
                     else:
                         log_message("Le score n'a pas changé après l'annulation du but")
-                    sent_events.add(event_key)
-                    continue
+                    announced_events[delta.event_id] = {'time': event.elapsed}
 
-                elif event['type'] == "Card" and event['detail'] == "Red Card":
+                elif event.type == "Card" and event.detail == "Red Card":
                     log_message(f"Carton rouge détecté")
-                    player = event['player']
-                    team = event['team']
+                    log_message(f"Contenu de l'event de type carton rouge : {event}\n")
 
-                    log_message(f"Contenu de l'event de type carton rouge :\n {event}\n\n")
-                    
-                    # Vérifiez si le joueur n'est pas None et si son nom est présent
-                    if player is not None and 'name' in player:
+                    # Vérifiez si le nom du joueur est présent
+                    # (sinon, l'événement sera retraité quand l'API le complétera)
+                    if event.player_name:
                         # Vérifiez si l'événement de carton rouge est dans les dernières minutes
                         current_elapsed_time = elapsed_time
-                        red_card_elapsed_time = event['time']['elapsed']
+                        red_card_elapsed_time = event.elapsed
                         allowed_difference = -10
                         log_message(f"if {red_card_elapsed_time} >= {current_elapsed_time} + {allowed_difference}")
 
                         if red_card_elapsed_time is not None and current_elapsed_time is not None and red_card_elapsed_time >= current_elapsed_time + allowed_difference:
-                            await send_red_card_message(player, team, event['time']['elapsed'], event)
-                            log_message(f"event_key enregistrée : {event_key}")
-                            sent_events.add(event_key)
+                            await send_red_card_message(event)
+                            log_message(f"Carton rouge annoncé : {delta}")
+                            announced_events[delta.event_id] = {'time': red_card_elapsed_time}
                         else:
                             log_message(f"Le carton rouge a été donné il y a plus de 10 minutes. Le message n'a pas été envoyé.")
                     else:
                         log_message(f"Le nom du joueur est manquant ou 'player' est None, le message de carton rouge n'a pas été envoyé")
-                        continue
-            
+
             #Fin de la boucle for event in events:
 
             # Traiter tous les buts accumulés
@@ -1528,36 +2837,32 @@ async def check_events(fixture_id):
                 has_significant_increase = any(goal['significant_increase'] for goal in goal_events)
                 
                 for goal_info in goal_events:
-                    if goal_info['event_key'] not in sent_events:
+                    if goal_info['event_id'] not in announced_events:
                         if goal_info['significant_increase']:
                             await send_goal_message_significant_increase_in_score(
-                                goal_info['player'],
-                                goal_info['team'],
+                                goal_info['event'],
                                 goal_info['player_statistics'] if goal_info['player_statistics'] else [],
                                 goal_info['elapsed_time'],
-                                match_data,
-                                goal_info['event']
+                                match_data
                             )
                         else:
                             await send_goal_message(
-                                goal_info['player'],
-                                goal_info['team'],
+                                goal_info['event'],
                                 goal_info['player_statistics'] if goal_info['player_statistics'] else [],
                                 goal_info['elapsed_time'],
-                                match_data,
-                                goal_info['event']
+                                match_data
                             )
-                        sent_events.add(goal_info['event_key'])
-                        
+
                         # ISSUE 6: Stocker les détails de l'événement pour détecter les corrections futures
-                        # Utiliser une clé unique incluant le timing approximatif pour distinguer les doublés
-                        event_key_sub = f"Goal_{goal_info['player']['id'] if goal_info['player'] else None}_{goal_info['elapsed_time']}"
-                        sent_events_details[event_key_sub] = {
+                        # (l'identifiant stable du moteur de diff distingue déjà les doublés)
+                        goal_event = goal_info['event']
+                        record_enriched_goal_latency(tracker, goal_event, match_data)
+                        announced_events[goal_info['event_id']] = {
                             'time': goal_info['elapsed_time'],
-                            'player_id': goal_info['player']['id'] if goal_info['player'] else None,
-                            'player_name': goal_info['player']['name'] if goal_info['player'] else 'Inconnu',
-                            'team_id': goal_info['team']['id'] if goal_info['team'] else None,
-                            'team_name': goal_info['team']['name'] if goal_info['team'] else 'Inconnue',
+                            'player_id': goal_event.player_id,
+                            'player_name': goal_event.player_name or 'Inconnu',
+                            'team_id': goal_event.team_id,
+                            'team_name': goal_event.team_name or 'Inconnue',
                             'correction_sent': False
                         }
                         
@@ -1597,26 +2902,26 @@ async def check_events(fixture_id):
 
                 if match_data is None:
                     log_message("match_data est None, impossible de continuer le traitement des événements")
-                elif 'teams' not in match_data or 'home' not in match_data['teams'] or 'name' not in match_data['teams']['home']:
+                elif match_data.home_name is None or match_data.away_name is None:
                     log_message("Certaines informations d'équipe manquent dans match_data")
-                elif 'score' not in match_data or 'fulltime' not in match_data['score'] or 'home' not in match_data['score']['fulltime']:
+                elif match_data.fulltime_home is None:
                     log_message("Certaines informations de score manquent dans match_data")
                 else:
-                    home_team = match_data['teams']['home']['name']
-                    away_team = match_data['teams']['away']['name']
-                    home_score = match_data['score']['fulltime']['home']
-                    away_score = match_data['score']['fulltime']['away']
+                    home_team = match_data.home_name
+                    away_team = match_data.away_name
+                    home_score = match_data.fulltime_home
+                    away_score = match_data.fulltime_away
 
                 log_message(f"Envoi des variables à send_end_message avec chat_ids: home_team: {home_team}, away_team: {away_team}, home_score: {home_score}, away_score: {away_score}, match_statistics: {match_statistics}, events: {events}\n")
-                await send_end_message(home_team, away_team, home_score, away_score, match_statistics, events)
+                await send_end_message(home_team, away_team, home_score, away_score, match_statistics, events, tracker)
                 break
 
             # Statuts terminaux sans fin de match classique (abandon, annulation, report, forfait).
             # Sans cette sortie, la boucle continuerait à interroger l'API indéfiniment.
             if match_status in ('ABD', 'CANC', 'PST', 'AWD', 'WO'):
                 log_message(f"Le match ne reprendra pas (statut : {match_status}), arrêt du suivi.")
-                await send_message_to_all_chats(f"🤖 : Le match ne reprendra pas (statut : {match_status}). Fin du suivi.")
-                log_cost_summary()
+                await send_message_to_all_chats(lambda language: t("match_not_resuming", language, status=match_status))
+                log_cost_summary(tracker)
                 break
 
         # Si le nombre d'appels à l'API restant est dépassé, on lève une exception et on sort de la boucle !
@@ -1628,6 +2933,384 @@ async def check_events(fixture_id):
         # Pause avant de vérifier à nouveau les événements
         await asyncio.sleep(interval)
 
+### DEBUT DE GESTION DES TEXTES LOCALISES DU BOT
+
+# Textes fixes envoyés par le bot, déjà rédigés dans chaque langue prise en charge :
+# en génération native (NATIVE_LANGUAGE_GENERATION), ils ne passent plus par translate_message.
+# Les valeurs variables sont insérées avec str.format (voir t()).
+MESSAGE_CATALOGUE = {
+    "match_cancelled": {
+        "french": "🤖 : Le statut du match indique qu'il a été annulé ou reporté",
+        "english": "🤖 : The match status shows it has been cancelled or postponed",
+        "german": "🤖 : Laut Spielstatus wurde das Spiel abgesagt oder verschoben",
+        "spanish": "🤖 : El estado del partido indica que ha sido cancelado o aplazado",
+        "italian": "🤖 : Lo stato della partita indica che è stata annullata o rinviata",
+        "portuguese": "🤖 : O estado do jogo indica que foi cancelado ou adiado",
+    },
+    "match_forfeit": {
+        "french": "🤖 : Défaite technique ou victoire par forfait ou absence de compétiteur",
+        "english": "🤖 : Technical loss, walkover or absence of a competitor",
+        "german": "🤖 : Technische Niederlage, Sieg am grünen Tisch oder Nichtantreten",
+        "spanish": "🤖 : Derrota técnica, victoria por incomparecencia o ausencia de un competidor",
+        "italian": "🤖 : Sconfitta a tavolino, vittoria per forfait o assenza di un concorrente",
+        "portuguese": "🤖 : Derrota técnica, vitória por falta de comparência ou ausência de um competidor",
+    },
+    "api_unavailable": {
+        "french": "🤖 : Impossible de vérifier les matchs. L'API football est indisponible. Veuillez réessayer plus tard.",
+        "english": "🤖 : Unable to check the matches. The football API is unavailable. Please try again later.",
+        "german": "🤖 : Die Spiele können nicht geprüft werden. Die Fußball-API ist nicht erreichbar. Bitte später erneut versuchen.",
+        "spanish": "🤖 : No se pueden comprobar los partidos. La API de fútbol no está disponible. Inténtalo más tarde.",
+        "italian": "🤖 : Impossibile verificare le partite. L'API del calcio non è disponibile. Riprova più tardi.",
+        "portuguese": "🤖 : Não é possível verificar os jogos. A API de futebol está indisponível. Tente novamente mais tarde.",
+    },
+    "goal_correction": {
+        "french": "⚠️ Correction: Le but de {player} ({team}) était à {new_time}' (et non {old_time}')",
+        "english": "⚠️ Correction: {player}'s goal ({team}) was scored at {new_time}' (not {old_time}')",
+        "german": "⚠️ Korrektur: Das Tor von {player} ({team}) fiel in der {new_time}' (nicht {old_time}')",
+        "spanish": "⚠️ Corrección: El gol de {player} ({team}) fue en el {new_time}' (y no en el {old_time}')",
+        "italian": "⚠️ Correzione: Il gol di {player} ({team}) è stato al {new_time}' (e non al {old_time}')",
+        "portuguese": "⚠️ Correção: O golo de {player} ({team}) foi aos {new_time}' (e não aos {old_time}')",
+    },
+    "match_not_resuming": {
+        "french": "🤖 : Le match ne reprendra pas (statut : {status}). Fin du suivi.",
+        "english": "🤖 : The match will not resume (status: {status}). Tracking stopped.",
+        "german": "🤖 : Das Spiel wird nicht fortgesetzt (Status: {status}). Verfolgung beendet.",
+        "spanish": "🤖 : El partido no se reanudará (estado: {status}). Fin del seguimiento.",
+        "italian": "🤖 : La partita non riprenderà (stato: {status}). Fine del monitoraggio.",
+        "portuguese": "🤖 : O jogo não será retomado (estado: {status}). Fim do acompanhamento.",
+    },
+    "match_today": {
+        "french": "🤖 : Match aujourd'hui : {home} vs {away}\n🏆 {league} — {round}\n🏟️ {venue}, {city}\n🕒 Coup d'envoi : {kickoff}",
+        "english": "🤖 : Match today: {home} vs {away}\n🏆 {league} — {round}\n🏟️ {venue}, {city}\n🕒 Kick-off: {kickoff}",
+        "german": "🤖 : Spiel heute: {home} vs {away}\n🏆 {league} — {round}\n🏟️ {venue}, {city}\n🕒 Anstoß: {kickoff}",
+        "spanish": "🤖 : Partido hoy: {home} vs {away}\n🏆 {league} — {round}\n🏟️ {venue}, {city}\n🕒 Saque inicial: {kickoff}",
+        "italian": "🤖 : Partita oggi: {home} vs {away}\n🏆 {league} — {round}\n🏟️ {venue}, {city}\n🕒 Calcio d'inizio: {kickoff}",
+        "portuguese": "🤖 : Jogo hoje: {home} vs {away}\n🏆 {league} — {round}\n🏟️ {venue}, {city}\n🕒 Pontapé de saída: {kickoff}",
+    },
+    "compo_unavailable": {
+        "french": "🤖 : Désolé, je n'ai pas pu obtenir les informations sur la composition des équipes pour le moment.",
+        "english": "🤖 : Sorry, I could not get the team line-ups for now.",
+        "german": "🤖 : Leider konnte ich die Aufstellungen noch nicht abrufen.",
+        "spanish": "🤖 : Lo siento, por ahora no he podido obtener las alineaciones.",
+        "italian": "🤖 : Spiacente, per ora non sono riuscito a ottenere le formazioni.",
+        "portuguese": "🤖 : Desculpe, por agora não consegui obter as escalações.",
+    },
+    "prematch_unavailable": {
+        "french": "🤖 : Désolé, l'analyse d'avant-match est indisponible pour le moment.",
+        "english": "🤖 : Sorry, the pre-match analysis is unavailable for now.",
+        "german": "🤖 : Leider ist die Vorschau auf das Spiel derzeit nicht verfügbar.",
+        "spanish": "🤖 : Lo siento, el análisis previo al partido no está disponible por ahora.",
+        "italian": "🤖 : Spiacente, l'analisi pre-partita non è disponibile al momento.",
+        "portuguese": "🤖 : Desculpe, a análise pré-jogo está indisponível de momento.",
+    },
+    "match_start": {
+        "french": "🤖 : Le match commence !",
+        "english": "🤖 : The match is starting!",
+        "german": "🤖 : Das Spiel beginnt!",
+        "spanish": "🤖 : ¡Empieza el partido!",
+        "italian": "🤖 : La partita comincia!",
+        "portuguese": "🤖 : O jogo vai começar!",
+    },
+    "instant_goal": {
+        "french": "⚽️ BUT pour {team} ! {score} ({elapsed}')",
+        "english": "⚽️ GOAL for {team}! {score} ({elapsed}')",
+        "german": "⚽️ TOR für {team}! {score} ({elapsed}')",
+        "spanish": "⚽️ ¡GOL de {team}! {score} ({elapsed}')",
+        "italian": "⚽️ GOL per {team}! {score} ({elapsed}')",
+        "portuguese": "⚽️ GOLO do {team}! {score} ({elapsed}')",
+    },
+    "goal_scorer": {
+        "french": "👟 Buteur : {player} ({elapsed}')",
+        "english": "👟 Scorer: {player} ({elapsed}')",
+        "german": "👟 Torschütze: {player} ({elapsed}')",
+        "spanish": "👟 Goleador: {player} ({elapsed}')",
+        "italian": "👟 Marcatore: {player} ({elapsed}')",
+        "portuguese": "👟 Marcador: {player} ({elapsed}')",
+    },
+    "goal_commentary": {
+        "french": "🤖 Infos sur le but :\n",
+        "english": "🤖 About the goal:\n",
+        "german": "🤖 Zum Tor:\n",
+        "spanish": "🤖 Sobre el gol:\n",
+        "italian": "🤖 Sul gol:\n",
+        "portuguese": "🤖 Sobre o golo:\n",
+    },
+    "goal_fallback": {
+        "french": "🤖 : But de {player} !",
+        "english": "🤖 : Goal by {player}!",
+        "german": "🤖 : Tor von {player}!",
+        "spanish": "🤖 : ¡Gol de {player}!",
+        "italian": "🤖 : Gol di {player}!",
+        "portuguese": "🤖 : Golo de {player}!",
+    },
+    "shootout_goal": {
+        "french": "⚽️ Pénalty réussi' - {team}\n\n",
+        "english": "⚽️ Penalty scored - {team}\n\n",
+        "german": "⚽️ Elfmeter verwandelt - {team}\n\n",
+        "spanish": "⚽️ Penalti marcado - {team}\n\n",
+        "italian": "⚽️ Rigore segnato - {team}\n\n",
+        "portuguese": "⚽️ Penálti convertido - {team}\n\n",
+    },
+    "shootout_commentary": {
+        "french": "🤖 Infos sur le pénalty :\n",
+        "english": "🤖 About the penalty:\n",
+        "german": "🤖 Zum Elfmeter:\n",
+        "spanish": "🤖 Sobre el penalti:\n",
+        "italian": "🤖 Sul rigore:\n",
+        "portuguese": "🤖 Sobre o penálti:\n",
+    },
+    "shootout_fallback": {
+        "french": "🤖 : {player} a réussi son tir au but !",
+        "english": "🤖 : {player} scored their penalty!",
+        "german": "🤖 : {player} hat den Elfmeter verwandelt!",
+        "spanish": "🤖 : ¡{player} ha marcado su penalti!",
+        "italian": "🤖 : {player} ha segnato il suo rigore!",
+        "portuguese": "🤖 : {player} converteu o seu penálti!",
+    },
+    "score_update": {
+        "french": "🤖 : Score actualisé après les buts : {score}",
+        "english": "🤖 : Updated score after the goals: {score}",
+        "german": "🤖 : Aktueller Spielstand nach den Toren: {score}",
+        "spanish": "🤖 : Marcador actualizado tras los goles: {score}",
+        "italian": "🤖 : Punteggio aggiornato dopo i gol: {score}",
+        "portuguese": "🤖 : Resultado atualizado após os golos: {score}",
+    },
+    "goal_cancelled": {
+        "french": "❌ But annulé ! Le score revient à {home} - {away}.",
+        "english": "❌ Goal disallowed! The score goes back to {home} - {away}.",
+        "german": "❌ Tor aberkannt! Der Spielstand ist wieder {home} - {away}.",
+        "spanish": "❌ ¡Gol anulado! El marcador vuelve a {home} - {away}.",
+        "italian": "❌ Gol annullato! Il punteggio torna {home} - {away}.",
+        "portuguese": "❌ Golo anulado! O resultado volta a {home} - {away}.",
+    },
+    "red_card": {
+        "french": "🟥 Carton rouge ! {elapsed}'\n ({team})",
+        "english": "🟥 Red card! {elapsed}'\n ({team})",
+        "german": "🟥 Rote Karte! {elapsed}'\n ({team})",
+        "spanish": "🟥 ¡Tarjeta roja! {elapsed}'\n ({team})",
+        "italian": "🟥 Cartellino rosso! {elapsed}'\n ({team})",
+        "portuguese": "🟥 Cartão vermelho! {elapsed}'\n ({team})",
+    },
+    "red_card_commentary": {
+        "french": "🤖 Infos sur le carton rouge :\n",
+        "english": "🤖 About the red card:\n",
+        "german": "🤖 Zur Roten Karte:\n",
+        "spanish": "🤖 Sobre la tarjeta roja:\n",
+        "italian": "🤖 Sul cartellino rosso:\n",
+        "portuguese": "🤖 Sobre o cartão vermelho:\n",
+    },
+    "red_card_fallback": {
+        "french": "🤖 : Carton rouge pour {player} ({team}).",
+        "english": "🤖 : Red card for {player} ({team}).",
+        "german": "🤖 : Rote Karte für {player} ({team}).",
+        "spanish": "🤖 : Tarjeta roja para {player} ({team}).",
+        "italian": "🤖 : Cartellino rosso per {player} ({team}).",
+        "portuguese": "🤖 : Cartão vermelho para {player} ({team}).",
+    },
+    "missed_penalty": {
+        "french": "❌ Pénalty manqué ! {elapsed}'\n ({team})\n\n🤖 : {player} a manqué son pénalty à la {elapsed}ème minute.",
+        "english": "❌ Penalty missed! {elapsed}'\n ({team})\n\n🤖 : {player} missed a penalty in minute {elapsed}.",
+        "german": "❌ Elfmeter verschossen! {elapsed}'\n ({team})\n\n🤖 : {player} hat in der {elapsed}. Minute einen Elfmeter verschossen.",
+        "spanish": "❌ ¡Penalti fallado! {elapsed}'\n ({team})\n\n🤖 : {player} ha fallado un penalti en el minuto {elapsed}.",
+        "italian": "❌ Rigore sbagliato! {elapsed}'\n ({team})\n\n🤖 : {player} ha sbagliato un rigore al {elapsed}° minuto.",
+        "portuguese": "❌ Penálti falhado! {elapsed}'\n ({team})\n\n🤖 : {player} falhou um penálti aos {elapsed} minutos.",
+    },
+    "shootout_pause": {
+        "french": "🤖 : Le suivi est mis en pause pour les tirs aux but mais je vous enverrai un résumé du match à la fin.\n",
+        "english": "🤖 : Tracking is paused during the penalty shoot-out, but I will send you a match summary at the end.\n",
+        "german": "🤖 : Während des Elfmeterschießens pausiert die Verfolgung, aber ich schicke euch am Ende eine Zusammenfassung.\n",
+        "spanish": "🤖 : El seguimiento se pausa durante la tanda de penaltis, pero os enviaré un resumen del partido al final.\n",
+        "italian": "🤖 : Il monitoraggio è in pausa durante i calci di rigore, ma vi invierò un riepilogo della partita alla fine.\n",
+        "portuguese": "🤖 : O acompanhamento fica em pausa durante os penáltis, mas enviarei um resumo do jogo no final.\n",
+    },
+    "match_interrupted": {
+        "french": "🤖 : Le match a été interrompu !\n",
+        "english": "🤖 : The match has been interrupted!\n",
+        "german": "🤖 : Das Spiel wurde unterbrochen!\n",
+        "spanish": "🤖 : ¡El partido ha sido interrumpido!\n",
+        "italian": "🤖 : La partita è stata interrotta!\n",
+        "portuguese": "🤖 : O jogo foi interrompido!\n",
+    },
+    "api_quota_reached": {
+        "french": "🤖 : Le nombre maximum de requêtes à l'api de foot a été atteinte. Je dois malheureusement mettre fin au suivi du match.\n",
+        "english": "🤖 : The maximum number of football API requests has been reached. Unfortunately I have to stop tracking the match.\n",
+        "german": "🤖 : Die maximale Anzahl an Anfragen an die Fußball-API ist erreicht. Leider muss ich die Verfolgung des Spiels beenden.\n",
+        "spanish": "🤖 : Se ha alcanzado el número máximo de peticiones a la API de fútbol. Lamentablemente tengo que dejar de seguir el partido.\n",
+        "italian": "🤖 : È stato raggiunto il numero massimo di richieste all'API del calcio. Purtroppo devo interrompere il monitoraggio della partita.\n",
+        "portuguese": "🤖 : Foi atingido o número máximo de pedidos à API de futebol. Infelizmente tenho de terminar o acompanhamento do jogo.\n",
+    },
+    "end_header": {
+        "french": "🏁 Fin du match !\n{home} {home_score} - {away_score} {away}\n\n",
+        "english": "🏁 Full time!\n{home} {home_score} - {away_score} {away}\n\n",
+        "german": "🏁 Abpfiff!\n{home} {home_score} - {away_score} {away}\n\n",
+        "spanish": "🏁 ¡Final del partido!\n{home} {home_score} - {away_score} {away}\n\n",
+        "italian": "🏁 Fine della partita!\n{home} {home_score} - {away_score} {away}\n\n",
+        "portuguese": "🏁 Fim do jogo!\n{home} {home_score} - {away_score} {away}\n\n",
+    },
+    "end_ai_unavailable": {
+        "french": "⚠️ Analyse IA indisponible, voici les événements du match :\n\n",
+        "english": "⚠️ AI analysis unavailable, here are the match events:\n\n",
+        "german": "⚠️ KI-Analyse nicht verfügbar, hier die Ereignisse des Spiels:\n\n",
+        "spanish": "⚠️ Análisis de IA no disponible, estos son los eventos del partido:\n\n",
+        "italian": "⚠️ Analisi IA non disponibile, ecco gli eventi della partita:\n\n",
+        "portuguese": "⚠️ Análise de IA indisponível, eis os eventos do jogo:\n\n",
+    },
+    "end_statistics": {
+        "french": "\n📊 STATISTIQUES:\n",
+        "english": "\n📊 STATISTICS:\n",
+        "german": "\n📊 STATISTIKEN:\n",
+        "spanish": "\n📊 ESTADÍSTICAS:\n",
+        "italian": "\n📊 STATISTICHE:\n",
+        "portuguese": "\n📊 ESTATÍSTICAS:\n",
+    },
+    "end_analysis": {
+        "french": "🤖 Mon analyse :\n",
+        "english": "🤖 My analysis:\n",
+        "german": "🤖 Meine Analyse:\n",
+        "spanish": "🤖 Mi análisis:\n",
+        "italian": "🤖 La mia analisi:\n",
+        "portuguese": "🤖 A minha análise:\n",
+    },
+    "raw_events_none": {
+        "french": "Aucun événement enregistré.",
+        "english": "No events recorded.",
+        "german": "Keine Ereignisse erfasst.",
+        "spanish": "No hay eventos registrados.",
+        "italian": "Nessun evento registrato.",
+        "portuguese": "Nenhum evento registado.",
+    },
+    "raw_events_header": {
+        "french": "📋 ÉVÉNEMENTS DU MATCH:\n",
+        "english": "📋 MATCH EVENTS:\n",
+        "german": "📋 SPIELEREIGNISSE:\n",
+        "spanish": "📋 EVENTOS DEL PARTIDO:\n",
+        "italian": "📋 EVENTI DELLA PARTITA:\n",
+        "portuguese": "📋 EVENTOS DO JOGO:\n",
+    },
+    "raw_goal": {
+        "french": "⚽️ {minute}' - {team}: {player} marque",
+        "english": "⚽️ {minute}' - {team}: {player} scores",
+        "german": "⚽️ {minute}' - {team}: {player} trifft",
+        "spanish": "⚽️ {minute}' - {team}: {player} marca",
+        "italian": "⚽️ {minute}' - {team}: {player} segna",
+        "portuguese": "⚽️ {minute}' - {team}: {player} marca",
+    },
+    "raw_red_card": {
+        "french": "🟥 {minute}' - {team}: {player} carton rouge\n",
+        "english": "🟥 {minute}' - {team}: {player} red card\n",
+        "german": "🟥 {minute}' - {team}: {player} Rote Karte\n",
+        "spanish": "🟥 {minute}' - {team}: {player} tarjeta roja\n",
+        "italian": "🟥 {minute}' - {team}: {player} cartellino rosso\n",
+        "portuguese": "🟥 {minute}' - {team}: {player} cartão vermelho\n",
+    },
+    "raw_yellow_card": {
+        "french": "🟨 {minute}' - {team}: {player} carton jaune\n",
+        "english": "🟨 {minute}' - {team}: {player} yellow card\n",
+        "german": "🟨 {minute}' - {team}: {player} Gelbe Karte\n",
+        "spanish": "🟨 {minute}' - {team}: {player} tarjeta amarilla\n",
+        "italian": "🟨 {minute}' - {team}: {player} cartellino giallo\n",
+        "portuguese": "🟨 {minute}' - {team}: {player} cartão amarelo\n",
+    },
+    "raw_substitution": {
+        "french": "🔄 {minute}' - {team}: {player} remplacé\n",
+        "english": "🔄 {minute}' - {team}: {player} substituted\n",
+        "german": "🔄 {minute}' - {team}: {player} ausgewechselt\n",
+        "spanish": "🔄 {minute}' - {team}: {player} sustituido\n",
+        "italian": "🔄 {minute}' - {team}: {player} sostituito\n",
+        "portuguese": "🔄 {minute}' - {team}: {player} substituído\n",
+    },
+    "season_title": {
+        "french": "\n📈 *Saison {team} — {league}*",
+        "english": "\n📈 *{team} season — {league}*",
+        "german": "\n📈 *Saison {team} — {league}*",
+        "spanish": "\n📈 *Temporada {team} — {league}*",
+        "italian": "\n📈 *Stagione {team} — {league}*",
+        "portuguese": "\n📈 *Temporada {team} — {league}*",
+    },
+    "season_record": {
+        "french": "• Bilan : {played} J | {wins}V {draws}N {loses}D",
+        "english": "• Record: {played} P | {wins}W {draws}D {loses}L",
+        "german": "• Bilanz: {played} Sp. | {wins}S {draws}U {loses}N",
+        "spanish": "• Balance: {played} PJ | {wins}G {draws}E {loses}P",
+        "italian": "• Bilancio: {played} G | {wins}V {draws}N {loses}P",
+        "portuguese": "• Balanço: {played} J | {wins}V {draws}E {loses}D",
+    },
+    "season_goals": {
+        "french": "• Buts : {goals_for} pour / {goals_against} contre (diff {diff})",
+        "english": "• Goals: {goals_for} for / {goals_against} against (diff {diff})",
+        "german": "• Tore: {goals_for} erzielt / {goals_against} kassiert (Diff. {diff})",
+        "spanish": "• Goles: {goals_for} a favor / {goals_against} en contra (dif. {diff})",
+        "italian": "• Gol: {goals_for} fatti / {goals_against} subiti (diff. {diff})",
+        "portuguese": "• Golos: {goals_for} marcados / {goals_against} sofridos (dif. {diff})",
+    },
+    "season_clean_sheets": {
+        "french": "• Clean sheets : {clean_sheets} | Sans marquer : {failed}",
+        "english": "• Clean sheets: {clean_sheets} | Failed to score: {failed}",
+        "german": "• Zu-null-Spiele: {clean_sheets} | Ohne eigenes Tor: {failed}",
+        "spanish": "• Porterías a cero: {clean_sheets} | Sin marcar: {failed}",
+        "italian": "• Porta inviolata: {clean_sheets} | Senza segnare: {failed}",
+        "portuguese": "• Jogos sem sofrer: {clean_sheets} | Sem marcar: {failed}",
+    },
+    "season_form": {
+        "french": "• Forme (5 derniers) : {form}",
+        "english": "• Form (last 5): {form}",
+        "german": "• Form (letzte 5): {form}",
+        "spanish": "• Forma (últimos 5): {form}",
+        "italian": "• Forma (ultime 5): {form}",
+        "portuguese": "• Forma (últimos 5): {form}",
+    },
+    "chat_registered": {
+        "french": "🤖 : Ce chat a été enregistré (langue : {language}).",
+        "english": "🤖 : This chat has been registered (language: {language}).",
+        "german": "🤖 : Dieser Chat wurde registriert (Sprache: {language}).",
+        "spanish": "🤖 : Este chat ha sido registrado (idioma: {language}).",
+        "italian": "🤖 : Questa chat è stata registrata (lingua: {language}).",
+        "portuguese": "🤖 : Este chat foi registado (idioma: {language}).",
+    },
+    "chat_already_registered": {
+        "french": "🤖 : Ce chat est déjà enregistré (langue : {language}).",
+        "english": "🤖 : This chat is already registered (language: {language}).",
+        "german": "🤖 : Dieser Chat ist bereits registriert (Sprache: {language}).",
+        "spanish": "🤖 : Este chat ya está registrado (idioma: {language}).",
+        "italian": "🤖 : Questa chat è già registrata (lingua: {language}).",
+        "portuguese": "🤖 : Este chat já está registado (idioma: {language}).",
+    },
+    "chat_language_updated": {
+        "french": "🤖 : Langue de ce chat mise à jour : {language}.",
+        "english": "🤖 : Language of this chat updated: {language}.",
+        "german": "🤖 : Sprache dieses Chats aktualisiert: {language}.",
+        "spanish": "🤖 : Idioma de este chat actualizado: {language}.",
+        "italian": "🤖 : Lingua di questa chat aggiornata: {language}.",
+        "portuguese": "🤖 : Idioma deste chat atualizado: {language}.",
+    },
+    "language_rejected": {
+        "french": "🤖 : Langue non prise en charge, rien n'a été modifié. Langues disponibles : {languages}.",
+        "english": "🤖 : Unsupported language, nothing was changed. Available languages: {languages}.",
+        "german": "🤖 : Sprache nicht unterstützt, nichts wurde geändert. Verfügbare Sprachen: {languages}.",
+        "spanish": "🤖 : Idioma no compatible, no se ha cambiado nada. Idiomas disponibles: {languages}.",
+        "italian": "🤖 : Lingua non supportata, nulla è stato modificato. Lingue disponibili: {languages}.",
+        "portuguese": "🤖 : Idioma não suportado, nada foi alterado. Idiomas disponíveis: {languages}.",
+    },
+}
+
+def has_catalogue(language):
+    """Indique si les textes fixes existent déjà dans cette langue."""
+    return language.lower() in MESSAGE_CATALOGUE["match_start"]
+
+def t(key, language="french", **fields):
+    """Texte fixe `key` dans la langue demandée (français si la langue n'est pas au catalogue)."""
+    templates = MESSAGE_CATALOGUE[key]
+    return templates.get(language.lower(), templates["french"]).format(**fields)
+
+def generation_language(language=LANGUAGE):
+    """Langue dans laquelle le bot rédige un message destiné à `language` : directement cette langue en
+    génération native (textes fixes du catalogue, prompts IA dans la langue cible), sinon le français puis traduction."""
+    if NATIVE_LANGUAGE_GENERATION and has_catalogue(language):
+        return language.lower()
+    return "french"
+
+### FIN DE GESTION DES TEXTES LOCALISES DU BOT
+
 # Fonction pour découper un message selon les limites de la plateforme
 def split_message_by_platform(message, platform="telegram"):
     """
@@ -1702,270 +3385,419 @@ def split_message_by_platform(message, platform="telegram"):
     
     return messages
 
-# Cette fonction reçoit un message, puis envoie le message à chaque chat_id
-async def send_message_to_all_chats(message, language=LANGUAGE):
+# Message déjà diffusé dans un chat, conservé pour pouvoir le compléter (édition ou réponse)
+class SentMessage:
+    __slots__ = ("platform", "chat_id", "message", "text", "language")
+
+    def __init__(self, platform, chat_id, message, text, language):
+        self.platform = platform
+        self.chat_id = chat_id
+        self.message = message
+        self.text = text
+        self.language = language
+
+# Lance la production de chaque variante linguistique d'un message : {langue: tâche asyncio du texte}.
+# message : texte déjà rédigé en source_language (None = texte neutre, jamais traduit), ou fonction
+# langue -> texte (ou coroutine) qui rédige directement dans la langue demandée (voir generation_language).
+# Une langue absente du catalogue reçoit la version française traduite (une traduction par langue).
+# Chaque texte de base n'est rédigé qu'une fois, et chaque variante est prête dès que sa propre base
+# (et sa traduction éventuelle) l'est : une langue traduite ne retarde pas les autres.
+def start_message_variants(message, languages, source_language="french"):
+    languages = sorted(set(languages))
+    if not callable(message):
+        # Texte neutre : chaque langue est sa propre base, sans traduction
+        base_for = {language: source_language or language for language in languages}
+
+        def compose(language):
+            return message
+    else:
+        base_for = {language: generation_language(language) for language in languages}
+        compose = message
+
+    async def _compose(language):
+        text = compose(language)
+        return await text if inspect.isawaitable(text) else text
+
+    bases = {language: asyncio.create_task(_compose(language)) for language in sorted(set(base_for.values()))}
+
+    async def _variant(language):
+        base_language = base_for[language]
+        text = await bases[base_language]
+        if text and language != base_language:
+            log_message(f"Traduction du message de {base_language} vers {language}.")
+            return await translate_message(text, language, base_language)
+        return text
+
+    return {language: asyncio.create_task(_variant(language)) for language in languages}
+
+# Attend chaque variante de son côté puis appelle deliver(langue, texte) aussitôt ; renvoie la
+# concaténation des listes renvoyées. Une variante en échec n'empêche pas l'envoi des autres.
+async def deliver_message_variants(variant_tasks, deliver):
+    async def _deliver(language):
+        try:
+            text = await variant_tasks[language]
+        except Exception as e:
+            log_message(f"Erreur lors de la rédaction de la variante {language} du message : {e}", "ERROR")
+            return []
+        return await deliver(language, text) if text else []
+
+    results = await asyncio.gather(*(_deliver(language) for language in variant_tasks))
+    return [item for result in results for item in result]
+
+# Variante conservée dans l'historique des matchs quand plusieurs langues ont été produites :
+# celle de LANGUAGE si elle existe, sinon la première disponible
+def primary_variant(variants):
+    return variants.get(generation_language()) or next((text for text in variants.values() if text), None)
+
+# Analyse conservée dans l'historique (et résumée en digest) même sans destinataire : si aucune
+# variante n'a été rédigée à l'envoi, generate(langue) la produit dans la langue de référence
+async def reference_analysis(analyses, generate):
+    if not analyses:
+        language = generation_language()
+        log_message(f"Aucune variante rédigée à l'envoi, analyse de référence générée en {language} pour l'historique")
+        analyses[language] = await generate(language)
+    return primary_variant(analyses)
+
+# Abonnés d'une plateforme pour un envoi : {id: langue effective}, vide si le registre est illisible
+def load_subscribers_for_send(path, file_name):
+    try:
+        subscribers = load_subscribers(path)
+        log_message(f"Abonnés chargés depuis le fichier {file_name} : {subscribers}")
+        return {chat_id: subscriber_language(language) for chat_id, language in subscribers.items()}
+    except FileNotFoundError:
+        log_message(f"Fichier {file_name} non trouvé")
+    except json.JSONDecodeError:
+        log_message(f"Erreur de décodage JSON dans {file_name}")
+    except Exception as e:
+        log_message(f"Erreur lors de la lecture des abonnés de {file_name}: {e}")
+    return {}
+
+# Cette fonction reçoit un message, produit une fois la variante de chaque langue des abonnés,
+# puis envoie à chaque chat_id la variante de sa langue, dès qu'elle est prête (un abonné dans une
+# langue traduite ne retarde pas les chats des autres langues).
+# Retourne les messages envoyés (SentMessage) pour un complément éventuel.
+# message / source_language : voir start_message_variants
+async def send_message_to_all_chats(message, source_language="french"):
     log_message("send_message_to_all_chats() appelée.")
 
-    # Traduction du message si la langue n'est pas le français en faisant appel à la fonction spévifique utilisant gpt3.5
-    if language.lower() != "french":
-        log_message(f"Traduction du message car la langue détectée est {language}.")
-        message = await translate_message(message, language)
-    
-    log_message(f"Contenu du message envoyé : {message}")
+    telegram_chats = load_subscribers_for_send("telegram_chat_ids.json", "telegram_chat_ids.json") if USE_TELEGRAM else {}
+    discord_chats = load_subscribers_for_send(discord_channels_path, "discord_channels.json") if USE_DISCORD else {}
+    languages = set(telegram_chats.values()) | set(discord_chats.values())
+    if not languages:
+        log_message("Aucun abonné enregistré, message non envoyé")
+        return []
 
-    # Pour Telegram:
-    if USE_TELEGRAM:
-        log_message("Lecture des IDs de chat enregistrés pour Telegram...")
+    async def deliver(language, text):
+        log_message(f"Contenu du message envoyé ({language}) : {text}")
+        sent_messages = []
+        # Pour Telegram:
+        chat_ids = [chat_id for chat_id, chat_language in telegram_chats.items() if chat_language == language]
+        if chat_ids:
+            sent_messages += await send_variant_to_telegram(text, chat_ids, language)
+        # Pour Discord:
+        channel_ids = [channel_id for channel_id, channel_language in discord_chats.items() if channel_language == language]
+        if channel_ids:
+            sent_messages += await send_variant_to_discord(text, channel_ids, language)
+        return sent_messages
+
+    return await deliver_message_variants(start_message_variants(message, languages, source_language), deliver)
+
+# Envoie une variante aux chats Telegram de sa langue ; retourne les SentMessage
+async def send_variant_to_telegram(text, chat_ids, language):
+    # Découper la variante selon les limites de Telegram (4096 caractères)
+    message_parts = split_message_by_platform(text, "telegram")
+    sent_messages = []
+    for chat_id in chat_ids:
         try:
-            with open("telegram_chat_ids.json", "r") as file:
-                chat_ids = json.load(file)
-                log_message(f"Chat IDs chargés depuis le fichier telegram_chat_ids.json : {chat_ids}")
-            
-            # Découper le message selon les limites de Telegram (4096 caractères)
-            message_parts = split_message_by_platform(message, "telegram")
-            log_message(f"Message découpé en {len(message_parts)} partie(s) pour Telegram")
-            
-            for chat_id in chat_ids:
+            for part in message_parts:
+                # Markdown legacy Telegram : le gras s'écrit *texte* (pas **texte** comme Discord)
+                telegram_part = part.replace("**", "*")
                 try:
-                    for part in message_parts:
-                        # Markdown legacy Telegram : le gras s'écrit *texte* (pas **texte** comme Discord)
-                        telegram_part = part.replace("**", "*")
-                        try:
-                            await bot.send_message(chat_id=chat_id, text=telegram_part, parse_mode="Markdown")
-                        except TelegramBadRequest as e:
-                            # Markdown invalide (souvent généré par le LLM) : renvoyer en
-                            # texte brut plutôt que de perdre le message
-                            log_message(f"Markdown invalide pour Telegram ({e}), renvoi en texte brut")
-                            await bot.send_message(chat_id=chat_id, text=part)
-                        await asyncio.sleep(0.5)  # Délai entre les messages pour éviter le rate limiting
-                except TelegramForbiddenError:
-                    # Évite de log si le bot a été bloqué par des utilisateurs
-                    continue
+                    sent = await bot.send_message(chat_id=chat_id, text=telegram_part, parse_mode="Markdown")
                 except TelegramBadRequest as e:
-                    log_message(f"Erreur lors de l'envoi du message à Telegram (BadRequest) : {e}")
-                except ClientConnectorError as e:
-                    log_message(f"Erreur lors de l'envoi du message à Telegram (ClientConnectorError) : {e}")
-                except TelegramNetworkError as e:
-                    log_message(f"Erreur lors de l'envoi du message à Telegram (NetworkError) : {e}")
-                except TelegramAPIError as e:
-                    if "user is deactivated" not in str(e).lower():
-                        log_message(f"Erreur lors de l'envoi du message à Telegram : {e}")
-                except Exception as e:
-                    log_message(f"Erreur inattendue lors de l'envoi du message à Telegram : {e}")
-        except FileNotFoundError:
-            log_message("Fichier telegram_chat_ids.json non trouvé")
-        except json.JSONDecodeError:
-            log_message("Erreur de décodage JSON dans telegram_chat_ids.json")
+                    # Markdown invalide (souvent généré par le LLM) : renvoyer en
+                    # texte brut plutôt que de perdre le message
+                    log_message(f"Markdown invalide pour Telegram ({e}), renvoi en texte brut")
+                    sent = await bot.send_message(chat_id=chat_id, text=part)
+                await asyncio.sleep(0.5)  # Délai entre les messages pour éviter le rate limiting
+            # Seule la dernière partie est conservée : c'est elle qu'on complète ensuite
+            sent_messages.append(SentMessage("telegram", chat_id, sent, message_parts[-1], language))
+        except TelegramForbiddenError:
+            # Évite de log si le bot a été bloqué par des utilisateurs
+            continue
+        except TelegramBadRequest as e:
+            log_message(f"Erreur lors de l'envoi du message à Telegram (BadRequest) : {e}")
+        except ClientConnectorError as e:
+            log_message(f"Erreur lors de l'envoi du message à Telegram (ClientConnectorError) : {e}")
+        except TelegramNetworkError as e:
+            log_message(f"Erreur lors de l'envoi du message à Telegram (NetworkError) : {e}")
+        except TelegramAPIError as e:
+            if "user is deactivated" not in str(e).lower():
+                log_message(f"Erreur lors de l'envoi du message à Telegram : {e}")
         except Exception as e:
-            log_message(f"Erreur lors de la lecture des IDs Telegram: {e}")
+            log_message(f"Erreur inattendue lors de l'envoi du message à Telegram : {e}")
+    return sent_messages
+
+# Envoie une variante aux channels Discord de sa langue ; retourne les SentMessage
+async def send_variant_to_discord(text, channel_ids, language):
+    # Découper la variante selon les limites de Discord (2000 caractères)
+    message_parts = split_message_by_platform(text, "discord")
+    sent_messages = []
+    for channel_id in channel_ids:
+        channel = bot_discord.get_channel(channel_id)
+        if channel and isinstance(channel, (discord.TextChannel, discord.VoiceChannel)):
+            try:
+                for part in message_parts:
+                    sent = await channel.send(part)
+                    await asyncio.sleep(0.5)  # Délai entre les messages pour éviter le rate limiting
+                sent_messages.append(SentMessage("discord", channel_id, sent, message_parts[-1], language))
+            except discord.Forbidden as e:
+                # Évite de log si le bot a été bloqué par des utilisateurs, concerne aussi d'autres problèmes de permission...
+                continue 
+            except discord.NotFound as e:
+                log_message(f"Erreur: Canal Discord {channel_id} non trouvé : {e}")
+            except discord.HTTPException as e:
+                log_message(f"Erreur HTTP lors de l'envoi du message au canal Discord {channel_id}: {e}")
+            except discord.ClientException as e:
+                log_message(f"Erreur: Argument invalide pour le canal Discord {channel_id}: {e}")
+            except Exception as e:
+                log_message(f"Erreur inattendue lors de l'envoi du message à Discord : {e}")
+    return sent_messages
+
+# Complète des messages déjà diffusés : édition si la plateforme le permet, sinon réponse au message.
+# addition / source_language : voir start_message_variants (une variante par langue des messages,
+# chaque langue est complétée dès que sa variante est prête)
+async def append_to_sent_messages(sent_messages, addition, source_language="french"):
+    log_message("append_to_sent_messages() appelée.")
+    if not sent_messages:
+        return
 
-    # Pour Discord:
-    if USE_DISCORD:
-        log_message("Lecture des IDs de channel pour Discord...")
+    async def deliver(language, variant):
+        for sent in sent_messages:
+            if sent.language == language:
+                await _append_to_sent_message(sent, variant)
+        return []
 
-        # Utilisez le chemin correct pour le fichier discord_channels.json
-        try:
-            if os.path.exists(discord_channels_path):
-                with open(discord_channels_path, "r") as file:
-                    channels = json.load(file)
-                
-                # Découper le message selon les limites de Discord (2000 caractères)
-                message_parts = split_message_by_platform(message, "discord")
-                log_message(f"Message découpé en {len(message_parts)} partie(s) pour Discord")
-                
-                for channel_id in channels:
-                    channel = bot_discord.get_channel(channel_id)
-                    if channel and isinstance(channel, (discord.TextChannel, discord.VoiceChannel)):
-                        try:
-                            for part in message_parts:
-                                await channel.send(part)
-                                await asyncio.sleep(0.5)  # Délai entre les messages pour éviter le rate limiting
-                        except discord.Forbidden as e:
-                            # Évite de log si le bot a été bloqué par des utilisateurs, concerne aussi d'autres problèmes de permission...
-                            continue 
-                        except discord.NotFound as e:
-                            log_message(f"Erreur: Canal Discord {channel_id} non trouvé : {e}")
-                        except discord.HTTPException as e:
-                            log_message(f"Erreur HTTP lors de l'envoi du message au canal Discord {channel_id}: {e}")
-                        except discord.ClientException as e:
-                            log_message(f"Erreur: Argument invalide pour le canal Discord {channel_id}: {e}")
-                        except Exception as e:
-                            log_message(f"Erreur inattendue lors de l'envoi du message à Discord : {e}")
+    # Seul le complément est produit par langue : le texte déjà envoyé l'a été lors du premier envoi
+    await deliver_message_variants(start_message_variants(addition, {sent.language for sent in sent_messages}, source_language), deliver)
+
+async def _append_to_sent_message(sent, variant):
+    text = f"{sent.text}\n\n{variant}"
+    try:
+        if len(split_message_by_platform(text, sent.platform)) == 1:
+            if sent.platform == "telegram":
+                try:
+                    await bot.edit_message_text(text=text.replace("**", "*"), chat_id=sent.chat_id,
+                                                message_id=sent.message.message_id, parse_mode="Markdown")
+                except TelegramBadRequest as e:
+                    log_message(f"Markdown invalide pour Telegram ({e}), édition en texte brut")
+                    await bot.edit_message_text(text=text, chat_id=sent.chat_id, message_id=sent.message.message_id)
             else:
-                log_message("Erreur: Le fichier discord_channels.json n'a pas été trouvé.")
-        except json.JSONDecodeError:
-            log_message("Erreur de décodage JSON dans discord_channels.json")
-        except Exception as e:
-            log_message(f"Erreur lors de la lecture des IDs Discord: {e}")
+                await sent.message.edit(content=text)
+            sent.text = text
+            return
+    except (TelegramAPIError, discord.HTTPException) as e:
+        log_message(f"Édition impossible du message {sent.platform} {sent.chat_id} ({e}), envoi en réponse")
+    except Exception as e:
+        log_message(f"Erreur inattendue lors de l'édition du message {sent.platform} {sent.chat_id} : {e}")
+
+    # Message trop long après ajout ou édition refusée : le complément part en réponse
+    try:
+        for part in split_message_by_platform(variant, sent.platform):
+            await sent.message.reply(part)
+            await asyncio.sleep(0.5)  # Délai entre les messages pour éviter le rate limiting
+    except (TelegramForbiddenError, discord.Forbidden):
+        return
+    except Exception as e:
+        log_message(f"Erreur lors de la réponse au message {sent.platform} {sent.chat_id} : {e}")
+
+# Deuxième temps d'une notification : le commentaire IA complète le message factuel déjà envoyé,
+# sans retarder la boucle de suivi du match.
+# commentary(langue) : coroutine de l'appel IA rédigé dans cette langue ; header/fallback(langue) : textes fixes
+async def _append_llm_commentary(sent_messages, commentary, header, fallback):
+    started_at = time.monotonic()
+
+    async def compose(language):
+        chatgpt_analysis = await commentary(language)
+        return header(language) + chatgpt_analysis if chatgpt_analysis else fallback(language)
+
+    await append_to_sent_messages(sent_messages, compose)
+    log_message(f"Commentaire IA ajouté {time.monotonic() - started_at:.1f}s après le message factuel")
+
+def schedule_llm_commentary(sent_messages, commentary, header, fallback, name):
+    if not sent_messages:
+        # Aucun message diffusé à compléter : inutile de payer l'appel IA
+        log_message("Aucun message factuel envoyé, commentaire IA abandonné")
+        return
+    create_background_task(_append_llm_commentary(sent_messages, commentary, header, fallback), name=name)
 
 # Envoie un message lorsqu'un match est détecté le jour même
 async def send_match_today_message(match_start_time, fixture_id, current_league_id, teams, league, round_info, venue, city):
     log_message("send_match_today_message() appelée.")
-    # Appeler l'API ChatGPT
-    chatgpt_analysis = await call_chatgpt_api_matchtoday(match_start_time, teams, league, round_info, venue, city)
-    if chatgpt_analysis:
-        message = f"🤖 : {chatgpt_analysis}"
-    else:
+
+    async def compose(language):
+        # Appeler l'API ChatGPT
+        chatgpt_analysis = await call_chatgpt_api_matchtoday(match_start_time, teams, league, round_info, venue, city, language)
+        if chatgpt_analysis:
+            return f"🤖 : {chatgpt_analysis}"
         # Repli factuel si l'API IA est indisponible : on annonce quand même le match
         kickoff = match_start_time.strftime('%H:%M') if match_start_time else "?"
-        message = (f"🤖 : Match aujourd'hui : {teams['home']} vs {teams['away']}\n"
-                   f"🏆 {league} — {round_info}\n"
-                   f"🏟️ {venue}, {city}\n"
-                   f"🕒 Coup d'envoi : {kickoff}")
+        return t("match_today", language, home=teams['home'], away=teams['away'], league=league,
+                 round=round_info, venue=venue, city=city, kickoff=kickoff)
 
     # Envoyer le message du match à tous les chats.
-    await send_message_to_all_chats(message)
+    await send_message_to_all_chats(compose)
 
 # Envoie un message de début de match aux utilisateurs avec des informations sur le match, les compositions des équipes.
-async def send_compo_message(match_data, predictions=None, fixture_id=None, teams=None, league=None, round_info=None, venue=None, city=None):
+async def send_compo_message(match_data, predictions=None, tracker=None):
     log_message("send_compo_message() appelée.")
     log_message(f"Informations reçues par l'API : match_data={match_data}, predictions={predictions}")
 
     if match_data is None:
         log_message("Erreur : match_data est None dans send_compo_message")
-        message = "🤖 : Désolé, je n'ai pas pu obtenir les informations sur la composition des équipes pour le moment."
-        chatgpt_analysis = None
-    else:
-        # Appeler l'API ChatGPT
-        chatgpt_analysis = await call_chatgpt_api_compomatch(match_data, predictions)
-        if chatgpt_analysis:
-            message = "🤖 : " + chatgpt_analysis
-        else:
-            message = "🤖 : Désolé, l'analyse d'avant-match est indisponible pour le moment."
+    analyses = {}
 
-        # Sauvegarder l'analyse pré-match (compositions) dans l'historique
-        if fixture_id and chatgpt_analysis:
-            match_info = {
-                "date": datetime.datetime.now(server_timezone).isoformat(),
-                "league": league if league else "Unknown",
-                "round": round_info if round_info else "Unknown",
-                "teams": teams if teams else {},
-                "score": {},
-                "venue": venue if venue else "Unknown",
-                "city": city if city else "Unknown"
-            }
-            save_match_analysis(fixture_id, match_info, chatgpt_analysis)
+    async def compose(language):
+        if match_data is None:
+            return t("compo_unavailable", language)
+        # Appeler l'API ChatGPT
+        chatgpt_analysis = await call_chatgpt_api_compomatch(match_data, predictions, tracker, language)
+        analyses[language] = chatgpt_analysis
+        return "🤖 : " + chatgpt_analysis if chatgpt_analysis else t("prematch_unavailable", language)
 
     # Envoyer le message du match à tous les chats.
-    await send_message_to_all_chats(message)
+    await send_message_to_all_chats(compose)
+
+    # Sauvegarder l'analyse pré-match (compositions) dans l'historique
+    if tracker is None or not tracker.fixture_id or match_data is None:
+        return
+    chatgpt_analysis = await reference_analysis(analyses, lambda language: call_chatgpt_api_compomatch(match_data, predictions, tracker, language))
+    if chatgpt_analysis:
+        match_info = {
+            "date": datetime.datetime.now(server_timezone).isoformat(),
+            "league": tracker.league if tracker.league else "Unknown",
+            "round": tracker.round_info if tracker.round_info else "Unknown",
+            "teams": tracker.teams if tracker.teams else {},
+            "score": {},
+            "venue": tracker.venue if tracker.venue else "Unknown",
+            "city": tracker.city if tracker.city else "Unknown",
+            "team_id": tracker.team_id
+        }
+        save_match_analysis(tracker.fixture_id, match_info, chatgpt_analysis)
 
 # Envoie un message de début de match aux utilisateurs avec des informations sur le match, les compositions des équipes.
 async def send_start_message():
     log_message("send_start_message() appelée.")
     if IS_PAID_API:
-        message = f"🤖 : Le match commence !"
         # Envoyer le message du match à tous les chats.
-        await send_message_to_all_chats(message)
+        await send_message_to_all_chats(lambda language: t("match_start", language))
+
+# Annonce d'un but avec son buteur. Si l'alerte immédiate de ce but est déjà partie, elle est
+# complétée (buteur puis commentaire IA) au lieu d'envoyer un second message presque identique ;
+# sinon le message factuel (sans texte à traduire) part tout de suite, le commentaire IA est ajouté ensuite.
+async def announce_goal(event, player_statistics, elapsed_time, match_data, factual_message):
+    score_string = match_data.score_string()
+    instant_alert = take_instant_goal_alert(match_data, event)
+    if instant_alert:
+        log_message(f"Alerte immédiate complétée avec le buteur {event.player_name}")
+        await append_to_sent_messages(instant_alert, lambda language: t("goal_scorer", language, player=event.player_name, elapsed=elapsed_time))
+        sent_messages = instant_alert
+    else:
+        sent_messages = await send_message_to_all_chats(factual_message, source_language=None)
+    schedule_llm_commentary(sent_messages,
+                            lambda language: call_chatgpt_api_goalmatch(event, player_statistics, elapsed_time, score_string, language),
+                            lambda language: t("goal_commentary", language),
+                            lambda language: t("goal_fallback", language, player=event.player_name),
+                            name=f"goal_commentary_{event.player_id}_{elapsed_time}")
+
+# Plus ancienne alerte immédiate non complétée du côté de l'équipe qui a marqué (None si aucune)
+def take_instant_goal_alert(match_data, event):
+    tracker = get_current_tracker()
+    side = match_data.side_of(event.team_id)
+    if tracker is None or side is None or not tracker.instant_goal_alerts[side]:
+        return None
+    return tracker.instant_goal_alerts[side].pop(0)
 
 # Envoie un message aux utilisateurs pour informer d'un but marqué lors du match en cours, y compris les informations sur le joueur, l'équipe et les statistiques.
-async def send_goal_message(player, team, player_statistics, elapsed_time, match_data, event):
+async def send_goal_message(event, player_statistics, elapsed_time, match_data):
     log_message("send_goal_message() appelée.")
-    #log_message(f"Player: {player}")
-    #log_message(f"Team: {team}")
-    #log_message(f"Player statistics: {player_statistics}")
     log_message(f"Minute du match pour le goal : {elapsed_time}")
-    home_score = match_data['goals']['home']
-    away_score = match_data['goals']['away']
-    # Utilisez team['name'] pour obtenir uniquement le nom de l'équipe
-    message = f"⚽️ {elapsed_time}' - {team['name']}\n {match_data['teams']['home']['name']} {home_score} - {away_score} {match_data['teams']['away']['name']}\n\n"
-    # Pour passer le score à l'api de chatgpt
-    score_string = f"{match_data['teams']['home']['name']} {home_score} - {away_score} {match_data['teams']['away']['name']}"
-    # Appeler l'API ChatGPT
-    chatgpt_analysis = await call_chatgpt_api_goalmatch(player, team, player_statistics, elapsed_time, event, score_string)
-    if chatgpt_analysis:
-        message += "🤖 Infos sur le but :\n" + chatgpt_analysis
-    else:
-        message += f"🤖 : But de {player['name']} !"
-    await send_message_to_all_chats(message)
+    message = f"⚽️ {elapsed_time}' - {event.player_name} ({event.team_name})\n {match_data.score_string()}"
+    await announce_goal(event, player_statistics, elapsed_time, match_data, message)
+
+# Alerte immédiate dès que le score bouge, sans attendre l'événement Goal (buteur) ni l'IA.
+# Les messages envoyés sont gardés pour être complétés par le buteur (voir announce_goal).
+async def send_instant_goal_alert(tracker, match_data, current_score, new_score, elapsed_time, detected_at):
+    log_message("send_instant_goal_alert() appelée.")
+    for side, team_name in (('home', match_data.home_name), ('away', match_data.away_name)):
+        if new_score[side] > current_score[side]:
+            sent_messages = await send_message_to_all_chats(lambda language: t("instant_goal", language, team=team_name, score=match_data.score_string(), elapsed=elapsed_time))
+            if sent_messages:
+                tracker.instant_goal_alerts[side].append(sent_messages)
+            latency = time.monotonic() - detected_at
+            tracker.goal_latencies['instant'].append(latency)
+            log_message(f"[GOAL_LATENCY] Alerte immédiate du but de {team_name} envoyée {latency:.1f}s après la détection du score")
 
 # Envoie un message aux utilisateurs pour informer d'un but marqué lors du match en cours SANS LE SCORE !, y compris les informations sur le joueur, l'équipe et les statistiques.
-async def send_goal_message_significant_increase_in_score(player, team, player_statistics, elapsed_time, match_data, event):
+async def send_goal_message_significant_increase_in_score(event, player_statistics, elapsed_time, match_data):
     log_message("send_goal_message_significant_increase_in_score() appelée.")
-    #log_message(f"Player: {player}")
-    #log_message(f"Team: {team}")
-    #log_message(f"Player statistics: {player_statistics}")
     log_message(f"Minute du match pour le goal : {elapsed_time}")
-    home_score = match_data['goals']['home']
-    away_score = match_data['goals']['away']
-    # Utilisez team['name'] pour obtenir uniquement le nom de l'équipe
-    message = f"⚽️ {elapsed_time}' - {team['name']}\n\n"
-    # Pour passer le score à l'api de chatgpt
-    score_string = f"{match_data['teams']['home']['name']} {home_score} - {away_score} {match_data['teams']['away']['name']}"
-    # Appeler l'API ChatGPT
-    chatgpt_analysis = await call_chatgpt_api_goalmatch(player, team, player_statistics, elapsed_time, event, score_string)
-    if chatgpt_analysis:
-        message += "🤖 Infos sur le but :\n" + chatgpt_analysis
-    else:
-        message += f"🤖 : But de {player['name']} !"
-    await send_message_to_all_chats(message)
+    message = f"⚽️ {elapsed_time}' - {event.player_name} ({event.team_name})"
+    await announce_goal(event, player_statistics, elapsed_time, match_data, message)
 
 # Envoie un message aux utilisateurs pour informer d'un but marqué lors de la séance au tir aux but
-async def send_shootout_goal_message(player, team, player_statistics, event):
+async def send_shootout_goal_message(event, player_statistics):
     log_message("send_shootout_goal_message() appelée.")
-    #log_message(f"Player: {player}")
-    #log_message(f"Team: {team}")
-    #log_message(f"Player statistics: {player_statistics}")
-    # Utilisez team['name'] pour obtenir uniquement le nom de l'équipe
-    message = f"⚽️ Pénalty réussi' - {team['name']}\n\n"
-    # Appeler l'API ChatGPT
-    chatgpt_analysis = await call_chatgpt_api_shootout_goal_match(player, team, player_statistics, event)
-    if chatgpt_analysis:
-        message += "🤖 Infos sur le pénalty :\n" + chatgpt_analysis
-    else:
-        message += f"🤖 : {player['name']} a réussi son tir au but !"
-    await send_message_to_all_chats(message)
+
+    async def compose(language):
+        message = t("shootout_goal", language, team=event.team_name)
+        # Appeler l'API ChatGPT
+        chatgpt_analysis = await call_chatgpt_api_shootout_goal_match(event, player_statistics, language)
+        if chatgpt_analysis:
+            return message + t("shootout_commentary", language) + chatgpt_analysis
+        return message + t("shootout_fallback", language, player=event.player_name)
+
+    await send_message_to_all_chats(compose)
 
 # Envoie juste le score du match si plusieurs buts marqués dans le même intervalle 
 async def updated_score(match_data):
     log_message("updated_score() appelée.")
-    home_score = match_data['goals']['home']
-    away_score = match_data['goals']['away']
-    score_string = f"{match_data['teams']['home']['name']} {home_score} - {away_score} {match_data['teams']['away']['name']}"
-    message = f"🤖 : Score actualisé après les buts : {score_string}"
-    await send_message_to_all_chats(message)    
+    await send_message_to_all_chats(lambda language: t("score_update", language, score=match_data.score_string()))    
 
 # Envoie un message si un but est annulé
 async def send_goal_cancelled_message(previous_score, current_score):
     log_message("send_goal_cancelled_message() appelée.")
-    message = f"❌ But annulé ! Le score revient à {current_score['home']} - {current_score['away']}."
-    await send_message_to_all_chats(message)
+    await send_message_to_all_chats(lambda language: t("goal_cancelled", language, home=current_score['home'], away=current_score['away']))
 
 # Envoie un message aux utilisateurs pour informer d'un carton rouge lors du match en cours, y compris les informations sur le joueur et l'équipe.
-async def send_red_card_message(player, team, elapsed_time, event):
+async def send_red_card_message(event):
     log_message("send_red_card_message() appelée.")
-    message = f"🟥 Carton rouge ! {elapsed_time}'\n ({team['name']})\n\n"
-    # Appeler l'API ChatGPT
-    chatgpt_analysis = await call_chatgpt_api_redmatch(player, team, elapsed_time, event)
-    if chatgpt_analysis:
-        message += "🤖 Infos sur le carton rouge :\n" + chatgpt_analysis
-    else:
-        message += f"🤖 : Carton rouge pour {player['name']} ({team['name']})."
-    await send_message_to_all_chats(message)
+    # Le message factuel part tout de suite, le commentaire IA est ajouté ensuite
+    sent_messages = await send_message_to_all_chats(lambda language: t("red_card", language, elapsed=event.elapsed, team=event.team_name))
+    schedule_llm_commentary(sent_messages, lambda language: call_chatgpt_api_redmatch(event, language),
+                            lambda language: t("red_card_commentary", language),
+                            lambda language: t("red_card_fallback", language, player=event.player_name, team=event.team_name),
+                            name=f"red_card_commentary_{event.player_id}_{event.elapsed}")
 
 # Envoie un message aux utilisateurs pour informer qu'un pénalty a été manqué pendant le match
-async def send_missed_penalty_message(player, team, elapsed_time):
+async def send_missed_penalty_message(event, elapsed_time):
     log_message("send_missed_penalty_message() appelée.")
-    message = f"❌ Pénalty manqué ! {elapsed_time}'\n ({team['name']})\n\n"
-    message += f"🤖 : {player['name']} a manqué son pénalty à la {elapsed_time}ème minute."
-    await send_message_to_all_chats(message)
+    await send_message_to_all_chats(lambda language: t("missed_penalty", language, elapsed=elapsed_time, team=event.team_name, player=event.player_name))
 
 # Envoie un message aux utilisateurs pour informer que le suivi est mis en pause pour les tirs aux but qu'un résumé du match sera envoyé à la fin du match
 async def pause_for_penalty_shootout():
     log_message("pause_for_penalty_shootout appelée")
-    message = "🤖 : Le suivi est mis en pause pour les tirs aux but mais je vous enverrai un résumé du match à la fin.\n"
-    await send_message_to_all_chats(message)
+    await send_message_to_all_chats(lambda language: t("shootout_pause", language))
 
 # Envoie un message aux utilisateurs pour informer que le match a été interrompu
 async def notify_match_interruption():
     log_message("notify_match_interruption appelée")
-    message = "🤖 : Le match a été interrompu !\n"   
-    await send_message_to_all_chats(message)   
+    await send_message_to_all_chats(lambda language: t("match_interrupted", language))   
 
 # Envoie un message aux utilisateurs pour informer qu'on a atteint le maximum de call à l'api et qu'on doit stopper le suivi du match
 async def notify_users_max_api_requests_reached():
     log_message("notify_users_max_api_requests_reached appelée")
-    message = "🤖 : Le nombre maximum de requêtes à l'api de foot a été atteinte. Je dois malheureusement mettre fin au suivi du match.\n"   
-    await send_message_to_all_chats(message)          
+    await send_message_to_all_chats(lambda language: t("api_quota_reached", language))          
 
 # Fonction pour formater les événements bruts en cas d'indisponibilité de l'API OpenRouter
 def format_season_stats_for_prompt(season_stats, team_name):
@@ -2014,7 +3846,7 @@ def format_season_stats_for_prompt(season_stats, team_name):
         log_message(f"Erreur format_season_stats_for_prompt : {e}", "ERROR")
         return ""
 
-def format_season_stats_for_display(season_stats, team_name, league_name):
+def format_season_stats_for_display(season_stats, team_name, league_name, language="french"):
     """
     Formate de manière compacte les statistiques de saison de l'équipe
     pour affichage en fin de match. Compatible Telegram + Discord (Markdown legacy).
@@ -2058,46 +3890,46 @@ def format_season_stats_for_display(season_stats, team_name, league_name):
 
         # En-tête sobre, sans titre Markdown lourd (compat Telegram parse_mode=Markdown)
         lines = []
-        lines.append(f"\n📈 *Saison {team_name} — {league_name}*")
-        lines.append(f"• Bilan : {played_total} J | {wins_total}V {draws_total}N {loses_total}D")
+        lines.append(t("season_title", language, team=team_name, league=league_name))
+        lines.append(t("season_record", language, played=played_total, wins=wins_total, draws=draws_total, loses=loses_total))
         sign = "+" if goal_diff > 0 else ""
-        lines.append(f"• Buts : {goals_for} pour / {goals_against} contre (diff {sign}{goal_diff})")
-        lines.append(f"• Clean sheets : {clean_sheet} | Sans marquer : {failed}")
+        lines.append(t("season_goals", language, goals_for=goals_for, goals_against=goals_against, diff=f"{sign}{goal_diff}"))
+        lines.append(t("season_clean_sheets", language, clean_sheets=clean_sheet, failed=failed))
         if form_recent:
-            lines.append(f"• Forme (5 derniers) : {form_emoji}")
+            lines.append(t("season_form", language, form=form_emoji))
 
         return "\n".join(lines)
     except Exception as e:
         log_message(f"Erreur lors du formatage des stats de saison : {e}", "ERROR")
         return ""
 
-def format_raw_events(events, home_team, away_team):
+def format_raw_events(events, home_team, away_team, language="french"):
     """Formate les événements bruts de l'API football en cas d'indisponibilité de l'API OpenRouter"""
     if not events:
-        return "Aucun événement enregistré."
+        return t("raw_events_none", language)
     
-    formatted = "📋 ÉVÉNEMENTS DU MATCH:\n"
+    formatted = t("raw_events_header", language)
     for event in events:
         try:
-            time_elapsed = event.get('time', {}).get('elapsed', '?')
-            team_name = event.get('team', {}).get('name', 'Unknown')
-            player_name = event.get('player', {}).get('name', 'Unknown')
-            event_type = event.get('type', 'Unknown')
-            event_detail = event.get('detail', '')
+            time_elapsed = event.elapsed if event.elapsed is not None else '?'
+            team_name = event.team_name or 'Unknown'
+            player_name = event.player_name or 'Unknown'
+            event_type = event.type or 'Unknown'
+            event_detail = event.detail
             
             # Formater l'événement de manière lisible
             if event_type == "Goal":
-                formatted += f"⚽️ {time_elapsed}' - {team_name}: {player_name} marque"
+                formatted += t("raw_goal", language, minute=time_elapsed, team=team_name, player=player_name)
                 if event_detail and event_detail != "Normal Goal":
                     formatted += f" ({event_detail})"
                 formatted += "\n"
             elif event_type == "Card":
                 if event_detail == "Red Card":
-                    formatted += f"🟥 {time_elapsed}' - {team_name}: {player_name} carton rouge\n"
+                    formatted += t("raw_red_card", language, minute=time_elapsed, team=team_name, player=player_name)
                 elif event_detail == "Yellow Card":
-                    formatted += f"🟨 {time_elapsed}' - {team_name}: {player_name} carton jaune\n"
+                    formatted += t("raw_yellow_card", language, minute=time_elapsed, team=team_name, player=player_name)
             elif event_type == "Substitution":
-                formatted += f"🔄 {time_elapsed}' - {team_name}: {player_name} remplacé\n"
+                formatted += t("raw_substitution", language, minute=time_elapsed, team=team_name, player=player_name)
             elif event_type == "Var":
                 formatted += f"📺 {time_elapsed}' - VAR: {event_detail}\n"
         except Exception as e:
@@ -2107,96 +3939,567 @@ def format_raw_events(events, home_team, away_team):
     return formatted
 
 # Envoie un message de fin de match aux utilisateurs avec le score final.
-async def send_end_message(home_team, away_team, home_score, away_score, match_statistics, events):
+async def send_end_message(home_team, away_team, home_score, away_score, match_statistics, events, tracker):
     log_message("send_end_message() appelée.")
-    message = f"🏁 Fin du match !\n{home_team} {home_score} - {away_score} {away_team}\n\n"
-    
-    # Appeler l'API ChatGPT et ajouter la réponse à la suite des statistiques du match
-    chatgpt_analysis = await call_chatgpt_api_endmatch(match_statistics, events, home_team, home_score, away_score, away_team)
-
-    # None = API IA définitivement indisponible : on envoie les événements bruts à la place
-    if not chatgpt_analysis:
-        log_message("API OpenRouter indisponible, envoi des événements bruts à la place")
-        message += "⚠️ Analyse IA indisponible, voici les événements du match :\n\n"
-        message += format_raw_events(events, home_team, away_team)
-        
-        # Ajouter les statistiques si disponibles
-        if match_statistics and len(match_statistics) >= 2:
-            message += "\n📊 STATISTIQUES:\n"
+
+    # Statistiques pertinentes de la saison pour notre équipe dans la ligue du match, communes à toutes les langues.
+    # On réutilise le cache mémoire alimenté avant la compo (zéro appel API ici).
+    # Fallback : si le cache est vide (ex: échec à la compo), on tente un appel tardif.
+    season_stats = None
+    try:
+        season_stats = tracker.season_stats
+        if not season_stats and tracker.league_id and tracker.team_id and SEASON_ID:
+            log_message("Cache stats saison vide, fallback : tentative de récupération en fin de match.")
+            season_stats = await get_team_season_statistics(tracker.league_id, tracker.team_id, SEASON_ID)
+    except Exception as e:
+        log_message(f"Erreur lors de la récupération des stats de saison pour le message de fin : {e}", "ERROR")
+    league_name_for_stats = tracker.league or ((season_stats or {}).get('league', {}) or {}).get('name', 'Compétition')
+    analyses = {}
+
+    async def compose(language):
+        message = t("end_header", language, home=home_team, home_score=home_score, away_score=away_score, away=away_team)
+
+        # Appeler l'API ChatGPT et ajouter la réponse à la suite des statistiques du match
+        chatgpt_analysis = await call_chatgpt_api_endmatch(match_statistics, events, home_team, home_score, away_score, away_team, tracker, language)
+        analyses[language] = chatgpt_analysis
+
+        # None = API IA définitivement indisponible : on envoie les événements bruts à la place
+        if not chatgpt_analysis:
+            log_message("API OpenRouter indisponible, envoi des événements bruts à la place")
+            message += t("end_ai_unavailable", language)
+            message += format_raw_events(events, home_team, away_team, language)
+
+            # Ajouter les statistiques si disponibles
+            if match_statistics:
+                message += t("end_statistics", language)
+                for stat_type, home_value, away_value in match_statistics:
+                    message += f"• {stat_type}: {home_value} - {away_value if away_value is not None else '?'}\n"
+        else:
+            message += t("end_analysis", language) + chatgpt_analysis
+
+        if season_stats:
             try:
-                for home_stat, away_stat in zip(match_statistics[0].get('statistics', []), match_statistics[1].get('statistics', [])):
-                    if 'type' in home_stat and 'value' in home_stat:
-                        message += f"• {home_stat['type']}: {home_stat['value']} - {away_stat.get('value', '?')}\n"
+                stats_block = format_season_stats_for_display(season_stats, tracker.team_name, league_name_for_stats, language)
+                if stats_block:
+                    message += "\n" + stats_block
             except Exception as e:
-                log_message(f"Erreur lors du formatage des statistiques : {e}")
-    else:
-        message += "🤖 Mon analyse :\n" + chatgpt_analysis
-    
+                log_message(f"Erreur lors de l'ajout des stats de saison au message de fin : {e}", "ERROR")
+        return message
+
+    await send_message_to_all_chats(compose)
+
     # Sauvegarder l'analyse post-match dans l'historique
-    league_name_for_stats = None
+    chatgpt_analysis = await reference_analysis(analyses, lambda language: call_chatgpt_api_endmatch(
+        match_statistics, events, home_team, home_score, away_score, away_team, tracker, language))
     try:
         data = load_match_history()
-        if data.get("matches"):
-            # Mettre à jour le dernier match avec l'analyse post-match
-            last_match = data["matches"][-1]
-            last_match["score"] = {
+        # Retrouver l'entrée de CE match (plusieurs matchs peuvent être suivis en parallèle,
+        # la dernière entrée de l'historique n'est donc pas forcément la bonne)
+        match_entry = next((m for m in data.get("matches", []) if m.get("fixture_id") == tracker.fixture_id), None)
+        if match_entry is not None:
+            match_entry["score"] = {
                 "home": home_score,
                 "away": away_score
             }
             # Ne pas écraser l'historique avec un échec d'analyse (None) : le contexte
             # des prochains prompts afficherait sinon un message d'erreur comme analyse
-            last_match["post_match_analysis"] = chatgpt_analysis or None
-            league_name_for_stats = last_match.get("league")
+            match_entry["post_match_analysis"] = chatgpt_analysis or None
             save_match_history(data)
-            log_message(f"Analyse post-match sauvegardée pour le match {last_match.get('fixture_id')}")
+            log_message(f"Analyse post-match sauvegardée pour le match {tracker.fixture_id}")
+        elif chatgpt_analysis:
+            # Pas d'analyse pré-match enregistrée (ex: échec IA à la compo) : on crée l'entrée
+            match_info = {
+                "league": tracker.league if tracker.league else "Unknown",
+                "round": tracker.round_info if tracker.round_info else "Unknown",
+                "teams": tracker.teams if tracker.teams else {},
+                "score": {"home": home_score, "away": away_score},
+                "venue": tracker.venue if tracker.venue else "Unknown",
+                "city": tracker.city if tracker.city else "Unknown",
+                "team_id": tracker.team_id
+            }
+            save_match_analysis(tracker.fixture_id, match_info, None, chatgpt_analysis)
     except Exception as e:
         log_message(f"Erreur lors de la sauvegarde de l'analyse post-match : {e}")
 
-    # Ajouter les statistiques pertinentes de la saison pour notre équipe dans la ligue du match.
-    # On réutilise le cache mémoire alimenté avant la compo (zéro appel API ici).
-    # Fallback : si le cache est vide (ex: échec à la compo), on tente un appel tardif.
-    try:
-        global current_season_stats, current_league_id
-        season_stats = current_season_stats
-        if not season_stats and current_league_id and TEAM_ID and SEASON_ID:
-            log_message("Cache stats saison vide, fallback : tentative de récupération en fin de match.")
-            season_stats = await get_team_season_statistics(current_league_id, TEAM_ID, SEASON_ID)
-        if season_stats:
-            if not league_name_for_stats:
-                league_name_for_stats = (season_stats.get('league', {}) or {}).get('name', 'Compétition')
-            stats_block = format_season_stats_for_display(season_stats, TEAM_NAME, league_name_for_stats)
-            if stats_block:
-                message += "\n" + stats_block
-    except Exception as e:
-        log_message(f"Erreur lors de l'ajout des stats de saison au message de fin : {e}", "ERROR")
-
-    await send_message_to_all_chats(message)
+    # Résumé compact de l'analyse pour l'historique des prochains prompts (après l'envoi : n'affecte pas les fans)
+    if chatgpt_analysis and HISTORY_DIGEST_TOKENS > 0:
+        await store_match_digest(tracker.fixture_id, chatgpt_analysis)
     
     # Afficher le résumé des coûts à la fin du match
-    log_cost_summary()
+    log_cost_summary(tracker)
+
+### DEBUT DE GESTION DES SERIALISEURS COMPACTS DES PROMPTS
+
+# Les prompts ne reçoivent plus les repr Python des objets de l'API (nulls, ids, URLs de photos) :
+# chaque type de donnée a son sérialiseur qui ne garde que les champs utiles au commentaire.
+
+# Budget (tokens estimés, voir estimate_tokens) des données variables de chaque type de prompt
+PROMPT_PAYLOAD_BUDGETS = {
+    "goal": 200,
+    "shootout": 150,
+    "red_card": 120,
+    "compo": 600,
+}
+
+# (libellé, groupe, clé) des statistiques joueur api-football reprises dans les prompts.
+# Le temps de jeu (games.minutes), souvent faux en direct, n'est volontairement pas repris.
+PLAYER_STAT_FIELDS = (
+    ("poste", "games", "position"),
+    ("note", "games", "rating"),
+    ("buts", "goals", "total"),
+    ("passes décisives", "goals", "assists"),
+    ("tirs", "shots", "total"),
+    ("tirs cadrés", "shots", "on"),
+    ("passes", "passes", "total"),
+    ("passes clés", "passes", "key"),
+    ("précision passes %", "passes", "accuracy"),
+    ("dribbles réussis", "dribbles", "success"),
+    ("duels gagnés", "duels", "won"),
+    ("tacles", "tackles", "total"),
+    ("pénaltys marqués", "penalty", "scored"),
+)
+
+def serialize_player_statistics(player_statistics):
+    """Statistiques d'un joueur sur le match : 'poste M, note 7.4, tirs 3, ...' (valeurs nulles omises)."""
+    stats = player_statistics[0] if isinstance(player_statistics, list) and player_statistics else player_statistics
+    if not isinstance(stats, dict):
+        return ""
+    parts = []
+    for label, group, key in PLAYER_STAT_FIELDS:
+        value = (stats.get(group) or {}).get(key)
+        if value not in (None, 0, "0", ""):
+            parts.append(f"{label} {value}")
+    return ", ".join(parts)
+
+def serialize_lineup(team_name, lineup):
+    """Composition d'une équipe : 'Équipe (4-3-3) : 1 Nom (G), 4 Nom (D), ...'."""
+    players = []
+    for entry in lineup.get("startXI") or []:
+        player = entry.get("player") or {}
+        number = f"{player['number']} " if player.get("number") is not None else ""
+        position = f" ({player['pos']})" if player.get("pos") else ""
+        players.append(f"{number}{player.get('name') or '?'}{position}")
+    formation = f" ({lineup['formation']})" if lineup.get("formation") else ""
+    return f"{team_name}{formation} : {', '.join(players)}"
+
+def serialize_compo_match(match_data):
+    """Match et compositions de départ pour le prompt d'avant-match."""
+    teams = match_data.get("teams") or {}
+    home = (teams.get("home") or {}).get("name", "?")
+    away = (teams.get("away") or {}).get("name", "?")
+    lines = [f"{home} contre {away}"]
+    for team_name, lineup in (match_data.get("lineups") or {}).items():
+        if isinstance(lineup, dict) and lineup.get("startXI"):
+            lines.append(serialize_lineup(team_name, lineup))
+    return "\n".join(lines)
+
+def fit_prompt_payload(kind, payload):
+    """Mesure les données variables d'un prompt et les ramène à leur budget si besoin."""
+    budget = PROMPT_PAYLOAD_BUDGETS[kind]
+    tokens = estimate_tokens(payload)
+    if tokens > budget:
+        log_message(f"[PROMPT_SIZE] {kind} : ~{tokens} tokens, au-delà du budget de {budget}, troncature", "WARNING")
+        return clip_to_token_budget(payload, budget)
+    log_message(f"[PROMPT_SIZE] {kind} : ~{tokens} tokens (budget {budget})")
+    return payload
+
+### FIN DE GESTION DES SERIALISEURS COMPACTS DES PROMPTS
+
+### DEBUT DE GESTION DU CACHE DES REPONSES IA
+
+# Chemin du fichier de persistance du cache (survit aux redémarrages)
+llm_cache_path = os.path.join(script_dir, 'llm_cache.json')
+# Nombre maximal de réponses conservées (les moins récemment utilisées sont évincées)
+LLM_CACHE_MAX_ENTRIES = 500
+# Durée de validité par type d'appel, en secondes
+LLM_CACHE_TTLS = {
+    "translation": 30 * 86400,  # chaînes fixes traduites : stables
+    "matchtoday": 12 * 3600,
+    "compo": 6 * 3600,
+    "goal": 2 * 3600,
+    "shootout": 2 * 3600,
+    "red_card": 2 * 3600,
+    "endmatch": 24 * 3600,
+    "digest": 7 * 86400,
+}
+
+class LLMResponseCache:
+    """
+    Cache des réponses IA adressé par contenu : la clé est un hash normalisé du modèle,
+    des messages et de max_tokens. Un redémarrage ou un envoi retenté ne repaie pas
+    (et n'attend pas) un prompt identique. Persisté sur disque, borné en taille (LRU).
+    """
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        # Ordre d'insertion = ordre d'utilisation (le plus ancien en tête)
+        self.entries = {}
+        self.load()
+
+    @staticmethod
+    def key(data):
+        """Hash du prompt, insensible aux espaces de fin de ligne et aux lignes vides de bord."""
+        def normalize(content):
+            return "\n".join(line.rstrip() for line in (content or "").strip().splitlines())
+        payload = {
+            "model": data.get("model"),
+            "max_tokens": data.get("max_tokens"),
+            "messages": [[m.get("role"), normalize(m.get("content"))] for m in data.get("messages", [])]
+        }
+        serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as file:
+                    self.entries = json.load(file).get("entries", {})
+        except (json.JSONDecodeError, OSError, AttributeError) as e:
+            log_message(f"Cache des réponses IA illisible ({e}), réinitialisation.", "WARNING")
+            self.entries = {}
+        self._evict()
+
+    def save(self):
+        try:
+            write_json_atomic(self.path, {"entries": self.entries})
+        except Exception as e:
+            log_message(f"Erreur lors de la sauvegarde du cache des réponses IA : {e}", "ERROR")
+
+    def _evict(self):
+        now = time.time()
+        self.entries = {key: entry for key, entry in self.entries.items() if entry.get("expires_at", 0) > now}
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+
+    def get(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None or entry.get("expires_at", 0) <= time.time():
+            return None
+        self.entries[key] = entry
+        return entry
+
+    def put(self, key, kind, text, usage=None):
+        usage = usage or {}
+        self.entries.pop(key, None)
+        self.entries[key] = {
+            "kind": kind,
+            "text": text,
+            "expires_at": time.time() + LLM_CACHE_TTLS.get(kind, 3600),
+            "input_tokens": usage.get("prompt_tokens", 0),
+            "output_tokens": usage.get("completion_tokens", 0)
+        }
+        self._evict()
+        self.save()
+
+llm_response_cache = LLMResponseCache(llm_cache_path, LLM_CACHE_MAX_ENTRIES)
+
+# Passe par le cache avant tout appel IA : un hit ne touche pas le réseau.
+# fetch : fonction sans argument renvoyant la coroutine d'appel réseau -> (texte ou None, usage)
+async def cached_llm_call(kind, data, fetch):
+    key = None
+    if kind is not None and LLM_CACHE:
+        key = LLMResponseCache.key(data)
+        entry = llm_response_cache.get(key)
+        if entry is not None:
+            track_llm_cache_hit(entry, f"{kind}({data.get('model', 'unknown')})")
+            return entry["text"]
+    # Délai maximal du type d'appel : au-delà, la requête en cours est annulée et l'appelant
+    # envoie son message de repli (un commentaire tardif vaut moins qu'un message immédiat)
+    input_tokens = sum(estimate_tokens(m.get("content") or "") for m in data.get("messages", []))
+    deadline = llm_deadline(kind, input_tokens)
+    started_at = time.monotonic()
+    try:
+        # L'attente dans la file de l'ordonnanceur compte dans le délai
+        estimated_tokens = input_tokens + data.get("max_tokens", 0)
+        text, usage = await asyncio.wait_for(llm_scheduler.run(kind, data.get("model", "unknown"), estimated_tokens, fetch),
+                                             timeout=deadline)
+    except asyncio.TimeoutError:
+        record_llm_latency(kind, time.monotonic() - started_at, missed_deadline=True)
+        log_message(f"[LLM_LATENCY] {kind} : délai de {deadline:.0f}s dépassé, appel annulé, message de repli", "WARNING")
+        return None
+    if kind is not None:
+        record_llm_latency(kind, time.monotonic() - started_at)
+    # Les échecs (None) ne sont jamais mis en cache
+    if key is not None and text:
+        llm_response_cache.put(key, kind, text, usage)
+    return text
+
+### FIN DE GESTION DU CACHE DES REPONSES IA
+
+### DEBUT DE GESTION DE L'ORDONNANCEUR DES APPELS IA
+
+# Priorité par type d'appel (0 = la plus haute) : événements en direct, puis analyses,
+# puis traductions, puis travaux de fond
+LLM_PRIORITIES = {
+    "goal": 0,
+    "shootout": 0,
+    "red_card": 0,
+    "matchtoday": 1,
+    "compo": 1,
+    "endmatch": 1,
+    "translation": 2,
+    "digest": 3,
+}
+LLM_LIVE_PRIORITY = 0
+
+class LLMScheduler:
+    """
+    File d'attente unique des appels IA : au plus max_concurrency appels simultanés,
+    servis par priorité puis dans l'ordre d'arrivée (minimum 2). Un emplacement est toujours gardé
+    pour les événements en direct, qui ne passent ainsi jamais derrière du travail de fond.
+    Le rythme en tokens/minute de chaque modèle est lissé sur une fenêtre glissante de 60 s
+    (les événements en direct sont comptés mais jamais retenus).
+    """
+
+    def __init__(self, max_concurrency, tokens_per_minute):
+        # Au moins deux emplacements : avec un seul, une traduction ou un résumé pourrait
+        # occuper l'emplacement réservé et faire attendre le commentaire d'un but
+        if max_concurrency < 2:
+            log_message(f"LLM_MAX_CONCURRENCY = {max_concurrency} : minimum 2 (un emplacement réservé au direct), valeur portée à 2", "WARNING")
+        self.max_concurrency = max(2, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.running = 0
+        self.running_background = 0
+        # Tas (priorité, ordre d'arrivée, future) des appels en attente d'un emplacement
+        self.waiting = []
+        self.arrivals = 0
+        self.token_log = {}
+        self.max_queue_depth = 0
+        self.queue_waits = {}
+
+    def _can_start(self, priority):
+        if self.running >= self.max_concurrency:
+            return False
+        # Emplacement réservé aux événements en direct
+        return priority == LLM_LIVE_PRIORITY or self.running_background < self.max_concurrency - 1
+
+    def _start(self, priority):
+        self.running += 1
+        if priority != LLM_LIVE_PRIORITY:
+            self.running_background += 1
+
+    def _release(self, priority):
+        self.running -= 1
+        if priority != LLM_LIVE_PRIORITY:
+            self.running_background -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """Attribue les emplacements libres aux appels en attente, par priorité."""
+        while self.waiting:
+            waiting_priority, _, future = self.waiting[0]
+            if future.cancelled():
+                heapq.heappop(self.waiting)
+                continue
+            if not self._can_start(waiting_priority):
+                break
+            heapq.heappop(self.waiting)
+            self._start(waiting_priority)
+            future.set_result(None)
+
+    async def _acquire(self, priority):
+        future = asyncio.get_running_loop().create_future()
+        self.arrivals += 1
+        heapq.heappush(self.waiting, (priority, self.arrivals, future))
+        self._dispatch()
+        self.max_queue_depth = max(self.max_queue_depth, len(self.waiting))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Annulé juste après avoir obtenu son emplacement : le rendre
+            if future.done() and not future.cancelled():
+                self._release(priority)
+            raise
+
+    async def _pace(self, model, tokens, priority):
+        if self.tokens_per_minute <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            log = [(at, count) for at, count in self.token_log.get(model, []) if now - at < 60]
+            self.token_log[model] = log
+            if priority == LLM_LIVE_PRIORITY or not log or sum(count for _, count in log) + tokens <= self.tokens_per_minute:
+                log.append((now, tokens))
+                return
+            await asyncio.sleep(60 - (now - log[0][0]))
+
+    async def run(self, kind, model, tokens, fetch):
+        """Exécute fetch() quand le rythme du modèle et un emplacement de sa priorité le permettent."""
+        priority = LLM_PRIORITIES.get(kind, 1)
+        queued_at = time.monotonic()
+        await self._pace(model, tokens, priority)
+        await self._acquire(priority)
+        wait = time.monotonic() - queued_at
+        self.queue_waits.setdefault(kind, []).append(wait)
+        if wait >= 1:
+            log_message(f"[LLM_QUEUE] {kind} : {wait:.1f}s d'attente avant l'appel à {model} "
+                        f"({self.running} en cours, {len(self.waiting)} en file)")
+        try:
+            return await fetch()
+        finally:
+            self._release(priority)
+
+    def log_stats(self):
+        log_message(f"[LLM_QUEUE] Profondeur maximale de la file : {self.max_queue_depth}, "
+                    f"{self.running} appel(s) en cours, {len(self.waiting)} en file")
+        for kind, waits in sorted(self.queue_waits.items()):
+            log_message(f"[LLM_QUEUE] {kind} : {len(waits)} appel(s), attente p50 {_percentile(waits, 50):.1f}s, p95 {_percentile(waits, 95):.1f}s")
+
+llm_scheduler = LLMScheduler(LLM_MAX_CONCURRENCY, LLM_TOKENS_PER_MINUTE)
+
+### FIN DE GESTION DE L'ORDONNANCEUR DES APPELS IA
+
+### DEBUT DE GESTION DES DELAIS DES APPELS IA
+
+# Délai maximal (secondes) de chaque type d'appel IA, retries compris
+LLM_DEADLINES = {
+    "goal": 20.0,
+    "shootout": 20.0,
+    "red_card": 20.0,
+    "translation": 15.0,
+    "matchtoday": 90.0,
+    "compo": 60.0,
+    "endmatch": 120.0,
+    "digest": 60.0,
+}
+
+# Délai ajouté par tranche de 1000 tokens d'entrée, pour les appels dont la durée suit la taille
+# du texte : traduire une analyse complète prend bien plus longtemps qu'une ligne de but
+LLM_DEADLINE_PER_1K_INPUT_TOKENS = {
+    "translation": 25.0,
+}
+
+def llm_deadline(kind, input_tokens):
+    """Délai d'un appel IA : délai de base du type, allongé selon la taille de l'entrée si besoin."""
+    deadline = LLM_DEADLINES.get(kind)
+    if deadline is None:
+        return None
+    return deadline + LLM_DEADLINE_PER_1K_INPUT_TOKENS.get(kind, 0.0) * input_tokens / 1000
+
+def record_llm_latency(kind, latency, missed_deadline=False):
+    """Enregistre la durée d'un appel IA (et un éventuel dépassement de délai) pour le match en cours."""
+    tracker = get_current_tracker()
+    if tracker is None:
+        return
+    tracker.llm_latencies.setdefault(kind, []).append(latency)
+    if missed_deadline:
+        tracker.llm_deadline_misses[kind] = tracker.llm_deadline_misses.get(kind, 0) + 1
+
+def _percentile(values, percent):
+    # Rang le plus proche : ceil(p * n / 100)
+    ordered = sorted(values)
+    rank = -(-percent * len(ordered) // 100)
+    return ordered[max(1, rank) - 1]
+
+def log_llm_latency_stats(tracker):
+    for kind, latencies in sorted(tracker.llm_latencies.items()):
+        log_message(f"[LLM_LATENCY] Match {tracker.fixture_id} - {kind} : {len(latencies)} appel(s), "
+                    f"p50 {_percentile(latencies, 50):.1f}s, p95 {_percentile(latencies, 95):.1f}s, "
+                    f"délai (base {LLM_DEADLINES.get(kind)}s) dépassé {tracker.llm_deadline_misses.get(kind, 0)} fois")
+
+### FIN DE GESTION DES DELAIS DES APPELS IA
+
+### DEBUT DE GESTION DES REQUETES IA DOUBLEES (HEDGING)
+
+# Tant que le modèle principal n'a pas assez d'historique pour ce type d'appel, délai fixe avant doublage
+LLM_HEDGE_DEFAULT_DELAY = 8.0
+LLM_HEDGE_MIN_SAMPLES = 5
+# Durées récentes du modèle principal par type d'appel (fenêtre glissante)
+LLM_HEDGE_WINDOW = 50
+primary_llm_latencies = {}
+
+def hedge_delay(kind):
+    """Attente avant de doubler la requête : p90 observé du modèle principal pour ce type d'appel."""
+    latencies = primary_llm_latencies.get(kind) or []
+    if len(latencies) < LLM_HEDGE_MIN_SAMPLES:
+        return LLM_HEDGE_DEFAULT_DELAY
+    return _percentile(latencies, 90)
+
+def _record_primary_latency(kind, latency):
+    latencies = primary_llm_latencies.setdefault(kind, [])
+    latencies.append(latency)
+    del latencies[:-LLM_HEDGE_WINDOW]
+
+# Si le modèle principal n'a pas répondu après son p90 habituel, la même requête part vers
+# GPT_MODEL_NAME_HEDGE : la première réponse non vide l'emporte et l'autre requête est annulée.
+# Chaque requête terminée suit ses propres coûts (track_api_cost dans _post_chatgpt) ; une requête
+# annulée n'a pas d'usage, mais le fournisseur facture au moins son prompt : il est compté sur estimation.
+async def _hedged_post_chatgpt(data, max_retries, kind):
+    if not GPT_MODEL_NAME_HEDGE or GPT_MODEL_NAME_HEDGE == data.get("model"):
+        return await _post_chatgpt(data, max_retries)
+
+    started_at = time.monotonic()
+    primary = asyncio.create_task(_post_chatgpt(data, max_retries))
+    tasks = [primary]
+    try:
+        delay = hedge_delay(kind)
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            log_message(f"[LLM_HEDGE] {kind} : pas de réponse de {data.get('model', 'unknown')} après {delay:.1f}s, "
+                        f"requête doublée vers {GPT_MODEL_NAME_HEDGE}")
+            tasks.append(asyncio.create_task(_post_chatgpt({**data, "model": GPT_MODEL_NAME_HEDGE}, max_retries)))
+
+        pending = set(tasks)
+        result = (None, None)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is primary:
+                    _record_primary_latency(kind, time.monotonic() - started_at)
+                text, usage = task.result()
+                if text:
+                    if len(tasks) > 1:
+                        winner = data.get('model', 'unknown') if task is primary else GPT_MODEL_NAME_HEDGE
+                        log_message(f"[LLM_HEDGE] {kind} : réponse de {winner} retenue après {time.monotonic() - started_at:.1f}s")
+                    return text, usage
+                result = (text, usage)
+        return result
+    finally:
+        for task in tasks:
+            if not task.done():
+                if task is primary:
+                    # Durée minimale du principal, pour que son p90 reflète aussi ses lenteurs
+                    _record_primary_latency(kind, time.monotonic() - started_at)
+                task.cancel()
+                _track_cancelled_request_cost(data, data.get('model', 'unknown') if task is primary else GPT_MODEL_NAME_HEDGE, kind)
+
+def _track_cancelled_request_cost(data, model, kind):
+    input_tokens = sum(estimate_tokens(m.get("content") or "") for m in data.get("messages", []))
+    log_message(f"[LLM_HEDGE] {kind} : requête {model} annulée, ~{input_tokens} tokens d'entrée comptés sur estimation "
+                f"(tokens de sortie déjà générés inconnus)")
+    track_api_cost(input_tokens, 0, f"call_chatgpt_api({model}) annulée")
+
+### FIN DE GESTION DES REQUETES IA DOUBLEES (HEDGING)
 
 # DEBUT DE CODE POUR CONFIGURATION IA
 
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {API_KEY}",
+    "HTTP-Referer": "https://github.com/Macmachi/gptfoot",
+    "X-Title": "gptfoot"
+}
+
 # Fonction pour traduire les messages dans la langue désirée
-async def translate_message(message, language):
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_KEY}",
-        "HTTP-Referer": "https://github.com/Macmachi/gptfoot",
-        "X-Title": "gptfoot"
-    }
-        
-    log_message(f"La langue détectée n'est pas le français donc on lance la traduction")
-    translation_prompt = f"Translate the following sentence from french to {language}: {message}"
+async def translate_message(message, language, source_language="french"):
+    log_message(f"La langue cible diffère de la langue de rédaction ({source_language}) donc on lance la traduction")
+    translation_prompt = f"Translate the following sentence from {source_language} to {language}: {message}"
     translation_data = {
         "model": GPT_MODEL_NAME_TRANSLATION,
         "messages": [{"role": "user", "content": translation_prompt}],
         "max_tokens": 2000
     }
-    
+
+    translated_message = await cached_llm_call("translation", translation_data, lambda: _post_translation(translation_data))
+    # Si la traduction est vide ou a échoué, mieux vaut envoyer le message original
+    return translated_message if translated_message else message
+
+async def _post_translation(translation_data):
     try:
         client = await get_openrouter_client()
-        translation_response = await client.post("https://openrouter.ai/api/v1/chat/completions", headers=headers, json=translation_data, timeout=60.0)
+        translation_response = await client.post(OPENROUTER_CHAT_URL, headers=OPENROUTER_HEADERS, json=translation_data, timeout=60.0)
         translation_response.raise_for_status()
         response_data = translation_response.json()
         translated_message = (response_data["choices"][0]["message"].get("content") or "").strip()
@@ -2205,34 +4508,58 @@ async def translate_message(message, language):
         if ENABLE_COST_TRACKING and "usage" in response_data:
             input_tokens = response_data["usage"].get("prompt_tokens", 0)
             output_tokens = response_data["usage"].get("completion_tokens", 0)
-            track_api_cost(input_tokens, output_tokens, "translate_message")
+            track_api_cost(input_tokens, output_tokens, "translate_message", usage_cached_tokens(response_data["usage"]))
 
-        # Si la traduction est vide, mieux vaut envoyer le message original
-        return translated_message if translated_message else message
+        return translated_message or None, response_data.get("usage")
     except httpx.HTTPError as e:
         log_message(f"Erreur lors de la traduction du message via l'API OpenRouter : {e}", "ERROR")
         # En cas d'échec, on envoie le message original plutôt qu'un message d'erreur
-        return message
+        return None, None
     except Exception as e:
         log_message(f"Erreur inattendue lors de la traduction du message : {e}", "ERROR")
-        return message
+        return None, None
+
+# Logge l'échec d'un appel OpenRouter et renvoie l'attente avant le prochain essai (None = abandon)
+def _openrouter_retry_delay(e, attempt, max_retries):
+    last_attempt = attempt >= max_retries - 1
+    if isinstance(e, httpx.TimeoutException):
+        log_message(f"Timeout lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
+    elif isinstance(e, httpx.HTTPStatusError):
+        status_code = e.response.status_code
+        log_message(f"Erreur HTTP {status_code} lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
+
+        # Gestion spécifique des codes d'erreur
+        if status_code == 401:
+            log_message("Erreur d'authentification : Vérifiez votre clé API OpenRouter", "ERROR")
+            return None
+        elif status_code == 429:
+            log_message("Rate limit atteint, attente avant retry...")
+            return None if last_attempt else 5 * (2 ** attempt)  # Backoff plus long pour rate limit
+        elif status_code >= 500:
+            log_message(f"Erreur serveur {status_code}, retry...")
+        else:
+            log_message(f"Erreur HTTP {status_code}")
+    elif isinstance(e, httpx.NetworkError):
+        log_message(f"Erreur réseau lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
+    else:
+        log_message(f"Erreur inattendue lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
+    return None if last_attempt else 2 ** attempt  # Backoff exponentiel
 
 # Fonction générique pour appeler l'API ChatGPT avec retry.
 # Renvoie le texte de la réponse, ou None si l'appel a définitivement échoué :
 # chaque appelant décide alors du message de repli à envoyer aux utilisateurs.
-async def call_chatgpt_api(data, max_retries=3):
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_KEY}",
-        "HTTP-Referer": "https://github.com/Macmachi/gptfoot",
-        "X-Title": "gptfoot"
-    }
+# cache_kind : type d'appel pour le cache des réponses (None = jamais mis en cache)
+async def call_chatgpt_api(data, max_retries=3, cache_kind=None):
+    return await cached_llm_call(cache_kind, data, lambda: _hedged_post_chatgpt(data, max_retries, cache_kind))
 
+# Appel réseau non streamé : renvoie (texte ou None, usage)
+async def _post_chatgpt(data, max_retries):
+    usage = None
     for attempt in range(max_retries):
         try:
             client = await get_openrouter_client()
             # Appel à l'API OpenRouter (compatible OpenAI) pour obtenir le message
-            response_json = await client.post("https://openrouter.ai/api/v1/chat/completions", headers=headers, json=data)
+            response_json = await client.post(OPENROUTER_CHAT_URL, headers=OPENROUTER_HEADERS, json=data)
             response_json.raise_for_status()
             response_data = response_json.json()
 
@@ -2242,15 +4569,17 @@ async def call_chatgpt_api(data, max_retries=3):
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)  # Backoff exponentiel
                     continue
-                return None
+                return None, usage
 
             message = (response_data["choices"][0]["message"].get("content") or "").strip()
 
+            usage = response_data.get("usage")
             # Tracker les tokens et coûts si disponibles
             if ENABLE_COST_TRACKING and "usage" in response_data:
                 input_tokens = response_data["usage"].get("prompt_tokens", 0)
                 output_tokens = response_data["usage"].get("completion_tokens", 0)
-                track_api_cost(input_tokens, output_tokens, f"call_chatgpt_api({data.get('model', 'unknown')})")
+                track_api_cost(input_tokens, output_tokens, f"call_chatgpt_api({data.get('model', 'unknown')})",
+                               usage_cached_tokens(response_data["usage"]))
 
             # Certains modèles de raisonnement peuvent consommer tout le budget max_tokens
             # en réflexion et renvoyer un contenu vide : on retente dans ce cas.
@@ -2259,70 +4588,167 @@ async def call_chatgpt_api(data, max_retries=3):
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                     continue
-                return None
+                return None, usage
 
             log_message(f"Succès de la récupération de la réponse {data.get('model', 'unknown')}")
-            return message
+            return message, usage
 
-        except httpx.TimeoutException as e:
-            log_message(f"Timeout lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)  # Backoff exponentiel
-                continue
-            return None
+        except Exception as e:
+            delay = _openrouter_retry_delay(e, attempt, max_retries)
+            if delay is None:
+                return None, usage
+            await asyncio.sleep(delay)
 
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            log_message(f"Erreur HTTP {status_code} lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
+    # Si tous les retries ont échoué
+    log_message(f"Toutes les {max_retries} tentatives ont échoué pour l'appel API", "ERROR")
+    return None, usage
+
+# Flux SSE interrompu après l'envoi de premiers morceaux : on ne peut plus retenter sans dupliquer le texte
+class LLMStreamInterrupted(Exception):
+    def __init__(self, message, partial_text):
+        super().__init__(message)
+        self.partial_text = partial_text
+
+# Version streaming de call_chatgpt_api : itérateur asynchrone des morceaux de texte (SSE OpenRouter).
+# Mêmes règles de retry (tant que rien n'a été produit) et de contenu vide, même suivi des coûts ;
+# logge le délai avant le premier token (TTFT) et le débit en tokens/s.
+# Un flux qui se termine sans rien produire équivaut au None de call_chatgpt_api.
+async def stream_chatgpt_api(data, max_retries=3, usage_out=None):
+    model = data.get('model', 'unknown')
+    payload = {**data, "stream": True, "stream_options": {"include_usage": True}}
 
-            # Gestion spécifique des codes d'erreur
-            if status_code == 401:
-                log_message("Erreur d'authentification : Vérifiez votre clé API OpenRouter", "ERROR")
-                return None
-            elif status_code == 429:
-                log_message("Rate limit atteint, attente avant retry...")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(5 * (2 ** attempt))  # Backoff plus long pour rate limit
-                    continue
-                return None
-            elif status_code >= 500:
-                log_message(f"Erreur serveur {status_code}, retry...")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                return None
-            else:
-                log_message(f"Erreur HTTP {status_code}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                return None
+    for attempt in range(max_retries):
+        started_at = time.monotonic()
+        first_token_at = None
+        chunk_count = 0
+        usage = None
+        text = ""
+        try:
+            client = await get_openrouter_client()
+            async with client.stream("POST", OPENROUTER_CHAT_URL, headers=OPENROUTER_HEADERS, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # Lignes vides et commentaires SSE (": OPENROUTER PROCESSING") ignorés
+                    if not line.startswith("data:"):
+                        continue
+                    line = line[5:].strip()
+                    if line == "[DONE]":
+                        break
+                    chunk = json.loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(f"Erreur dans le flux OpenRouter : {chunk['error']}")
+                    usage = chunk.get("usage") or usage
+                    choices = chunk.get("choices") or []
+                    content = (choices[0].get("delta") or {}).get("content") if choices else None
+                    if not content:
+                        continue
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                        # Les espaces de tête sont retirés comme le strip() du mode non streamé
+                        content = content.lstrip()
+                        if not content:
+                            first_token_at = None
+                            continue
+                    chunk_count += 1
+                    text += content
+                    yield content
+        except Exception as e:
+            if text:
+                log_message(f"Flux OpenRouter interrompu après {len(text)} caractères : {e}", "WARNING")
+                raise LLMStreamInterrupted(str(e), text) from e
+            delay = _openrouter_retry_delay(e, attempt, max_retries)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+            continue
 
-        except httpx.NetworkError as e:
-            log_message(f"Erreur réseau lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-                continue
-            return None
+        # Tracker les tokens et coûts (usage envoyé dans le dernier morceau du flux)
+        if usage and usage_out is not None:
+            usage_out.update(usage)
+        if ENABLE_COST_TRACKING and usage:
+            track_api_cost(usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0), f"stream_chatgpt_api({model})",
+                           usage_cached_tokens(usage))
 
-        except Exception as e:
-            log_message(f"Erreur inattendue lors de l'appel à l'API OpenRouter (tentative {attempt + 1}/{max_retries}) : {e}")
+        if not text.strip():
+            log_message(f"Réponse API avec contenu vide (tentative {attempt + 1}/{max_retries})", "WARNING")
             if attempt < max_retries - 1:
                 await asyncio.sleep(2 ** attempt)
                 continue
-            return None
+            return
+
+        finished_at = time.monotonic()
+        output_tokens = (usage or {}).get("completion_tokens") or chunk_count
+        generation_time = finished_at - first_token_at
+        tokens_per_second = output_tokens / generation_time if generation_time > 0 else 0.0
+        log_message(f"[LLM_STREAM] {model} - TTFT {first_token_at - started_at:.2f}s, "
+                    f"{output_tokens} tokens en {finished_at - started_at:.2f}s ({tokens_per_second:.1f} tokens/s)")
+        return
 
     # Si tous les retries ont échoué
     log_message(f"Toutes les {max_retries} tentatives ont échoué pour l'appel API", "ERROR")
-    return None
+
+# Consomme le flux en entier (réponses longues : pas de timeout sur la génération complète,
+# seulement entre deux morceaux). Renvoie le texte ou None, comme call_chatgpt_api.
+async def collect_chatgpt_stream(data, max_retries=3, cache_kind=None):
+    return await cached_llm_call(cache_kind, data, lambda: _collect_stream(data, max_retries))
+
+async def _collect_stream(data, max_retries):
+    usage = {}
+    try:
+        text = "".join([chunk async for chunk in stream_chatgpt_api(data, max_retries, usage)]).strip()
+    except LLMStreamInterrupted:
+        # Rien n'a encore été diffusé : on retente l'appel complet en mode non streamé
+        log_message("Flux interrompu, nouvel essai sans streaming")
+        return await _post_chatgpt(data, max_retries)
+    return text or None, usage
+
+# Contexte lent à évoluer d'un prompt : saison, historique des matchs, stats de saison.
+# Construit de façon déterministe pour rester identique octet pour octet pendant tout le match.
+def build_stable_context(current_season, last_matches, season_stats_line=""):
+    stable_context = f"SAISON ACTUELLE : {current_season}"
+    if last_matches:
+        stable_context += f"\n\n{format_match_history_for_context(last_matches)}"
+    if season_stats_line:
+        stable_context += f"\n\n{season_stats_line}"
+    return stable_context
+
+# Ordre des messages pensé pour le cache de prompt du fournisseur : le préfixe réutilisable
+# (instructions système statiques puis contexte stable) précède toujours les données variables.
+def build_prompt_messages(system_prompt, stable_context, variable_context):
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": f"{stable_context}\n\n{variable_context}"}
+    ]
+
+# Consigne de langue ajoutée au prompt système : le modèle rédige directement dans la langue
+# des destinataires (voir generation_language), sans second appel de traduction
+def language_instruction(language):
+    if language.lower() == "french":
+        return ""
+    return f" LANGUE : rédige toute ta réponse en {language}, y compris les titres de sections."
+
+# Résumé compact d'une analyse de fin de match pour l'historique des prompts
+async def call_chatgpt_api_match_digest(post_match_analysis, token_budget):
+    system_prompt = ("Tu résumes l'analyse d'un match de football pour qu'elle serve de contexte à de futures analyses. "
+                     "Garde uniquement le résultat, les faits marquants (buteurs, cartons, tournants) et la forme ou les points tactiques notables. "
+                     f"Maximum {max(20, int(token_budget * 0.6))} mots, texte brut sans Markdown ni émojis, en un seul paragraphe.")
+    data = {
+        "model": GPT_MODEL_NAME,
+        "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": post_match_analysis}],
+        "max_tokens": max(300, token_budget * 2)
+    }
+    return await call_chatgpt_api(data, cache_kind="digest")
 
 # Analyse pour l'heure de début du match
-async def call_chatgpt_api_matchtoday(match_start_time, teams, league, round_info, venue, city):
+async def call_chatgpt_api_matchtoday(match_start_time, teams, league, round_info, venue, city, language="french"):
     log_message(f"Informations reçues par l'API : match_start_time={match_start_time}, teams={teams}, league={league}, round_info={round_info}, venue={venue}, city={city}")
     
     # Construire la saison complète (ex: "2025-2026" si SEASON_ID = "2025")
     season_year = int(SEASON_ID)
     current_season = f"{season_year}-{season_year + 1}"
+    # Équipe suivie pour ce match (plusieurs clubs possibles, voir FOLLOWED_TEAMS)
+    tracker = get_current_tracker()
+    team_name = tracker.team_name if tracker is not None else TEAM_NAME
     
     # Garde-fou lieu : l'API peut renvoyer None (ou vide) pour le stade et/ou la ville.
     # Sans nettoyage, on enverrait littéralement "Stade : None, Genève" au modèle,
@@ -2348,26 +4774,28 @@ async def call_chatgpt_api_matchtoday(match_start_time, teams, league, round_inf
                     f"Équipes du match : {teams['home']} contre {teams['away']}\n"
                     f"{location_line}"
                     f"Heure de début : {match_start_time}\n"
-                    f"L'heure actuelle est : {datetime.datetime.now(server_timezone)}\n"
-                    f"Équipe analysée : {TEAM_NAME}")
+                    # Heure arrondie à la minute : le prompt sert de clé au cache des réponses
+                    f"L'heure actuelle est : {datetime.datetime.now(server_timezone):%Y-%m-%d %H:%M %Z}\n"
+                    f"Équipe analysée : {team_name}")
     system_prompt = (f"Tu es un journaliste sportif expert spécialisé dans l'analyse de matchs de football. "
                     f"IMPORTANT : Nous sommes en saison {current_season}. "
                     f"Tu dois te baser UNIQUEMENT sur les informations fournies dans le message utilisateur. "
                     f"N'utilise JAMAIS tes connaissances sur les saisons antérieures à {current_season}. "
                     f"Fais une présentation simple et factuelle du match qui aura lieu aujourd'hui **en 3-4 phrases maximum** : "
                     f"annonce les équipes qui s'affrontent, la compétition, le lieu et l'heure. "
-                    f"**Traduis les noms de villes dans la langue {LANGUAGE}** (ex: Geneva → Genève si french, Geneva → Genf si german, etc.). "
+                    f"**Traduis les noms de villes dans la langue {language}** (ex: Geneva → Genève si french, Geneva → Genf si german, etc.). "
                     f"Si le lieu (stade et/ou ville) n'est pas fourni, n'en parle simplement pas et n'invente rien : ne dis JAMAIS que le stade n'est pas renseigné. "
                     f"Reste général sans inventer de détails sur la forme des équipes ou les enjeux. "
                     f"Embellis la présentation avec des émojis pertinents. "
                     f"Sois concis, engageant et informatif. "
-                    f"FORMATAGE : Utilise un formatage Markdown simple compatible avec Discord et Telegram (gras avec **texte**, italique avec *texte*, pas de titres avec # ni de formatage complexe).")
+                    f"FORMATAGE : Utilise un formatage Markdown simple compatible avec Discord et Telegram (gras avec **texte**, italique avec *texte*, pas de titres avec # ni de formatage complexe)."
+                    + language_instruction(language))
     data = {
         "model": GPT_MODEL_NAME,
         "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
         "max_tokens": 800
     }
-    return await call_chatgpt_api(data)
+    return await call_chatgpt_api(data, cache_kind="matchtoday")
 
 # Détermine si des compositions officielles (onze de départ) sont présentes dans match_data.
 # En tier gratuit, l'API renvoie souvent des lineups vides à l'heure du coup d'envoi ;
@@ -2382,7 +4810,7 @@ def compo_available(match_data):
     return False
 
 # Analyse de début de match avec des smileys
-async def call_chatgpt_api_compomatch(match_data, predictions=None):
+async def call_chatgpt_api_compomatch(match_data, predictions=None, tracker=None, language="french"):
     log_message(f"Informations reçues par l'API : match_data={match_data}, predictions={predictions}")
 
     # Construire la saison complète
@@ -2391,10 +4819,18 @@ async def call_chatgpt_api_compomatch(match_data, predictions=None):
 
     has_compo = compo_available(match_data)
 
-    user_message = f"SAISON ACTUELLE : {current_season}\n\n"
+    # Préfixe stable du prompt (saison, historique, stats de saison), voir build_prompt_messages
+    season_stats = tracker.season_stats if tracker is not None else None
+    team_name = tracker.team_name if tracker is not None else TEAM_NAME
+    team_id = tracker.team_id if tracker is not None else None
+    fixture_id = tracker.fixture_id if tracker is not None else None
+    stable_context = build_stable_context(current_season, get_last_n_matches(5, team_id, exclude_fixture_id=fixture_id),
+                                          format_season_stats_for_prompt(season_stats, team_name) if season_stats else "")
 
+    # Partie variable : informations du match et prédictions
+    user_message = ""
     if has_compo:
-        user_message += f"Voici les informations du match qui va commencer d'ici quelques minutes : {match_data}"
+        user_message += f"Match qui va commencer d'ici quelques minutes et compositions de départ :\n{serialize_compo_match(match_data)}"
     elif match_data is not None:
         # Compositions absentes de l'API (fréquent en tier gratuit) : on fournit au moins
         # les équipes et on signale explicitement l'absence de compo (sans dumper des lineups vides).
@@ -2411,17 +4847,7 @@ async def call_chatgpt_api_compomatch(match_data, predictions=None):
 
     if predictions:
         user_message += f"\nPrédictions de l'issue du match : {predictions['winner']['name']} (Comment: {predictions['winner']['comment']})"
-
-    # Ajouter les stats de saison de l'équipe dans la ligue où le match est joué (contexte bref)
-    season_stats_line = format_season_stats_for_prompt(current_season_stats, TEAM_NAME) if current_season_stats else ""
-    if season_stats_line:
-        user_message += f"\n\n{season_stats_line}"
-
-    # Ajouter l'historique des 5 derniers matchs pour enrichir le contexte
-    last_matches = get_last_n_matches(5)
-    if last_matches and len(last_matches) > 0:
-        match_history_context = format_match_history_for_context(last_matches)
-        user_message += f"\n\n{match_history_context}"
+    user_message = fit_prompt_payload("compo", user_message)
 
     if has_compo:
         system_prompt = (f"Tu es un journaliste sportif expert spécialisé dans l'analyse tactique de matchs de football. "
@@ -2456,120 +4882,112 @@ async def call_chatgpt_api_compomatch(match_data, predictions=None):
 
     data = {
         "model": GPT_MODEL_NAME,
-        "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
+        "messages": build_prompt_messages(system_prompt + language_instruction(language), stable_context, user_message),
         "max_tokens": 1500
     }
 
-    return await call_chatgpt_api(data)
+    return await collect_chatgpt_stream(data, cache_kind="compo")
 
 # Commentaire sur le goal récent
-async def call_chatgpt_api_goalmatch(player, team, player_statistics, elapsed_time, event, score_string):
-    log_message(f"Informations reçues par l'API : player={player}, team={team}, player_statistics={player_statistics}, elapsed_time={elapsed_time}, event={event}, score_string={score_string}")
-    user_message = f"Le joueur qui a marqué : {player} "
-    user_message += f"L'équipe pour laquelle le but a été comptabilisé : {team}"
-    if player_statistics:
-        user_message += f"Les statistiques du joueur pour ce match qui a marqué (IGNORE COMPLÈTEMENT le temps de jeu 'minutes' du joueur) : {player_statistics} "
-    user_message += f"La minute du match quand le goal a été marqué : {elapsed_time} "
-    user_message += f"Le score actuel après le but qui vient d'être marqué pour contextualisé ta réponse , mais ne met pas le score dans ta réponse : {score_string} "
-    user_message += f"Voici les détails de l'événement goal du match en cours {event}, utilise les informations pertinentes liées au goal marqué à la {elapsed_time} minute sans parler d'assist!"
+async def call_chatgpt_api_goalmatch(event, player_statistics, elapsed_time, score_string, language="french"):
+    log_message(f"Informations reçues par l'API : event={event}, player_statistics={player_statistics}, elapsed_time={elapsed_time}, score_string={score_string}")
+    user_message = f"Buteur : {event.player_name} ({event.team_name})\n"
+    player_stats_line = serialize_player_statistics(player_statistics)
+    if player_stats_line:
+        user_message += f"Statistiques du buteur sur ce match : {player_stats_line}\n"
+    user_message += f"Minute du but : {elapsed_time}\n"
+    user_message += f"Score après le but (pour contextualiser, ne le cite pas) : {score_string}\n"
+    user_message += f"Événement : {event.describe()}\n"
+    user_message += "Ne parle pas de la passe décisive."
+    user_message = fit_prompt_payload("goal", user_message)
 
     system_prompt = "Tu es un journaliste sportif spécialisé dans l'analyse de matchs de football, commente moi le goal le plus récent du match qui est en cours, tu ne dois pas faire plus de deux phrases courtes en te basant sur les informations que je te donne comme qui est le buteur et ses statistiques (si disponible). **INTERDIT ABSOLU de mentionner le temps de jeu du joueur (minutes jouées) car cette donnée est souvent incorrecte.** Concentre-toi sur le type de but, la position du joueur, et les statistiques de passes/tirs uniquement. FORMATAGE : Utilise un formatage Markdown simple compatible avec Discord et Telegram (gras avec **texte**, italique avec *texte*, pas de titres avec # ni de formatage complexe)."
     
     data = {
         "model": GPT_MODEL_NAME,
-        "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
+        "messages": [{"role": "system", "content": system_prompt + language_instruction(language)}, {"role": "user", "content": user_message}],
         "max_tokens": 500
     }
-    return await call_chatgpt_api(data)
+    return await call_chatgpt_api(data, cache_kind="goal")
 
 # Commentaire sur le goal lors de la séance de tir aux penaltys
-async def call_chatgpt_api_shootout_goal_match(player, team, player_statistics, event):
-    log_message(f"Informations reçues par l'API : player={player}, team={team}, player_statistics={player_statistics}, event={event}")
-    user_message = f"Le joueur qui a marqué le pénalty lors de la séance aux tirs aux buts : {player} "
-    user_message += f"L'équipe pour laquelle le but a été comptabilisé : {team}"
-    if player_statistics:  
-        user_message += f"Les statistiques du joueur pour ce match qui a marqué (n'utilise pas le temps de jeu du joueur): {player_statistics} "
-    user_message += f"Voici les détails de l'événement goal du match en cours {event}."
+async def call_chatgpt_api_shootout_goal_match(event, player_statistics, language="french"):
+    log_message(f"Informations reçues par l'API : event={event}, player_statistics={player_statistics}")
+    user_message = f"Tireur qui a marqué son tir au but : {event.player_name} ({event.team_name})\n"
+    player_stats_line = serialize_player_statistics(player_statistics)
+    if player_stats_line:
+        user_message += f"Statistiques du joueur sur ce match : {player_stats_line}\n"
+    user_message += f"Événement : {event.describe()}"
+    user_message = fit_prompt_payload("shootout", user_message)
 
     system_prompt = "Tu es un journaliste sportif spécialisé dans l'analyse de matchs de football, commente moi le goal lors de cette séance aux tirs au but, tu ne dois pas faire plus de deux phrases courtes en te basant sur les informations que je te donne. FORMATAGE : Utilise un formatage Markdown simple compatible avec Discord et Telegram (gras avec **texte**, italique avec *texte*, pas de titres avec # ni de formatage complexe)."
     
     data = {
         "model": GPT_MODEL_NAME,
-        "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
+        "messages": [{"role": "system", "content": system_prompt + language_instruction(language)}, {"role": "user", "content": user_message}],
         "max_tokens": 1000
     }
-    return await call_chatgpt_api(data)
+    return await call_chatgpt_api(data, cache_kind="shootout")
 
 # Commentaire sur le carton rouge 
-async def call_chatgpt_api_redmatch(player, team, elapsed_time, event):
-    log_message(f"Informations reçues par l'API : player={player}, team={team}, elapsed_time={elapsed_time}, event={event}")
-    user_message = (f"Le joueur qui a pris un carton rouge : {player} "
-                    f"L'équipe dont il fait parti : {team} "
-                    f"La minute du match à laquelle il a pris un carton rouge : {elapsed_time} "
-                    f"Voici les détails de l'événement du carton rouge du match en cours {event}, utilise uniquement les informations pertinentes liées à ce carton rouge de la {elapsed_time} minute.")
+async def call_chatgpt_api_redmatch(event, language="french"):
+    log_message(f"Informations reçues par l'API : event={event}")
+    elapsed_time = event.elapsed
+    user_message = fit_prompt_payload("red_card", f"Joueur expulsé : {event.player_name} ({event.team_name})\n"
+                                                  f"Minute du carton rouge : {elapsed_time}\n"
+                                                  f"Événement : {event.describe()}")
     system_prompt = "Tu es un journaliste sportif spécialisé dans l'analyse de matchs de football, commente moi ce carton rouge le plus récent du match qui est en cours, tu ne dois pas faire plus de deux phrases courtes en te basant sur les informations que je te donne. FORMATAGE : Utilise un formatage Markdown simple compatible avec Discord et Telegram (gras avec **texte**, italique avec *texte*, pas de titres avec # ni de formatage complexe)."
     data = {
         "model": GPT_MODEL_NAME,
-        "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
+        "messages": [{"role": "system", "content": system_prompt + language_instruction(language)}, {"role": "user", "content": user_message}],
         "max_tokens": 1000
     }
-    return await call_chatgpt_api(data)
+    return await call_chatgpt_api(data, cache_kind="red_card")
 
 # Analyse de fin de match
-async def call_chatgpt_api_endmatch(match_statistics, events, home_team, home_score, away_score, away_team):
+async def call_chatgpt_api_endmatch(match_statistics, events, home_team, home_score, away_score, away_team, tracker=None, language="french"):
     log_message(f"Informations reçues par l'API : match_statistics={match_statistics}, events={events}")
     
     # Construire la saison complète
     season_year = int(SEASON_ID)
     current_season = f"{season_year}-{season_year + 1}"
     
-    # Récupérer l'analyse pré-match et l'historique des 5 derniers matchs
-    last_matches = get_last_n_matches(5)
-    match_history_context = format_match_history_for_context(last_matches)
-    
-    # Récupérer l'analyse pré-match du match actuel (le dernier match dans l'historique)
-    pre_match_analysis = ""
-    if last_matches and len(last_matches) > 0:
-        pre_match_analysis = last_matches[-1].get("pre_match_analysis", "")
-        if not pre_match_analysis:
-            pre_match_analysis = ""
-    
-    # Score final
-    user_message = f"SAISON ACTUELLE : {current_season}\n\n"
-    user_message += f"📊 Score Final:\n{home_team} {home_score} - {away_score} {away_team}\n\n"
-    
-    # Ajouter l'analyse pré-match pour contexte
-    if pre_match_analysis:
-        user_message += f"📋 CONTEXTE PRÉ-MATCH:\n{pre_match_analysis}\n\n"
+    season_stats = tracker.season_stats if tracker is not None else None
+    team_name = tracker.team_name if tracker is not None else TEAM_NAME
+    team_id = tracker.team_id if tracker is not None else None
+
+    # Historique des 5 derniers matchs (hors match actuel) et analyse pré-match du match actuel
+    # (par fixture_id si connu, sinon le dernier match de l'historique)
+    if tracker is not None:
+        last_matches = get_last_n_matches(5, team_id, exclude_fixture_id=tracker.fixture_id)
+        current_match = get_match_entry(tracker.fixture_id)
+    else:
+        last_matches = get_last_n_matches(5, team_id)
+        current_match = last_matches[-1] if last_matches else None
+    pre_match_analysis = (current_match.get("pre_match_analysis", "") or "") if current_match else ""
 
-    # Ajouter les stats de saison de l'équipe dans la ligue où le match est joué (contexte bref)
-    season_stats_line = format_season_stats_for_prompt(current_season_stats, TEAM_NAME) if current_season_stats else ""
-    if season_stats_line:
-        user_message += f"{season_stats_line}\n\n"
+    # Préfixe stable du prompt (saison, historique, stats de saison, contexte pré-match), voir build_prompt_messages
+    stable_context = build_stable_context(current_season, last_matches,
+                                          format_season_stats_for_prompt(season_stats, team_name) if season_stats else "")
+    if pre_match_analysis:
+        stable_context += f"\n\n📋 CONTEXTE PRÉ-MATCH:\n{pre_match_analysis}"
 
-    # Ajouter l'historique des matchs
-    user_message += f"{match_history_context}\n\n"
+    # Partie variable : score final, événements et statistiques du match
+    user_message = f"📊 Score Final:\n{home_team} {home_score} - {away_score} {away_team}\n\n"
     
     # Formater les événements du match
     formatted_events = ["📢 Événements du Match:"]
     if events:
         for event in events:
-            time_elapsed = event['time']['elapsed']
-            time_extra = event['time']['extra']
-            team_name = event['team']['name']
-            player_name = event['player']['name']
-            event_type = event['type']
-            event_detail = event['detail']
-            formatted_event = f"• À {time_elapsed}{'+' + str(time_extra) if time_extra else ''} min, {team_name} - {player_name} {event_detail} ({event_type})"
+            formatted_event = f"• À {event.elapsed}{'+' + str(event.extra) if event.extra else ''} min, {event.team_name} - {event.player_name} {event.detail} ({event.type})"
             formatted_events.append(formatted_event)
         user_message += '\n'.join(formatted_events)
 
-    # Traitement des match_statistics
-    if len(match_statistics) >= 2 and 'statistics' in match_statistics[0] and 'statistics' in match_statistics[1]:
+    # Traitement des match_statistics (tuples (type, domicile, extérieur) du MatchSnapshot)
+    if match_statistics:
         user_message += f"\n\n📉 Statistiques du Match:\n"
-        for home_stat, away_stat in zip(match_statistics[0]['statistics'], match_statistics[1]['statistics']):
-            if 'type' in home_stat and 'value' in home_stat and 'type' in away_stat and 'value' in away_stat:
-                user_message += f"• {home_stat['type']}: {home_stat['value']} - {away_stat['value']}\n"
+        for stat_type, home_value, away_value in match_statistics:
+            user_message += f"• {stat_type}: {home_value} - {away_value}\n"
 
     system_prompt = (f"Tu es un journaliste sportif expert spécialisé dans l'analyse de matchs de football. "
                     f"IMPORTANT : Nous sommes en saison {current_season}. "
@@ -2581,7 +4999,7 @@ async def call_chatgpt_api_endmatch(match_statistics, events, home_team, home_sc
                     f"1️⃣ **RÉSULTAT & CONTEXTE** (2-3 phrases) : Compare le résultat aux attentes pré-match et à la forme récente\n"
                     f"2️⃣ **ANALYSE TACTIQUE** (2-3 phrases) : Formation, possession, style de jeu et statistiques clés\n"
                     f"3️⃣ **MOMENTS DÉCISIFS** (2-3 phrases) : Joueurs clés, buts, cartons et tournants du match\n"
-                    f"4️⃣ **BILAN** (1-2 phrases) : Conclusion sur la performance globale du {TEAM_NAME}\n"
+                    f"4️⃣ **BILAN** (1-2 phrases) : Conclusion sur la performance globale du {team_name}\n"
                     f"\n"
                     f"Utilise des émojis pertinents (⚽🛡️🔥📊⭐) pour aérer. "
                     f"Sois concis, factuel et engageant. Chaque section doit être séparée par un saut de ligne.\n"
@@ -2589,11 +5007,11 @@ async def call_chatgpt_api_endmatch(match_statistics, events, home_team, home_sc
     
     data = {
         "model": GPT_MODEL_NAME,
-        "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
+        "messages": build_prompt_messages(system_prompt + language_instruction(language), stable_context, user_message),
         "max_tokens": 2000
     }
 
-    return await call_chatgpt_api(data)
+    return await collect_chatgpt_stream(data, cache_kind="endmatch")
 
 # FIN DU CODE DE CONFIGURATION IA
 
@@ -2611,21 +5029,13 @@ def _log_task_exception(task):
 
 def create_background_task(coro, name):
     """Crée une tâche de fond en conservant sa référence et en loggant ses exceptions"""
+    # Oublier les tâches terminées (une tâche de suivi est créée par match)
+    background_tasks[:] = [t for t in background_tasks if not t.done()]
     task = asyncio.create_task(coro, name=name)
     task.add_done_callback(_log_task_exception)
     background_tasks.append(task)
     return task
 
-# Check immédiat au démarrage, avec gestion des erreurs pour ne pas laisser
-# une exception (ex: quota API) tuer silencieusement la tâche.
-async def run_initial_check():
-    try:
-        await check_matches()
-    except RateLimitExceededError as e:
-        log_message(f"Suivi du match arrêté (quota API atteint) : {e}", "WARNING")
-    except Exception as e:
-        log_message(f"Erreur inattendue lors du check initial des matchs : {e}", "ERROR")
-
 # Fonction principale pour initialiser le bot, enregistrer les gestionnaires de messages et lancer la vérification périodique des matchs.
 async def main():
     try:
@@ -2649,9 +5059,8 @@ async def main():
 
         # Si au moins un des deux bots est activé, exécutez les tâches de vérification
         if USE_TELEGRAM or USE_DISCORD:
-            # Check immediate puis vérification périodique
-            create_background_task(run_initial_check(), "initial_check")
-            create_background_task(check_match_periodically(), "daily_check")
+            # Planificateur des matchs : check immédiat au démarrage puis réveil à chaque annonce de match
+            create_background_task(check_match_periodically(), "match_scheduler")
 
         # Boucle d'attente pour empêcher main() (donc le script) de se terminer
         while is_running:
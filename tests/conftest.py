@@ -0,0 +1,46 @@
+"""
+Fixtures partagées des tests.
+
+gptfoot.py lit config.ini à côté de lui et y écrit ses logs et ses fichiers de données :
+le module est donc importé depuis une copie placée dans un dossier temporaire, avec un
+config.ini construit à partir de config.ini.example et de fausses clés.
+"""
+import importlib.util
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+TEST_KEYS = {
+    "OPENROUTER_API_KEY": "sk-or-test-0123456789",
+    "TELEGRAM_BOT_TOKEN": "123456789:TEST-telegram-token-0123456789",
+    "DISCORD_BOT_TOKEN": "TEST-discord-token-0123456789",
+    "API_FOOTBALL_KEY": "test-api-football-key",
+    "TEAM_ID": "1",
+    "TEAM_NAME": "Test FC",
+    "SEASON_ID": "2025",
+}
+
+
+@pytest.fixture(scope="session")
+def gptfoot(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("gptfoot")
+    config = (REPO_DIR / "config.ini.example").read_text(encoding="utf-8")
+    for key, value in TEST_KEYS.items():
+        config = re.sub(rf"^{key} = .*$", f"{key} = {value}", config, flags=re.M)
+    (workdir / "config.ini").write_text(config, encoding="utf-8")
+    shutil.copy(REPO_DIR / "gptfoot.py", workdir / "gptfoot.py")
+
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    spec = importlib.util.spec_from_file_location("gptfoot", workdir / "gptfoot.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["gptfoot"] = module
+    spec.loader.exec_module(module)
+    yield module
+    os.chdir(previous_cwd)
@@ -0,0 +1,145 @@
+"""Propriétés du moteur de diff des événements (EventDiffEngine)."""
+import random
+
+import pytest
+
+HOME, AWAY = 10, 20
+
+
+@pytest.fixture
+def engine(gptfoot):
+    return gptfoot.EventDiffEngine()
+
+
+@pytest.fixture
+def goal(gptfoot):
+    def make(elapsed, player_id=7, team_id=HOME, extra=None, detail="Normal Goal"):
+        player_name = f"Joueur {player_id}" if player_id is not None else None
+        return gptfoot.MatchEvent("Goal", detail, elapsed, extra, team_id, f"Équipe {team_id}", player_id, player_name)
+    return make
+
+
+def kinds(deltas):
+    return [(delta.kind, delta.event.elapsed) for delta in deltas]
+
+
+def test_brace_is_two_distinct_events(gptfoot, engine, goal):
+    first = engine.diff([goal(10)])
+    second = engine.diff([goal(10), goal(40)])
+
+    assert kinds(first) == [(gptfoot.EVENT_ADDED, 10)]
+    assert kinds(second) == [(gptfoot.EVENT_ADDED, 40)]
+    assert second[0].event_id != first[0].event_id
+    # Liste inchangée : aucun delta
+    assert engine.diff([goal(10), goal(40)]) == []
+
+
+def test_minute_correction_keeps_the_event_id(gptfoot, engine, goal):
+    added = engine.diff([goal(10)])
+    corrected = engine.diff([goal(12)])
+
+    assert kinds(corrected) == [(gptfoot.EVENT_MODIFIED, 12)]
+    assert corrected[0].event_id == added[0].event_id
+    assert corrected[0].previous.elapsed == 10
+
+
+def test_minute_correction_inside_a_brace(gptfoot, engine, goal):
+    engine.diff([goal(10), goal(40)])
+    deltas = engine.diff([goal(11), goal(40)])
+
+    assert kinds(deltas) == [(gptfoot.EVENT_MODIFIED, 11)]
+
+
+def test_retraction_is_a_removal(gptfoot, engine, goal):
+    added = engine.diff([goal(10)])
+    deltas = engine.diff([])
+
+    assert kinds(deltas) == [(gptfoot.EVENT_REMOVED, 10)]
+    assert deltas[0].event_id == added[0].event_id
+
+
+def test_retraction_and_new_goal_in_the_same_poll(gptfoot, engine, goal):
+    # But annulé puis nouveau but du même joueur bien plus tard, vus dans le même poll :
+    # le nouveau but doit être annoncé, pas traité comme une correction de minute
+    added = engine.diff([goal(30)])
+    deltas = engine.diff([goal(60)])
+
+    assert sorted(kinds(deltas)) == [(gptfoot.EVENT_ADDED, 60), (gptfoot.EVENT_REMOVED, 30)]
+    new_goal = next(delta for delta in deltas if delta.kind == gptfoot.EVENT_ADDED)
+    assert new_goal.event_id != added[0].event_id
+
+
+def test_late_scorer_is_a_new_event(gptfoot, engine, goal):
+    # Le but est publié sans buteur, puis l'API le complète
+    engine.diff([goal(25, player_id=None)])
+    deltas = engine.diff([goal(25, player_id=7)])
+
+    assert sorted(kinds(deltas)) == [(gptfoot.EVENT_ADDED, 25), (gptfoot.EVENT_REMOVED, 25)]
+    new_goal = next(delta for delta in deltas if delta.kind == gptfoot.EVENT_ADDED)
+    assert new_goal.event.player_id == 7
+
+
+
+def test_reordered_events_give_no_added_or_removed_deltas(gptfoot, goal):
+    rng = random.Random(7)
+    events = [goal(10), goal(40), goal(40, player_id=9, team_id=AWAY), goal(55, player_id=None), goal(88, team_id=AWAY)]
+    for _ in range(20):
+        engine = gptfoot.EventDiffEngine()
+        first = engine.diff(events)
+        ids_before = {(delta.event.elapsed, delta.event.player_id, delta.event.team_id): delta.event_id for delta in first}
+
+        # L'API peut renvoyer les mêmes événements dans un autre ordre
+        shuffled = rng.sample(events, len(events))
+        assert engine.diff(shuffled) == []
+        ids_after = {(event.elapsed, event.player_id, event.team_id): event_id
+                     for entries in engine._groups.values() for event_id, event in entries}
+        assert ids_after == ids_before
+
+def test_random_polls_keep_the_diff_invariants(gptfoot, goal):
+    rng = random.Random(2025)
+    for _ in range(200):
+        engine = gptfoot.EventDiffEngine()
+        events = []
+        known_ids = set()
+        for _ in range(12):
+            events = _mutate(rng, events, goal)
+            deltas = engine.diff(events)
+
+            removed = {delta.event_id for delta in deltas if delta.kind == gptfoot.EVENT_REMOVED}
+            added = {delta.event_id for delta in deltas if delta.kind == gptfoot.EVENT_ADDED}
+            current_ids = {event_id for entries in engine._groups.values() for event_id, _ in entries}
+
+            # Un identifiant par événement de la liste courante
+            assert len(current_ids) == len(events)
+            # Les ajouts ont des identifiants neufs, les retraits des identifiants connus
+            assert not added & known_ids
+            assert removed <= known_ids
+            assert current_ids == (known_ids - removed) | added
+            # Une modification reste dans le même groupe, à une correction de minute près
+            for delta in deltas:
+                if delta.kind == gptfoot.EVENT_MODIFIED:
+                    assert gptfoot._event_base_key(delta.event) == gptfoot._event_base_key(delta.previous)
+                    assert abs(delta.event.elapsed - delta.previous.elapsed) <= gptfoot.EVENT_MINUTE_CORRECTION_MAX
+            # Rediffuser la même liste ne produit aucun delta
+            assert engine.diff(list(events)) == []
+            known_ids = current_ids
+
+
+def _mutate(rng, events, goal):
+    """Poll suivant : nouveaux buts, corrections de minute, retraits ou buteur complété."""
+    events = list(events)
+    for _ in range(rng.randint(0, 2)):
+        action = rng.choice(("add", "add", "correct", "remove", "scorer"))
+        if action == "add" or not events:
+            events.append(goal(rng.randint(1, 90), player_id=rng.choice((None, 7, 9)), team_id=rng.choice((HOME, AWAY))))
+        elif action == "correct":
+            index = rng.randrange(len(events))
+            event = events[index]
+            events[index] = goal(max(1, event.elapsed + rng.choice((-2, -1, 1, 2))), event.player_id, event.team_id)
+        elif action == "remove":
+            events.pop(rng.randrange(len(events)))
+        else:
+            index = rng.randrange(len(events))
+            event = events[index]
+            events[index] = goal(event.elapsed, rng.choice((7, 9)), event.team_id)
+    return events
@@ -0,0 +1,96 @@
+"""Requêtes IA doublées (_hedged_post_chatgpt) : la première réponse non vide l'emporte."""
+import asyncio
+
+import pytest
+
+PRIMARY, HEDGE = "principal/modele", "secours/modele"
+DATA = {"model": PRIMARY, "messages": [{"role": "user", "content": "Buteur : Joueur (Test FC), minute 12"}], "max_tokens": 100}
+
+
+class FakeModels:
+    """Remplace _post_chatgpt : chaque modèle répond après son délai, ou note son annulation."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+        self.cancelled = []
+
+    async def post(self, data, max_retries):
+        model = data["model"]
+        self.calls.append(model)
+        delay, text = self.answers[model]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        return text, {"model": model}
+
+
+@pytest.fixture
+def costs(gptfoot, monkeypatch):
+    tracked = []
+    monkeypatch.setattr(gptfoot, "track_api_cost", lambda input_tokens, output_tokens, function_name="", cached_tokens=0:
+                        tracked.append((input_tokens, output_tokens, function_name)))
+    return tracked
+
+
+@pytest.fixture
+def models(gptfoot, monkeypatch):
+    def install(primary, hedge):
+        fake = FakeModels({PRIMARY: primary, HEDGE: hedge})
+        monkeypatch.setattr(gptfoot, "_post_chatgpt", fake.post)
+        return fake
+
+    monkeypatch.setattr(gptfoot, "GPT_MODEL_NAME_HEDGE", HEDGE)
+    monkeypatch.setattr(gptfoot, "LLM_HEDGE_DEFAULT_DELAY", 0.05)
+    monkeypatch.setattr(gptfoot, "primary_llm_latencies", {})
+    return install
+
+
+def test_fast_primary_is_never_doubled(gptfoot, models, costs):
+    fake = models(primary=(0.01, "principal"), hedge=(0.01, "secours"))
+
+    text, usage = asyncio.run(gptfoot._hedged_post_chatgpt(dict(DATA), 1, "goal"))
+
+    assert (text, usage["model"]) == ("principal", PRIMARY)
+    assert fake.calls == [PRIMARY]
+    assert costs == []
+    assert len(gptfoot.primary_llm_latencies["goal"]) == 1
+
+
+def test_hedge_wins_and_the_cancelled_primary_is_billed(gptfoot, models, costs):
+    fake = models(primary=(10, "principal"), hedge=(0.01, "secours"))
+
+    text, usage = asyncio.run(gptfoot._hedged_post_chatgpt(dict(DATA), 1, "goal"))
+
+    assert (text, usage["model"]) == ("secours", HEDGE)
+    assert fake.calls == [PRIMARY, HEDGE]
+    assert fake.cancelled == [PRIMARY]
+    # Prompt du principal compté sur estimation, sans tokens de sortie
+    [(input_tokens, output_tokens, function_name)] = costs
+    assert input_tokens > 0 and output_tokens == 0
+    assert PRIMARY in function_name
+    # La durée minimale du principal alimente quand même son p90
+    assert len(gptfoot.primary_llm_latencies["goal"]) == 1
+
+
+def test_empty_primary_answer_falls_through_to_the_hedge(gptfoot, models, costs):
+    fake = models(primary=(0.1, ""), hedge=(0.3, "secours"))
+
+    text, _ = asyncio.run(gptfoot._hedged_post_chatgpt(dict(DATA), 1, "goal"))
+
+    assert text == "secours"
+    assert fake.cancelled == []
+    assert costs == []
+
+
+def test_outer_deadline_cancels_both_requests(gptfoot, models, costs):
+    fake = models(primary=(10, "principal"), hedge=(10, "secours"))
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(gptfoot._hedged_post_chatgpt(dict(DATA), 1, "goal"), timeout=0.2))
+
+    assert sorted(fake.cancelled) == sorted([PRIMARY, HEDGE])
+    assert sorted(function_name for _, _, function_name in costs) == sorted(
+        f"call_chatgpt_api({model}) annulée" for model in (PRIMARY, HEDGE))
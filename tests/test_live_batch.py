@@ -0,0 +1,119 @@
+"""Polling des matchs en direct : appel groupé /fixtures?ids= partagé par les trackers, sonde légère par match."""
+import asyncio
+
+import pytest
+
+HOME_FIXTURE, AWAY_FIXTURE = 101, 202
+
+
+@pytest.fixture
+def batch_calls(gptfoot, monkeypatch):
+    calls = []
+
+    async def fetch_fixtures_batch(fixture_ids):
+        calls.append(list(fixture_ids))
+        return tuple(gptfoot.MatchSnapshot(fixture_id, "1H", 30, 1, "Test FC", 2, "Adversaire", 0, 0, None, None,
+                                           (), [], {}) for fixture_id in fixture_ids), True
+
+    monkeypatch.setattr(gptfoot, "LIVE_SLIM_MODE", False)
+    monkeypatch.setattr(gptfoot, "_live_snapshots", {})
+    monkeypatch.setattr(gptfoot, "live_fixture_ids", {})
+    # Verrou neuf : chaque test tourne dans sa propre boucle asyncio
+    monkeypatch.setattr(gptfoot, "_live_batch_lock", asyncio.Lock())
+    monkeypatch.setattr(gptfoot, "fetch_fixtures_batch", fetch_fixtures_batch)
+    gptfoot.register_live_fixture(HOME_FIXTURE, 1)
+    gptfoot.register_live_fixture(AWAY_FIXTURE, 2)
+    return calls
+
+
+def test_two_trackers_share_one_batch_call(gptfoot, batch_calls):
+    async def poll_both():
+        first = await gptfoot.fetch_live_fixture(HOME_FIXTURE)
+        second = await gptfoot.fetch_live_fixture(AWAY_FIXTURE)
+        return first, second
+
+    first, second = asyncio.run(poll_both())
+
+    # Le premier poll rapporte les deux matchs, le second tracker réutilise sa tranche
+    assert batch_calls == [[HOME_FIXTURE, AWAY_FIXTURE]]
+    assert first.fixture_id == HOME_FIXTURE and second.fixture_id == AWAY_FIXTURE
+
+
+def test_a_tracker_never_reuses_its_own_previous_slice(gptfoot, batch_calls):
+    async def poll_twice():
+        await gptfoot.fetch_live_fixture(HOME_FIXTURE)
+        await gptfoot.fetch_live_fixture(HOME_FIXTURE)
+
+    asyncio.run(poll_twice())
+
+    assert batch_calls == [[HOME_FIXTURE, AWAY_FIXTURE], [HOME_FIXTURE, AWAY_FIXTURE]]
+
+
+def test_concurrent_polls_wait_for_the_call_in_flight(gptfoot, batch_calls):
+    async def poll_together():
+        return await asyncio.gather(gptfoot.fetch_live_fixture(HOME_FIXTURE), gptfoot.fetch_live_fixture(AWAY_FIXTURE))
+
+    snapshots = asyncio.run(poll_together())
+
+    assert len(batch_calls) == 1
+    assert [snapshot.fixture_id for snapshot in snapshots] == [HOME_FIXTURE, AWAY_FIXTURE]
+
+
+@pytest.fixture
+def slim_calls(gptfoot, monkeypatch, batch_calls):
+    """Mode sonde légère : note les appels (sonde du match ou payload complet) dans l'ordre."""
+    calls = []
+    probe_events = {"events": ()}
+
+    async def fetch_live_events_probe(fixture_id):
+        calls.append(("probe", fixture_id))
+        return probe_events["events"], True
+
+    async def fetch_fixtures_batch(fixture_ids):
+        calls.append(("full", fixture_ids[0]))
+        return tuple(gptfoot.MatchSnapshot(fixture_id, "1H", probe_events.get("elapsed", 30), 1, "Test FC", 2, "Adversaire",
+                                           len(probe_events["events"]), 0, None, None, probe_events["events"], [], {})
+                     for fixture_id in fixture_ids), True
+
+    monkeypatch.setattr(gptfoot, "LIVE_SLIM_MODE", True)
+    monkeypatch.setattr(gptfoot, "fetch_live_events_probe", fetch_live_events_probe)
+    monkeypatch.setattr(gptfoot, "fetch_fixtures_batch", fetch_fixtures_batch)
+    return calls, probe_events
+
+
+def poll(gptfoot, *fixture_ids):
+    async def run():
+        return [await gptfoot.fetch_live_fixture(fixture_id, max_age=0) for fixture_id in fixture_ids]
+    return asyncio.run(run())
+
+
+def test_slim_mode_costs_one_call_per_poll_during_play(gptfoot, slim_calls):
+    calls, _ = slim_calls
+
+    first, second, third = poll(gptfoot, HOME_FIXTURE, HOME_FIXTURE, HOME_FIXTURE)
+
+    # Premier poll : payload complet directement, puis la sonde du match seule
+    assert calls == [("full", HOME_FIXTURE), ("probe", HOME_FIXTURE), ("probe", HOME_FIXTURE)]
+    # Statut et score repris du payload complet
+    assert (third.status, third.elapsed, third.score()) == ("1H", 30, first.score())
+    assert gptfoot.live_snapshot_revision(HOME_FIXTURE) == 1
+
+
+def test_a_goal_seen_by_the_probe_fetches_the_full_payload(gptfoot, slim_calls):
+    calls, probe_events = slim_calls
+    poll(gptfoot, HOME_FIXTURE)
+
+    probe_events["events"] = (gptfoot.MatchEvent("Goal", "Normal Goal", 31, None, 1, "Test FC", 9, "Buteur"),)
+    [snapshot] = poll(gptfoot, HOME_FIXTURE)
+
+    assert calls == [("full", HOME_FIXTURE), ("probe", HOME_FIXTURE), ("full", HOME_FIXTURE)]
+    assert snapshot.score() == {"home": 1, "away": 0}
+
+
+def test_full_payload_is_used_when_the_status_may_change(gptfoot, slim_calls):
+    calls, probe_events = slim_calls
+    # Fin de 1re mi-temps : la mi-temps peut être sifflée à tout moment
+    probe_events["elapsed"] = 45
+    poll(gptfoot, HOME_FIXTURE, HOME_FIXTURE)
+
+    assert calls == [("full", HOME_FIXTURE), ("full", HOME_FIXTURE)]
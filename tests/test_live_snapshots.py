@@ -0,0 +1,50 @@
+"""Révision des réponses live (court-circuit des réponses inchangées dans check_events)."""
+import pytest
+
+FIXTURE_ID = 42
+
+
+@pytest.fixture
+def snapshots(gptfoot, monkeypatch):
+    monkeypatch.setattr(gptfoot, "_live_snapshots", {})
+    return gptfoot._live_snapshots
+
+
+@pytest.fixture
+def snapshot(gptfoot):
+    goal = gptfoot.MatchEvent("Goal", "Normal Goal", 12, None, 1, "Test FC", 9, "Buteur")
+
+    def make(full, events=(goal,), elapsed=30):
+        statistics = [("Shots on Goal", 3, 1)] if full else None
+        player_statistics = {9: [{"games": {"rating": "7.1"}}]} if full else None
+        return gptfoot.MatchSnapshot(FIXTURE_ID, "1H", elapsed, 1, "Test FC", 2, "Adversaire", 1, 0, None, None,
+                                     tuple(events), statistics, player_statistics)
+    return make
+
+
+def store(gptfoot, snapshot, full, changed=True):
+    gptfoot._store_live_snapshot(FIXTURE_ID, snapshot, changed, 0.0, full=full, fetched_by=FIXTURE_ID)
+    return gptfoot.live_snapshot_revision(FIXTURE_ID)
+
+
+def test_switching_between_slim_and_full_keeps_the_revision(gptfoot, snapshots, snapshot):
+    first = store(gptfoot, snapshot(full=True), full=True)
+
+    # Sonde légère (nouvelle empreinte, donc "changed") puis retour au payload complet : même contenu live
+    assert store(gptfoot, snapshot(full=False), full=False) == first
+    assert store(gptfoot, snapshot(full=True), full=True) == first
+    # Sonde inchangée mais dernière réponse stockée issue du payload complet
+    assert store(gptfoot, snapshot(full=False), full=False, changed=False) == first
+
+
+def test_live_changes_bump_the_revision_across_payloads(gptfoot, snapshots, snapshot):
+    first = store(gptfoot, snapshot(full=True), full=True)
+
+    assert store(gptfoot, snapshot(full=False, elapsed=31), full=False) == first + 1
+    assert store(gptfoot, snapshot(full=True, events=()), full=True) == first + 2
+
+
+def test_unchanged_body_keeps_the_revision(gptfoot, snapshots, snapshot):
+    first = store(gptfoot, snapshot(full=False), full=False)
+
+    assert store(gptfoot, snapshot(full=False, elapsed=31), full=False, changed=False) == first
@@ -0,0 +1,159 @@
+"""Ordonnanceur des appels IA (LLMScheduler) : priorités, emplacement réservé au direct, annulations et rythme."""
+import asyncio
+import time
+
+import pytest
+
+LIVE, TRANSLATION, DIGEST = 0, 2, 3
+
+
+def blocking_fetch(started, name):
+    """fetch() qui note son démarrage puis attend qu'on le libère."""
+    release = asyncio.Event()
+
+    async def fetch():
+        started.append(name)
+        await release.wait()
+        return name
+
+    return fetch, release
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_waiting_calls_are_served_by_priority_then_arrival(gptfoot):
+    async def scenario():
+        scheduler = gptfoot.LLMScheduler(2, 0)
+        started = []
+        holder, release_holder = blocking_fetch(started, "holder")
+        holding = asyncio.create_task(scheduler.run("translation", "model", 0, holder))
+        await settle()
+
+        calls = [("digest", "digest"), ("translation", "translation"), ("compo", "compo 1"), ("endmatch", "compo 2")]
+        tasks = []
+        for kind, name in calls:
+            async def fetch(name=name):
+                started.append(name)
+            tasks.append(asyncio.create_task(scheduler.run(kind, "model", 0, fetch)))
+        await settle()
+        # Un seul emplacement hors direct, déjà occupé : tout le monde attend
+        assert started == ["holder"]
+        assert len(scheduler.waiting) == 4
+
+        release_holder.set()
+        await asyncio.gather(holding, *tasks)
+        return started
+
+    assert asyncio.run(scenario()) == ["holder", "compo 1", "compo 2", "translation", "digest"]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, 4])
+def test_live_events_always_find_a_free_slot(gptfoot, max_concurrency):
+    async def scenario():
+        scheduler = gptfoot.LLMScheduler(max_concurrency, 0)
+        started = []
+        releases = []
+        tasks = []
+        for index in range(6):
+            fetch, release = blocking_fetch(started, f"translation {index}")
+            releases.append(release)
+            tasks.append(asyncio.create_task(scheduler.run("translation", "model", 0, fetch)))
+        await settle()
+        background_running = len(started)
+
+        goal, release_goal = blocking_fetch(started, "goal")
+        releases.append(release_goal)
+        tasks.append(asyncio.create_task(scheduler.run("goal", "model", 0, goal)))
+        await settle()
+        goal_started = "goal" in started
+
+        for release in releases:
+            release.set()
+        await asyncio.gather(*tasks)
+        return scheduler, background_running, goal_started
+
+    scheduler, background_running, goal_started = asyncio.run(scenario())
+
+    assert scheduler.max_concurrency == max(2, max_concurrency)
+    assert background_running == scheduler.max_concurrency - 1
+    assert goal_started
+    assert scheduler.running == scheduler.running_background == 0
+
+
+def test_cancelled_waiter_is_skipped(gptfoot):
+    async def scenario():
+        scheduler = gptfoot.LLMScheduler(2, 0)
+        await scheduler._acquire(TRANSLATION)
+        waiter = asyncio.create_task(scheduler._acquire(DIGEST))
+        await settle()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        scheduler._release(TRANSLATION)
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert scheduler.waiting == []
+    assert scheduler.running == scheduler.running_background == 0
+
+
+def test_slot_granted_to_a_cancelled_caller_is_given_back(gptfoot):
+    async def scenario():
+        scheduler = gptfoot.LLMScheduler(2, 0)
+        await scheduler._acquire(TRANSLATION)
+        waiter = asyncio.create_task(scheduler._acquire(DIGEST))
+        await settle()
+        # L'emplacement est attribué au waiter, qui est annulé avant d'avoir repris la main
+        scheduler._release(TRANSLATION)
+        assert scheduler.running_background == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert scheduler.running == scheduler.running_background == 0
+
+
+def test_pace_holds_background_calls_over_the_token_budget(gptfoot):
+    async def scenario():
+        scheduler = gptfoot.LLMScheduler(2, 100)
+        scheduler.token_log["model"] = [(time.monotonic(), 80)]
+        paced = asyncio.create_task(scheduler._pace("model", 30, TRANSLATION))
+        await asyncio.sleep(0.05)
+        held = not paced.done()
+        paced.cancel()
+        # Les événements en direct sont comptés mais jamais retenus
+        await asyncio.wait_for(scheduler._pace("model", 30, LIVE), timeout=1)
+        return scheduler, held
+
+    scheduler, held = asyncio.run(scenario())
+
+    assert held
+    assert [count for _, count in scheduler.token_log["model"]] == [80, 30]
+
+
+def test_pace_forgets_tokens_older_than_a_minute(gptfoot):
+    async def scenario():
+        scheduler = gptfoot.LLMScheduler(2, 100)
+        scheduler.token_log["model"] = [(time.monotonic() - 61, 100)]
+        await asyncio.wait_for(scheduler._pace("model", 90, DIGEST), timeout=1)
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert [count for _, count in scheduler.token_log["model"]] == [90]
+
+
+def test_pace_is_disabled_without_a_budget(gptfoot):
+    scheduler = gptfoot.LLMScheduler(2, 0)
+
+    asyncio.run(asyncio.wait_for(scheduler._pace("model", 10_000, DIGEST), timeout=1))
+
+    assert scheduler.token_log == {}
@@ -0,0 +1,90 @@
+"""Envoi des messages par langue : chaque groupe de chats part dès que sa variante est prête."""
+import asyncio
+
+import pytest
+
+FRENCH_CHAT, DUTCH_CHAT = 1, 2
+
+
+class FakeTelegramBot:
+    def __init__(self):
+        self.sent = []
+        self.edited = []
+
+    async def send_message(self, chat_id, text, parse_mode=None):
+        self.sent.append((chat_id, text))
+        return type("Message", (), {"message_id": len(self.sent)})()
+
+    async def edit_message_text(self, text, chat_id, message_id, parse_mode=None):
+        self.edited.append((chat_id, text))
+
+
+@pytest.fixture
+def telegram(gptfoot, monkeypatch):
+    bot = FakeTelegramBot()
+    chats = {FRENCH_CHAT: "french", DUTCH_CHAT: "dutch"}
+    # Le bot Telegram n'est créé que dans main()
+    monkeypatch.setattr(gptfoot, "bot", bot, raising=False)
+    monkeypatch.setattr(gptfoot, "USE_TELEGRAM", True)
+    monkeypatch.setattr(gptfoot, "USE_DISCORD", False)
+    monkeypatch.setattr(gptfoot, "load_subscribers_for_send", lambda path, file_name: dict(chats))
+    return bot
+
+
+@pytest.fixture
+def slow_translation(gptfoot, monkeypatch):
+    """Traduction bloquée jusqu'à release.set()."""
+    release = asyncio.Event()
+
+    async def translate_message(message, language, source_language="french"):
+        await release.wait()
+        return f"[{language}] {message}"
+
+    monkeypatch.setattr(gptfoot, "translate_message", translate_message)
+    return release
+
+
+async def wait_until(condition, timeout=3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition jamais remplie"
+        await asyncio.sleep(0.01)
+
+
+def test_a_translated_language_does_not_delay_the_others(gptfoot, telegram, slow_translation):
+    async def scenario():
+        sending = asyncio.create_task(gptfoot.send_message_to_all_chats(lambda language: gptfoot.t("match_start", language)))
+        # Le chat français reçoit son message pendant que la traduction néerlandaise est en cours
+        await wait_until(lambda: telegram.sent)
+        assert telegram.sent == [(FRENCH_CHAT, gptfoot.t("match_start", "french"))]
+        assert not sending.done()
+
+        slow_translation.set()
+        return await sending
+
+    sent_messages = asyncio.run(scenario())
+
+    assert telegram.sent[1] == (DUTCH_CHAT, "[dutch] " + gptfoot.t("match_start", "french"))
+    assert {(sent.chat_id, sent.language) for sent in sent_messages} == {(FRENCH_CHAT, "french"), (DUTCH_CHAT, "dutch")}
+
+
+def test_neutral_text_is_sent_to_every_language_without_translation(gptfoot, telegram, slow_translation):
+    sent_messages = asyncio.run(gptfoot.send_message_to_all_chats("⚽️ 12' - Joueur (Test FC)", source_language=None))
+
+    assert sorted(telegram.sent) == [(FRENCH_CHAT, "⚽️ 12' - Joueur (Test FC)"), (DUTCH_CHAT, "⚽️ 12' - Joueur (Test FC)")]
+    assert len(sent_messages) == 2
+
+
+def test_each_language_is_completed_when_its_own_addition_is_ready(gptfoot, telegram, slow_translation):
+    async def scenario():
+        sent_messages = await gptfoot.send_message_to_all_chats("⚽️ 12'", source_language=None)
+        appending = asyncio.create_task(gptfoot.append_to_sent_messages(sent_messages, lambda language: gptfoot.t("goal_commentary", language) + "Commentaire"))
+        await wait_until(lambda: telegram.edited)
+        assert [chat_id for chat_id, _ in telegram.edited] == [FRENCH_CHAT]
+
+        slow_translation.set()
+        await appending
+
+    asyncio.run(scenario())
+
+    assert [chat_id for chat_id, _ in telegram.edited] == [FRENCH_CHAT, DUTCH_CHAT]
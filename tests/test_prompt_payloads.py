@@ -0,0 +1,138 @@
+"""Budgets de tokens des données variables des prompts (sérialiseurs et fit_prompt_payload)."""
+import asyncio
+
+import pytest
+
+# Statistiques joueur telles que renvoyées par api-football (/fixtures/players)
+PLAYER_STATISTICS = [{
+    "games": {"minutes": 67, "number": 9, "position": "F", "rating": "7.8", "captain": False, "substitute": False},
+    "offsides": 1,
+    "shots": {"total": 4, "on": 2},
+    "goals": {"total": 1, "conceded": 0, "assists": None, "saves": None},
+    "passes": {"total": 23, "key": 2, "accuracy": "81"},
+    "tackles": {"total": None, "blocks": None, "interceptions": 1},
+    "duels": {"total": 11, "won": 6},
+    "dribbles": {"attempts": 3, "success": 2, "past": None},
+    "fouls": {"drawn": 2, "committed": 1},
+    "cards": {"yellow": 0, "red": 0},
+    "penalty": {"won": None, "commited": None, "scored": 0, "missed": 0, "saved": None},
+}]
+
+POSITIONS = ["G", "D", "D", "D", "D", "M", "M", "M", "F", "F", "F"]
+
+
+def lineup(prefix):
+    return {
+        "formation": "4-3-3",
+        "startXI": [
+            {"player": {"id": 1000 + number, "name": f"{prefix} Alexandre-Maximilien Bartholomew-{number}",
+                        "number": number, "pos": position, "grid": f"{number}:1"}}
+            for number, position in enumerate(POSITIONS, start=1)
+        ],
+        "substitutes": [],
+        "coach": {"id": 1, "name": "Entraîneur", "photo": "https://media.api-sports.io/football/coachs/1.png"},
+    }
+
+
+COMPO_MATCH = {
+    "teams": {"home": {"id": 1, "name": "Test FC"}, "away": {"id": 2, "name": "Olympique Adversaire"}},
+    "lineups": {"Test FC": lineup("Domicile"), "Olympique Adversaire": lineup("Extérieur")},
+}
+
+
+@pytest.fixture
+def goal_event(gptfoot):
+    return gptfoot.MatchEvent("Goal", "Normal Goal", 67, 2, 1, "Test FC", 9, "Jean-Baptiste Exemple-Longnom",
+                              assist_name="Paul Passeur", comments="Frappe enroulée du gauche")
+
+
+@pytest.fixture
+def captured_prompts(gptfoot, monkeypatch):
+    """Remplace les appels IA et renvoie les données variables envoyées au modèle."""
+    captured = []
+
+    async def fake_call(data, *args, **kwargs):
+        captured.append(data["messages"][-1]["content"])
+        return "commentaire"
+
+    def capture_variable_context(system_prompt, stable_context, variable_context):
+        captured.append(variable_context)
+        return [{"role": "system", "content": system_prompt}, {"role": "user", "content": variable_context}]
+
+    monkeypatch.setattr(gptfoot, "call_chatgpt_api", fake_call)
+    monkeypatch.setattr(gptfoot, "collect_chatgpt_stream", fake_call)
+    monkeypatch.setattr(gptfoot, "build_prompt_messages", capture_variable_context)
+    return captured
+
+
+def test_player_statistics_are_compact(gptfoot):
+    line = gptfoot.serialize_player_statistics(PLAYER_STATISTICS)
+
+    assert line.startswith("poste F, note 7.8, buts 1")
+    # Valeurs nulles et temps de jeu omis
+    assert "passes décisives" not in line and "pénaltys" not in line and "67" not in line
+    assert gptfoot.estimate_tokens(line) * 4 < gptfoot.estimate_tokens(repr(PLAYER_STATISTICS))
+    assert gptfoot.serialize_player_statistics(PLAYER_STATISTICS[0]) == line
+    assert gptfoot.serialize_player_statistics([]) == ""
+
+
+def test_goal_prompt_fits_its_budget(gptfoot, captured_prompts, goal_event):
+    asyncio.run(gptfoot.call_chatgpt_api_goalmatch(goal_event, PLAYER_STATISTICS, "67+2", "Test FC 2 - 1 Olympique Adversaire"))
+
+    assert gptfoot.estimate_tokens(captured_prompts[0]) <= gptfoot.PROMPT_PAYLOAD_BUDGETS["goal"]
+    assert "Jean-Baptiste Exemple-Longnom" in captured_prompts[0]
+    assert not captured_prompts[0].endswith(gptfoot.CLIP_MARKER)
+
+
+def test_shootout_prompt_fits_its_budget(gptfoot, captured_prompts, goal_event):
+    asyncio.run(gptfoot.call_chatgpt_api_shootout_goal_match(goal_event, PLAYER_STATISTICS))
+
+    assert gptfoot.estimate_tokens(captured_prompts[0]) <= gptfoot.PROMPT_PAYLOAD_BUDGETS["shootout"]
+
+
+def test_red_card_prompt_fits_its_budget(gptfoot, captured_prompts):
+    event = gptfoot.MatchEvent("Card", "Red Card", 81, None, 2, "Olympique Adversaire", 4, "Défenseur Très-Rugueux",
+                               comments="Tacle par derrière")
+    asyncio.run(gptfoot.call_chatgpt_api_redmatch(event))
+
+    assert gptfoot.estimate_tokens(captured_prompts[0]) <= gptfoot.PROMPT_PAYLOAD_BUDGETS["red_card"]
+
+
+def test_compo_prompt_fits_its_budget(gptfoot, captured_prompts):
+    predictions = {"winner": {"name": "Test FC", "comment": "Win or draw"}}
+    asyncio.run(gptfoot.call_chatgpt_api_compomatch(COMPO_MATCH, predictions))
+
+    payload = captured_prompts[0]
+    assert gptfoot.estimate_tokens(payload) <= gptfoot.PROMPT_PAYLOAD_BUDGETS["compo"]
+    # Les 22 titulaires sont présents, sans les ids, grilles ni URLs de l'API
+    assert payload.count("Bartholomew-") == 22
+    assert "https://" not in payload and "grid" not in payload
+
+
+def test_fit_prompt_payload_keeps_payloads_within_budget(gptfoot):
+    payload = "Buteur : Joueur (Test FC)\nMinute du but : 12"
+
+    assert gptfoot.fit_prompt_payload("goal", payload) == payload
+
+
+@pytest.mark.parametrize("kind", ["goal", "shootout", "red_card", "compo"])
+def test_fit_prompt_payload_clips_oversized_payloads(gptfoot, kind):
+    budget = gptfoot.PROMPT_PAYLOAD_BUDGETS[kind]
+    payload = " ".join(f"Phrase numéro {index} du commentaire." for index in range(budget))
+
+    clipped = gptfoot.fit_prompt_payload(kind, payload)
+
+    assert gptfoot.estimate_tokens(clipped) <= budget
+    assert clipped.endswith(gptfoot.CLIP_MARKER)
+    kept = clipped[:-len(gptfoot.CLIP_MARKER)]
+    # Coupé sur une fin de phrase, et la partie gardée est un préfixe du texte d'origine
+    assert payload.startswith(kept)
+    assert kept.endswith(".")
+    assert len(kept) > budget * 4 // 2
+
+
+def test_clip_without_sentence_end_cuts_at_the_budget(gptfoot):
+    clipped = gptfoot.clip_to_token_budget("x" * 1000, 50)
+
+    assert gptfoot.estimate_tokens(clipped) <= 50
+    assert clipped == "x" * (50 * 4 - len(gptfoot.CLIP_MARKER)) + gptfoot.CLIP_MARKER
@@ -0,0 +1,63 @@
+"""Calendrier de la saison des équipes suivies (TEAM_IDS / TEAM_NAMES)."""
+import asyncio
+
+import pytest
+
+TEAMS = [("85", "PSG"), ("541", "Real Madrid")]
+
+
+def test_followed_teams_default_to_team_id(gptfoot):
+    assert gptfoot.parse_followed_teams("", "", "1", "Test FC") == [("1", "Test FC")]
+
+
+def test_followed_teams_pair_ids_and_names(gptfoot):
+    assert gptfoot.parse_followed_teams(" 85, 541 ,", "PSG, Real Madrid", "1", "Test FC") == TEAMS
+    # Nom manquant : l'ID est affiché à la place
+    assert gptfoot.parse_followed_teams("85,541", "PSG", "1", "Test FC") == [("85", "PSG"), ("541", "541")]
+
+
+def fixture(fixture_id, league_id, home, away, date="2030-05-01T20:00:00+00:00"):
+    return {
+        "fixture": {"id": fixture_id, "date": date, "status": {"short": "NS"}, "venue": {"name": "Stade", "city": "Ville"}},
+        "league": {"id": league_id, "name": "Ligue", "round": "J1"},
+        "teams": {"home": {"name": home}, "away": {"name": away}},
+    }
+
+
+@pytest.fixture
+def schedule(gptfoot, monkeypatch, tmp_path):
+    seasons = {
+        "85": [fixture(1, 1, "PSG", "Lyon"), fixture(3, 1, "PSG", "Real Madrid"), fixture(9, 999, "PSG", "Amical")],
+        "541": [fixture(2, 1, "Real Madrid", "Getafe"), fixture(3, 1, "PSG", "Real Madrid")],
+    }
+    requested = []
+
+    async def fetch_team_season(team_id):
+        requested.append(team_id)
+        return seasons[team_id]
+
+    monkeypatch.setattr(gptfoot, "FOLLOWED_TEAMS", TEAMS)
+    monkeypatch.setattr(gptfoot, "LEAGUE_IDS", [1])
+    monkeypatch.setattr(gptfoot.FixtureSchedule, "_fetch_team_season", staticmethod(fetch_team_season))
+    schedule = gptfoot.FixtureSchedule(str(tmp_path / "fixture_schedule.json"))
+    schedule.requested = requested
+    return schedule
+
+
+def test_schedule_covers_every_followed_team(gptfoot, schedule):
+    asyncio.run(schedule.refresh())
+
+    assert sorted(schedule.requested) == ["541", "85"]
+    teams = {int(fixture_id): (entry["team_id"], entry["team_name"]) for fixture_id, entry in schedule.fixtures.items()}
+    # Ligue non surveillée exclue ; le match entre deux équipes suivies n'est suivi qu'une fois
+    assert teams == {1: ("85", "PSG"), 2: ("541", "Real Madrid"), 3: ("85", "PSG")}
+    assert schedule.matches_config() and not schedule.needs_refresh()
+
+
+def test_schedule_is_reloaded_when_the_team_list_changes(gptfoot, schedule, monkeypatch):
+    asyncio.run(schedule.refresh())
+    reloaded = gptfoot.FixtureSchedule(schedule.path)
+    assert not reloaded.needs_refresh()
+
+    monkeypatch.setattr(gptfoot, "FOLLOWED_TEAMS", TEAMS[:1])
+    assert reloaded.needs_refresh()
@@ -0,0 +1,24 @@
+"""Choix de la langue d'un chat à l'enregistrement (/start <langue>, !register <langue>)."""
+
+
+def test_missing_argument_keeps_the_default_language(gptfoot):
+    assert gptfoot.parse_language_argument(None) == (None, False)
+    assert gptfoot.parse_language_argument("   ") == (None, False)
+
+
+def test_catalogue_and_translated_languages_are_accepted(gptfoot):
+    assert gptfoot.parse_language_argument(" German ") == ("german", False)
+    assert gptfoot.parse_language_argument("dutch") == ("dutch", False)
+    assert gptfoot.parse_language_argument(gptfoot.LANGUAGE.upper()) == (gptfoot.LANGUAGE.lower(), False)
+
+
+def test_unknown_languages_are_rejected(gptfoot):
+    # Une langue inconnue ferait traduire chaque message envoyé à ce chat
+    for argument in ("banana", "klingon", "@everyone", "german please"):
+        assert gptfoot.parse_language_argument(argument) == (None, True)
+
+
+def test_rejection_lists_the_available_languages(gptfoot):
+    reply = gptfoot.t("language_rejected", "english", languages=", ".join(gptfoot.supported_languages()))
+
+    assert "german" in reply and "dutch" in reply and "banana" not in reply